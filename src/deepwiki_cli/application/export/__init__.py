@@ -3,8 +3,9 @@
 from deepwiki_cli.application.export.export import (
     generate_json_export,
     generate_markdown_export,
+    write_json_export,
 )
 
-__all__ = ["generate_json_export", "generate_markdown_export"]
+__all__ = ["generate_json_export", "generate_markdown_export", "write_json_export"]
 
 
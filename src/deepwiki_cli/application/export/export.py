@@ -5,8 +5,10 @@ This module contains functions for exporting wiki content to various formats.
 
 import json
 from datetime import datetime
+from typing import BinaryIO
 
 from deepwiki_cli.domain.models import WikiPage
+from deepwiki_cli.infrastructure.formats.json_compact import to_json_bytes
 
 
 def generate_markdown_export(repo_url: str, pages: list[WikiPage]) -> str:
@@ -70,6 +72,18 @@ def generate_markdown_export(repo_url: str, pages: list[WikiPage]) -> str:
     return markdown
 
 
+def _build_json_export_data(repo_url: str, pages: list[WikiPage]) -> dict:
+    # Create a dictionary with metadata and pages
+    return {
+        "metadata": {
+            "repository": repo_url,
+            "generated_at": datetime.now().isoformat(),
+            "page_count": len(pages),
+        },
+        "pages": [page.model_dump() for page in pages],
+    }
+
+
 def generate_json_export(repo_url: str, pages: list[WikiPage]) -> str:
     """Generate JSON export of wiki pages.
 
@@ -80,20 +94,29 @@ def generate_json_export(repo_url: str, pages: list[WikiPage]) -> str:
     Returns:
         JSON content as string
     """
-    # Create a dictionary with metadata and pages
-    export_data = {
-        "metadata": {
-            "repository": repo_url,
-            "generated_at": datetime.now().isoformat(),
-            "page_count": len(pages),
-        },
-        "pages": [page.model_dump() for page in pages],
-    }
-
     # Convert to JSON string with pretty formatting
-    return json.dumps(export_data, indent=2)
+    return json.dumps(_build_json_export_data(repo_url, pages), indent=2)
+
+
+def write_json_export(repo_url: str, pages: list[WikiPage], output: BinaryIO) -> int:
+    """Write JSON export of wiki pages to a binary stream.
+
+    The payload is encoded straight to UTF-8 bytes, so large wikis are not
+    held in memory both as a string and as its encoded copy.
+
+    Args:
+        repo_url: The repository URL
+        pages: List of wiki pages
+        output: Binary stream to write to
+
+    Returns:
+        Number of bytes written
+    """
+    return output.write(
+        to_json_bytes(_build_json_export_data(repo_url, pages), indent=True),
+    )
 
 
-__all__ = ["generate_json_export", "generate_markdown_export"]
+__all__ = ["generate_json_export", "generate_markdown_export", "write_json_export"]
 
 
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
 import time
 from pathlib import Path
@@ -15,6 +14,7 @@ from deepwiki_cli.domain.models import (
     WikiCacheData,
     WikiStructureModel,
 )
+from deepwiki_cli.infrastructure.formats.json_compact import read_json_file
 
 if TYPE_CHECKING:
     pass
@@ -30,6 +30,11 @@ class ChangeSummary(TypedDict):
 
 logger = logging.getLogger(__name__)
 
+# Hashes are only reused for files last modified at least this many seconds
+# before the previous snapshot, so an edit landing within the same coarse
+# mtime tick as the earlier hash is never missed
+REUSE_HASH_MIN_AGE = 2.0
+
 
 def _hash_file(path: str | Path, chunk_size: int = 65536) -> str | None:
     """Compute a sha256 hash for a file, handling errors gracefully."""
@@ -47,8 +52,43 @@ def _hash_file(path: str | Path, chunk_size: int = 65536) -> str | None:
         return None
 
 
-def build_snapshot_from_local(repo_path: str, files: list[str]) -> RepoSnapshot:
-    """Create a repository snapshot from local files."""
+def _reusable_hash(
+    previous: RepoSnapshot | None,
+    rel_path: str,
+    size: int,
+    modified_at: float,
+) -> str | None:
+    """Return the previous hash of a file whose size and mtime are unchanged."""
+    if previous is None or previous.source != "local":
+        return None
+    previous_file = previous.files.get(rel_path)
+    if (
+        previous_file is None
+        or previous_file.size != size
+        or previous_file.modified_at != modified_at
+        or modified_at > previous.captured_at - REUSE_HASH_MIN_AGE
+    ):
+        return None
+    return previous_file.hash
+
+
+def build_snapshot_from_local(
+    repo_path: str,
+    files: list[str],
+    previous: RepoSnapshot | None = None,
+) -> RepoSnapshot:
+    """Create a repository snapshot from local files.
+
+    Args:
+        repo_path: Repository root the snapshot paths are relative to.
+        files: Absolute paths of the files to include.
+        previous: Snapshot from the last wiki build. Files whose size and
+            modification time still match it keep their recorded hash
+            instead of being read again, like git's index stat check.
+
+    Returns:
+        Snapshot with size, modification time and sha256 of every file.
+    """
     snapshot_files: dict[str, RepoSnapshotFile] = {}
     repo_path_obj = Path(repo_path)
     
@@ -65,11 +105,17 @@ def build_snapshot_from_local(repo_path: str, files: list[str]) -> RepoSnapshot:
             logger.debug(f"Unable to stat {absolute_path}: {exc}")
             continue
 
+        file_hash = _reusable_hash(
+            previous,
+            rel_path,
+            stats.st_size,
+            stats.st_mtime,
+        )
         snapshot_files[rel_path] = RepoSnapshotFile(
             path=rel_path,
             size=stats.st_size,
             modified_at=stats.st_mtime,
-            hash=_hash_file(path_obj),
+            hash=file_hash or _hash_file(path_obj),
         )
 
     return RepoSnapshot(
@@ -111,9 +157,7 @@ def load_existing_cache(cache_file: Path) -> WikiCacheData | None:
         return None
 
     try:
-        with cache_file.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-        return WikiCacheData(**data)
+        return WikiCacheData(**read_json_file(cache_file))
     except Exception as exc:
         logger.warning(f"Failed to load cache from {cache_file}: {exc}")
         return None
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import atexit
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -10,7 +12,17 @@ from pydantic import BaseModel
 from deepwiki_cli.services.rag import RAG
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
+
+# Retriever preparation runs on a single module-level worker so callers can
+# keep assembling prompts while embeddings load. Sharing one executor avoids
+# spawning a thread per context when several wikis are prepared in a session.
+_PREPARE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix="deepwiki-rag-prepare",
+)
+# Preparations still queued at exit are cancelled instead of started
+atexit.register(_PREPARE_EXECUTOR.shutdown, wait=False, cancel_futures=True)
 
 
 @dataclass
@@ -21,7 +33,7 @@ class WikiGenerationContext:
     repo_type: str
     provider: str
     model: str
-    _rag: RAG = field(repr=False)
+    _rag_future: Future[RAG] = field(repr=False)
     token: str | None = None
     excluded_dirs: list[str] | None = None
     excluded_files: list[str] | None = None
@@ -44,23 +56,37 @@ class WikiGenerationContext:
         additional_context: str | None = None,
         force_rebuild_embeddings: bool = False,
     ) -> WikiGenerationContext:
-        """Build and prime a context for repeated completions.
+        """Build a context and start priming its retriever in the background.
+
+        The RAG component is constructed eagerly so configuration errors
+        surface immediately, while ``prepare_retriever`` (embedding and index
+        build) runs on a background worker. The first call that needs the
+        retriever blocks until preparation finishes.
 
         Args:
             force_rebuild_embeddings: If True, discard any cached embedding database
                 and rebuild it before generating content.
         """
         rag = RAG(provider=provider, model=model)
-        rag.prepare_retriever(
-            repo_url,
-            repo_type,
-            token,
-            excluded_dirs,
-            excluded_files,
-            included_dirs,
-            included_files,
-            force_rebuild=force_rebuild_embeddings,
-        )
+
+        def _prepare_retriever() -> RAG:
+            rag.prepare_retriever(
+                repo_url,
+                repo_type,
+                token,
+                excluded_dirs,
+                excluded_files,
+                included_dirs,
+                included_files,
+                force_rebuild=force_rebuild_embeddings,
+            )
+            from deepwiki_cli.application.wiki.generate_content import (
+                clear_retrieval_cache,
+            )
+
+            clear_retrieval_cache(repo_url)
+            return rag
+
         return cls(
             repo_url=repo_url,
             repo_type=repo_type,
@@ -72,17 +98,39 @@ class WikiGenerationContext:
             included_dirs=list(included_dirs) if included_dirs else None,
             included_files=list(included_files) if included_files else None,
             additional_context=additional_context,
-            _rag=rag,
+            _rag_future=_PREPARE_EXECUTOR.submit(_prepare_retriever),
         )
 
+    @property
+    def _rag(self) -> RAG:
+        """Return the prepared RAG instance, blocking until it is ready."""
+        return self._rag_future.result()
+
+    def wait_until_ready(self) -> None:
+        """Block until the retriever is prepared.
+
+        Raises:
+            Exception: Any error raised while preparing the retriever.
+        """
+        self._rag_future.result()
+
     def stream_completion(
         self,
         messages: list[dict[str, str]],
         *,
         structured_schema: type[BaseModel] | None = None,
         file_path: str | None = None,
+        skip_token_check: bool = False,
+        validate_response: Callable[[str], bool] | None = None,
     ) -> Generator[str]:
-        """Yield completion chunks using the cached retriever."""
+        """Yield completion chunks using the cached retriever.
+
+        Args:
+            skip_token_check: Skip the request size check for prompts whose
+                size the caller already bounds.
+            validate_response: Check that the complete response parses;
+                only accepted responses are cached.
+        """
         from deepwiki_cli.application.wiki.generate_content import generate_wiki_content
 
         return generate_wiki_content(
@@ -100,9 +148,9 @@ class WikiGenerationContext:
             additional_context=self.additional_context,
             file_path=file_path,
             prepared_rag=self._rag,
+            skip_token_check=skip_token_check,
+            validate_response=validate_response,
         )
 
 
 __all__ = ["WikiGenerationContext"]
-
-
@@ -5,43 +5,69 @@ for wiki structure and page content generation. It uses RAG (Retrieval-Augmented
 to provide context-aware content generation.
 """
 
+from __future__ import annotations
+
 import asyncio
+import functools
+import hashlib
+import itertools
 import logging
 import os
+import re
+import threading
 import time
-from collections.abc import AsyncGenerator, Generator
-from typing import Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from operator import itemgetter
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, cast
 
 import google.generativeai as genai
 from adalflow.core.types import ModelType
+from adalflow.utils import get_adalflow_default_root_path
 from google.api_core import exceptions as google_exceptions
 from langfuse import observe
-from pydantic import BaseModel
 
 from deepwiki_cli.infrastructure.clients.ai.cursor_agent_client import CursorAgentClient
 from deepwiki_cli.infrastructure.clients.ai.openai_client import OpenAIClient
 from deepwiki_cli.infrastructure.clients.ai.openrouter_client import OpenRouterClient
 from deepwiki_cli.infrastructure.config import (
+    get_embedder_type,
     get_model_config,
 )
+from deepwiki_cli.infrastructure.formats.json_compact import (
+    from_compact_json,
+    to_compact_json,
+)
 from deepwiki_cli.infrastructure.observability import (
     get_langfuse_client,
     is_langfuse_enabled,
 )
 from deepwiki_cli.infrastructure.prompts import SIMPLE_CHAT_SYSTEM_PROMPT
 from deepwiki_cli.services.data_pipeline import count_tokens, get_file_content
-from deepwiki_cli.services.rag import RAG
+from deepwiki_cli.services.rag import RAG, compact_chunk_text
+from deepwiki_cli.services.rag_cache import ProximityCache
+from deepwiki_cli.services.rate_limit import get_rate_limiter
+from deepwiki_cli.shared.env import is_truthy
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable, Generator, Mapping
 
+    from pydantic import BaseModel
 
-def _is_truthy(value: str | None) -> bool:
-    if value is None:
-        return False
-    return value.lower() in {"1", "true", "yes", "on"}
+try:
+    import uvloop  # type: ignore[import-not-found]
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
 
 
-OPENAI_STREAMING_ENABLED = _is_truthy(os.environ.get("OPENAI_STREAMING_ENABLED"))
+OPENAI_STREAMING_ENABLED = is_truthy(os.environ.get("OPENAI_STREAMING_ENABLED"))
 
 
 def _read_int_env(var_name: str, default: int) -> int:
@@ -78,11 +104,448 @@ def _read_float_env(var_name: str, default: float) -> float:
 
 GOOGLE_STREAM_MAX_RETRIES = _read_int_env("DEEPWIKI_GOOGLE_STREAM_RETRIES", 3)
 GOOGLE_STREAM_RETRY_DELAY = _read_float_env("DEEPWIKI_GOOGLE_STREAM_RETRY_DELAY", 3.0)
+STREAM_BATCH_SIZE = _read_int_env("DEEPWIKI_STREAM_BATCH_SIZE", 50)
+STREAM_FLUSH_MS = _read_float_env("DEEPWIKI_STREAM_FLUSH_MS", 25.0)
+STREAM_BATCH_CHARS = _read_int_env("DEEPWIKI_STREAM_BATCH_CHARS", 8192)
 
+RETRIEVAL_CACHE_TTL = _read_float_env("DEEPWIKI_RETRIEVAL_CACHE_TTL", 300.0)
+_RETRIEVAL_CACHE_SIZE = 512
+
+
+@dataclass(frozen=True, slots=True)
+class _RetrievedContext:
+    """The parts of a RAG answer the prompt needs.
+
+    Only ``(file_path, text)`` pairs and the serialized context are kept, so
+    cached entries hold no Document objects or embedding vectors.
+    """
+
+    documents: tuple[tuple[str, str], ...]
+    context_json: str | None = None
+
+    @classmethod
+    def from_rag_output(cls, output: Any) -> _RetrievedContext:
+        return cls(
+            documents=tuple(
+                (
+                    doc.meta_data.get("file_path", "unknown"),
+                    compact_chunk_text(doc.text),
+                )
+                for doc in output.documents
+            ),
+            context_json=getattr(output, "context_json", None),
+        )
+
+
+@functools.lru_cache(maxsize=128)
+def _render_context_markdown(documents: tuple[tuple[str, str], ...]) -> str:
+    """Render retrieved ``(file_path, text)`` pairs as markdown sections.
+
+    Output is one flat list of fragments joined once, with a header per file
+    and a separator between files. Documents are grouped by a stable sort on
+    the path so the same documents always render to the same bytes, which
+    keeps provider-side prompt caching effective. Memoized so reused
+    retrievals are not re-joined.
+    """
+    separator = "\n\n" + "-" * 10 + "\n\n"
+    fragments: list[str] = []
+    for doc_file_path, group in itertools.groupby(
+        sorted(documents, key=itemgetter(0)),
+        key=itemgetter(0),
+    ):
+        if fragments:
+            fragments.append(separator)
+        fragments.append(f"## File Path: {doc_file_path}")
+        for _, text in group:
+            fragments.append("\n\n")
+            fragments.append(text)
+    return "".join(fragments)
+
+
+# Identifies the index a retrieval ran against: provider, query embedder and
+# the include/exclude filters the retriever was prepared with
+_RetrievalScope = tuple[object, ...]
+
+_RETRIEVAL_CACHE: OrderedDict[
+    tuple[str, _RetrievalScope, str],
+    tuple[float, _RetrievedContext],
+] = OrderedDict()
+_retrieval_cache_lock = threading.Lock()
+
+
+def _retrieval_scope(
+    rag: Any,
+    provider: str,
+    *,
+    excluded_dirs: list[str] | None,
+    excluded_files: list[str] | None,
+    included_dirs: list[str] | None,
+    included_files: list[str] | None,
+) -> _RetrievalScope:
+    """Return the part of a retrieval cache key that identifies the index.
+
+    The same query against a differently filtered index or another embedder
+    returns different documents, so these are part of the key. Filters are
+    sorted because their order does not change the index.
+    """
+    embedder = getattr(rag, "query_embedder", None)
+    return (
+        provider,
+        getattr(embedder, "namespace", None) or get_embedder_type(),
+        *(
+            tuple(sorted(patterns or ()))
+            for patterns in (
+                excluded_dirs,
+                excluded_files,
+                included_dirs,
+                included_files,
+            )
+        ),
+    )
+
+
+def _get_cached_retrieval(
+    repo_url: str,
+    scope: _RetrievalScope,
+    rag_query: str,
+) -> _RetrievedContext | None:
+    """Return a fresh cached retrieval result for ``rag_query`` in ``scope``."""
+    key = (repo_url, scope, rag_query)
+    with _retrieval_cache_lock:
+        entry = _RETRIEVAL_CACHE.get(key)
+        if entry is None:
+            return None
+        stored_at, retrieval = entry
+        if time.monotonic() - stored_at > RETRIEVAL_CACHE_TTL:
+            del _RETRIEVAL_CACHE[key]
+            return None
+        _RETRIEVAL_CACHE.move_to_end(key)
+        return retrieval
+
+
+def _store_retrieval(
+    repo_url: str,
+    scope: _RetrievalScope,
+    rag_query: str,
+    retrieval: _RetrievedContext,
+) -> None:
+    if RETRIEVAL_CACHE_TTL <= 0:
+        return
+    key = (repo_url, scope, rag_query)
+    with _retrieval_cache_lock:
+        _RETRIEVAL_CACHE[key] = (time.monotonic(), retrieval)
+        _RETRIEVAL_CACHE.move_to_end(key)
+        if len(_RETRIEVAL_CACHE) > _RETRIEVAL_CACHE_SIZE:
+            _RETRIEVAL_CACHE.popitem(last=False)
+
+
+def clear_retrieval_cache(repo_url: str | None = None) -> None:
+    """Drop cached retrieval results, optionally only those for ``repo_url``.
+
+    Called whenever a retriever is (re)prepared so a rebuilt index never
+    serves results from the previous one.
+    """
+    with _retrieval_cache_lock:
+        if repo_url is None:
+            _RETRIEVAL_CACHE.clear()
+            return
+        for key in [key for key in _RETRIEVAL_CACHE if key[0] == repo_url]:
+            del _RETRIEVAL_CACHE[key]
+
+
+FILE_CONTENT_CACHE_TTL = _read_float_env("DEEPWIKI_FILE_CONTENT_CACHE_TTL", 0.0)
+_FILE_CONTENT_CACHE_SIZE = 256
+_file_content_cache: OrderedDict[tuple[str, ...], tuple[float, str]] = OrderedDict()
+_file_content_cache_lock = threading.Lock()
+
+
+def _get_file_content_cached(
+    repo_url: str,
+    file_path: str,
+    repo_type: str | None,
+    token: str | None,
+) -> str:
+    """``get_file_content`` with an opt-in, short-lived in-memory cache.
+
+    Several pages usually reference the same file, so when
+    ``DEEPWIKI_FILE_CONTENT_CACHE_TTL`` is positive, repeated fetches within
+    that many seconds are served from memory. The key cannot tell whether the
+    file changed in the meantime, so the cache is off by default. The access
+    token is part of the key only as a digest so it is never stored.
+    """
+    if FILE_CONTENT_CACHE_TTL <= 0:
+        return get_file_content(repo_url, file_path, repo_type, token)
+    token_digest = hashlib.sha256(token.encode()).hexdigest() if token else ""
+    key = (repo_url, file_path, repo_type or "", token_digest)
+    with _file_content_cache_lock:
+        entry = _file_content_cache.get(key)
+        if entry is not None:
+            stored_at, content = entry
+            if time.monotonic() - stored_at <= FILE_CONTENT_CACHE_TTL:
+                _file_content_cache.move_to_end(key)
+                return content
+            del _file_content_cache[key]
+
+    content = get_file_content(repo_url, file_path, repo_type, token)
+    with _file_content_cache_lock:
+        _file_content_cache[key] = (time.monotonic(), content)
+        _file_content_cache.move_to_end(key)
+        if len(_file_content_cache) > _FILE_CONTENT_CACHE_SIZE:
+            _file_content_cache.popitem(last=False)
+    return content
+
+
+RESPONSE_CACHE_ENABLED = is_truthy(os.environ.get("DEEPWIKI_RESPONSE_CACHE"))
+# Responses are also persisted under the adalflow root so identical prompts
+# are skipped across runs; entries older than the TTL (seconds) are ignored
+RESPONSE_CACHE_TTL = _read_float_env("DEEPWIKI_RESPONSE_CACHE_TTL", 7 * 24 * 3600.0)
+_RESPONSE_CACHE_SIZE = 256
+_response_cache: OrderedDict[str, str] = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def set_response_cache_enabled(enabled: bool) -> None:
+    """Override ``DEEPWIKI_RESPONSE_CACHE`` for the rest of the process."""
+    global RESPONSE_CACHE_ENABLED  # noqa: PLW0603
+    RESPONSE_CACHE_ENABLED = enabled
+
+
+def _response_cache_path(key: str) -> Path:
+    return (
+        Path(get_adalflow_default_root_path())
+        / "llm_responses"
+        / key[:2]
+        / f"{key}.json"
+    )
+
+
+def _response_cache_key(
+    provider: str,
+    model: str,
+    structured_schema: type[BaseModel] | None,
+    prompt: str,
+) -> str:
+    schema_name = structured_schema.__name__ if structured_schema else ""
+    return hashlib.sha256(
+        f"{provider}|{model}|{schema_name}|{prompt}".encode(),
+    ).hexdigest()
+
+
+def _get_cached_response(key: str) -> str | None:
+    with _response_cache_lock:
+        response = _response_cache.get(key)
+        if response is not None:
+            _response_cache.move_to_end(key)
+            return response
+
+    response = _load_persisted_response(key) if RESPONSE_CACHE_TTL > 0 else None
+    if response is not None:
+        _remember_response(key, response)
+    return response
+
+
+def _load_persisted_response(key: str) -> str | None:
+    try:
+        entry = from_compact_json(
+            _response_cache_path(key).read_text(encoding="utf-8"),
+        )
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable response cache entry %s: %s", key, exc)
+        return None
+    if time.time() - entry.get("created_at", 0.0) > RESPONSE_CACHE_TTL:
+        return None
+    response = entry.get("response")
+    return response if isinstance(response, str) else None
 
-def _extract_completion_text(completion: Any) -> str | None:
-    from typing import cast
 
+def _remember_response(key: str, response: str) -> None:
+    with _response_cache_lock:
+        _response_cache[key] = response
+        _response_cache.move_to_end(key)
+        if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+
+def _store_response(key: str, response: str) -> None:
+    _remember_response(key, response)
+    if RESPONSE_CACHE_TTL <= 0:
+        return
+    path = _response_cache_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent pages never read a
+        # partially written entry
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp_path.write_text(
+            to_compact_json({"created_at": time.time(), "response": response}),
+            encoding="utf-8",
+        )
+        tmp_path.replace(path)
+    except OSError as exc:
+        logger.warning("Could not persist response cache entry %s: %s", key, exc)
+
+
+def _discard_response(key: str) -> None:
+    """Drop a cached response that failed validation, including on disk."""
+    with _response_cache_lock:
+        _response_cache.pop(key, None)
+    try:
+        _response_cache_path(key).unlink(missing_ok=True)
+    except OSError as exc:
+        logger.warning("Could not remove response cache entry %s: %s", key, exc)
+
+
+def get_cached_completion(
+    provider: str,
+    model: str,
+    structured_schema: type[BaseModel] | None,
+    prompt: str,
+) -> str | None:
+    """Return the cached response to an identical request, if caching is on.
+
+    Lets callers that bypass :func:`generate_wiki_content` (e.g. native
+    structured-output calls) share the response cache.
+    """
+    if not RESPONSE_CACHE_ENABLED:
+        return None
+    return _get_cached_response(
+        _response_cache_key(provider, model, structured_schema, prompt),
+    )
+
+
+def discard_cached_completion(
+    provider: str,
+    model: str,
+    structured_schema: type[BaseModel] | None,
+    prompt: str,
+) -> None:
+    """Remove a cached response that the caller could not parse."""
+    if RESPONSE_CACHE_ENABLED:
+        _discard_response(
+            _response_cache_key(provider, model, structured_schema, prompt),
+        )
+
+
+def cache_completion(
+    provider: str,
+    model: str,
+    structured_schema: type[BaseModel] | None,
+    prompt: str,
+    response: str,
+) -> None:
+    """Store a response for :func:`get_cached_completion`, if caching is on."""
+    if RESPONSE_CACHE_ENABLED:
+        _store_response(
+            _response_cache_key(provider, model, structured_schema, prompt),
+            response,
+        )
+
+
+SEMANTIC_RESPONSE_CACHE_ENABLED = is_truthy(
+    os.environ.get("DEEPWIKI_SEMANTIC_RESPONSE_CACHE"),
+)
+SEMANTIC_RESPONSE_CACHE_SIMILARITY = _read_float_env(
+    "DEEPWIKI_SEMANTIC_CACHE_SIMILARITY",
+    0.95,
+)
+_semantic_response_caches: dict[tuple[str, ...], ProximityCache] = {}
+_semantic_response_caches_lock = threading.Lock()
+
+
+def _semantic_cache_applies(
+    query: str,
+    structured_schema: type[BaseModel] | None,
+) -> bool:
+    """Return whether ``query`` may be answered from the semantic cache.
+
+    Structured prompts such as wiki pages are a large fixed template with a
+    few page-specific inputs, so prompts for different pages embed within
+    the threshold of each other. Only free-form queries are matched.
+    """
+    return SEMANTIC_RESPONSE_CACHE_ENABLED and bool(query) and structured_schema is None
+
+
+def _semantic_response_cache(scope: tuple[str, ...]) -> ProximityCache:
+    """Return the query-embedding keyed response cache for ``scope``.
+
+    Responses are only matched within the same provider, model, schema,
+    repository, file and additional context, so a paraphrased query never
+    picks up an answer generated for different inputs.
+    """
+    with _semantic_response_caches_lock:
+        cache = _semantic_response_caches.get(scope)
+        if cache is None:
+            cache = ProximityCache(
+                capacity=_RESPONSE_CACHE_SIZE,
+                threshold=1.0 - SEMANTIC_RESPONSE_CACHE_SIMILARITY,
+            )
+            _semantic_response_caches[scope] = cache
+        return cache
+
+
+MAX_REQUEST_TOKENS = 8000
+# Upper bound on characters per token for real-world text; inputs longer than
+# MAX_REQUEST_TOKENS times this ratio are over the limit without tokenizing.
+MAX_CHARS_PER_TOKEN = _read_float_env("DEEPWIKI_MAX_CHARS_PER_TOKEN", 6.0)
+_TOKEN_COUNT_CACHE_SIZE = 4096
+_token_count_cache: OrderedDict[tuple[str | None, bytes], int] = OrderedDict()
+_token_count_lock = threading.Lock()
+
+
+def _count_tokens_cached(text: str, embedder_type: str | None = None) -> int:
+    """Memoized ``count_tokens`` keyed by a digest of the text.
+
+    Keys hold a 16-byte blake2b digest rather than the text itself so large
+    prompts are not kept alive by the cache.
+    """
+    key = (embedder_type, hashlib.blake2b(text.encode(), digest_size=16).digest())
+    with _token_count_lock:
+        cached = _token_count_cache.get(key)
+        if cached is not None:
+            _token_count_cache.move_to_end(key)
+            return cached
+    tokens = count_tokens(text, embedder_type=embedder_type)
+    with _token_count_lock:
+        _token_count_cache[key] = tokens
+        if len(_token_count_cache) > _TOKEN_COUNT_CACHE_SIZE:
+            _token_count_cache.popitem(last=False)
+    return tokens
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_model_kwargs(provider: str, model: str | None) -> Mapping[str, Any]:
+    """Return the read-only ``model_kwargs`` for a (provider, model) pair.
+
+    Wiki builds call this once per page with the same pair, so the resolved
+    configuration is memoized. The mapping is read-only because it is shared
+    between calls.
+    """
+    return MappingProxyType(get_model_config(provider, model)["model_kwargs"])
+
+
+@functools.cache
+def _get_langfuse() -> Any | None:
+    """Return the Langfuse client, or None when tracing is off.
+
+    Resolved once per process so requests without tracing skip the client
+    and configuration lookups entirely.
+    """
+    return get_langfuse_client() if is_langfuse_enabled() else None
+
+
+@functools.lru_cache(maxsize=128)
+def _format_system_prompt(repo_type: str, repo_url: str, repo_name: str) -> str:
+    """Render ``SIMPLE_CHAT_SYSTEM_PROMPT`` for a repository (memoized)."""
+    return SIMPLE_CHAT_SYSTEM_PROMPT.format(
+        repo_type=repo_type,
+        repo_url=repo_url,
+        repo_name=repo_name,
+    )
+
+
+def _extract_completion_text(completion: Any) -> str | None:
     try:
         choices = getattr(completion, "choices", [])
         if choices:
@@ -99,61 +562,237 @@ def _extract_completion_text(completion: Any) -> str | None:
         return None
 
 
-def _async_to_sync_generator(
+_THINK_TAG_RE = re.compile(r"</?think>")
+
+
+def _strip_think_tags(text: str) -> str:
+    """Remove ``<think>``/``</think>`` tags that reasoning models emit.
+
+    Prompts ask for ``/no_think``, which leaves empty think tags in some
+    models' output. Most chunks contain no ``<`` at all and skip the regex.
+    """
+    return _THINK_TAG_RE.sub("", text) if "<" in text else text
+
+
+async def _batch_async_stream(
     async_gen: AsyncGenerator[str],
-) -> Generator[str]:
-    """Convert an async generator to a sync generator.
-    Uses a new event loop and runs the async generator in a background task.
+    max_batch: int = STREAM_BATCH_SIZE,
+    flush_ms: float = STREAM_FLUSH_MS,
+    max_chars: int = STREAM_BATCH_CHARS,
+) -> AsyncGenerator[str]:
+    """Coalesce small streamed chunks into larger strings.
+
+    Chunks are buffered and yielded joined once ``max_batch`` chunks or
+    ``max_chars`` characters have accumulated, or once the oldest buffered
+    chunk has waited ``flush_ms`` milliseconds. A ``max_batch`` of 1 or less
+    passes chunks through one by one. Stray ``<think>``/``</think>`` tags are
+    removed from everything yielded.
     """
-    import queue
-    import threading
+    if max_batch <= 1:
+        async for chunk in async_gen:
+            yield _strip_think_tags(chunk)
+        return
+
+    loop = asyncio.get_running_loop()
+    iterator = async_gen.__aiter__()
+    flush_timeout = max(flush_ms, 0.0) / 1000.0
+    buffer: list[str] = []
+    buffered_chars = 0
+    deadline = 0.0
+    pending: asyncio.Future[str] | None = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+            # Only wait indefinitely while there is nothing buffered to flush.
+            done, _ = await asyncio.wait(
+                {pending},
+                timeout=max(deadline - loop.time(), 0.0) if buffer else None,
+            )
+            if not done:
+                yield _strip_think_tags("".join(buffer))
+                buffer.clear()
+                buffered_chars = 0
+                continue
+            finished, pending = pending, None
+            try:
+                chunk = finished.result()
+            except StopAsyncIteration:
+                break
+            except Exception:
+                if buffer:
+                    yield _strip_think_tags("".join(buffer))
+                    buffer.clear()
+                raise
+            if not buffer:
+                deadline = loop.time() + flush_timeout
+            text = chunk if isinstance(chunk, str) else str(chunk)
+            buffer.append(text)
+            buffered_chars += len(text)
+            if (
+                len(buffer) >= max_batch
+                or buffered_chars >= max_chars
+                or loop.time() >= deadline
+            ):
+                yield _strip_think_tags("".join(buffer))
+                buffer.clear()
+                buffered_chars = 0
+        if buffer:
+            yield _strip_think_tags("".join(buffer))
+    finally:
+        if pending is not None:
+            pending.cancel()
+            await asyncio.gather(pending, return_exceptions=True)
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
 
-    q: queue.Queue[tuple[str, Any]] = queue.Queue()
-    exception = None
 
-    def run_async() -> None:
-        nonlocal exception
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
+_BRIDGE_LOOP: asyncio.AbstractEventLoop | None = None
+_BRIDGE_LOOP_LOCK = threading.Lock()
 
-            async def consume() -> None:
-                try:
-                    async for item in async_gen:
-                        q.put(("item", item))
-                except Exception as e:
-                    q.put(("error", e))
-                finally:
-                    q.put(("done", None))
 
-            loop.run_until_complete(consume())
-        except Exception as e:
-            exception = e
-            q.put(("error", e))
-        finally:
-            loop.close()
+def _get_bridge_loop() -> asyncio.AbstractEventLoop:
+    """Return the persistent event loop that drives async streams.
+
+    The loop is created on first use and runs forever in a daemon thread, so
+    sync callers hand coroutines to it instead of spinning up a new loop and
+    thread per generation. When ``uvloop`` is installed it backs the loop;
+    the global event loop policy is left untouched.
+    """
+    global _BRIDGE_LOOP  # noqa: PLW0603
+    with _BRIDGE_LOOP_LOCK:
+        if _BRIDGE_LOOP is None or _BRIDGE_LOOP.is_closed():
+            loop = (
+                uvloop.new_event_loop()
+                if UVLOOP_AVAILABLE
+                else asyncio.new_event_loop()
+            )
+            # Blocking work handed over with asyncio.to_thread (provider SDK
+            # calls, file fetches) shares one pre-sized pool.
+            loop.set_default_executor(
+                ThreadPoolExecutor(
+                    max_workers=os.cpu_count() or 4,
+                    thread_name_prefix="deepwiki-bridge-worker",
+                ),
+            )
+            threading.Thread(
+                target=loop.run_forever,
+                name="deepwiki-async-bridge",
+                daemon=True,
+            ).start()
+            _BRIDGE_LOOP = loop
+        return _BRIDGE_LOOP
+
+
+async def _stream_google_text(
+    google_model: genai.GenerativeModel,
+    prompt: str,
+) -> AsyncGenerator[str]:
+    """Stream text chunks from a Gemini model without blocking the event loop.
+
+    Uses the SDK's native ``generate_content_async``. Older SDKs without it
+    fall back to pulling each chunk of the sync stream in a worker thread.
+    """
+    generate_async = getattr(google_model, "generate_content_async", None)
+    if generate_async is not None:
+        response = await generate_async(prompt, stream=True)
+        async for chunk in response:
+            if hasattr(chunk, "text"):
+                yield chunk.text
+        return
+
+    response = await asyncio.to_thread(
+        google_model.generate_content,
+        prompt,
+        stream=True,
+    )
+    chunks = iter(response)
+    sentinel = object()
+    while (chunk := await asyncio.to_thread(next, chunks, sentinel)) is not sentinel:
+        if hasattr(chunk, "text"):
+            yield chunk.text
+
+
+@functools.lru_cache(maxsize=32)
+def _get_google_model(
+    model_name: str | None,
+    temperature: float | None,
+    top_p: float | None,
+    top_k: int | None,
+) -> genai.GenerativeModel:
+    """Return a shared ``GenerativeModel`` for one generation configuration.
+
+    Models hold no per-request state, and their async client is only ever
+    used from the bridge loop, so every page with the same settings can
+    share one instance.
+    """
+    return genai.GenerativeModel(
+        model_name=model_name,
+        generation_config={  # type: ignore[arg-type]
+            "temperature": temperature,
+            "top_p": top_p,
+            "top_k": top_k,
+        },
+    )
 
-    thread = threading.Thread(target=run_async, daemon=True)
-    thread.start()
 
-    while True:
-        try:
-            item = q.get(timeout=1.0)  # Increased timeout to 1 second
-            msg_type, value = item
-            if msg_type == "item":
-                yield value
-            elif msg_type == "error":
-                raise value
-            elif msg_type == "done":
-                break
-        except queue.Empty:
-            if not thread.is_alive():
-                if exception:
-                    raise exception
-                # Thread died without sending done signal - might be an issue
-                logger.warning("Async generator thread ended without completion signal")
-                break
-            continue
+_CLIENT_CACHE: dict[tuple[str, str | None], Any] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _get_model_client(
+    provider: str,
+    factory: Callable[[], Any],
+    model: str | None = None,
+) -> Any:
+    """Return a process-wide model client for ``provider`` (and ``model``).
+
+    Reusing clients keeps their HTTP connection pools, and so their
+    keep-alive sockets, warm across pages instead of paying a new TLS
+    handshake for every generation. All async calls run on the bridge loop,
+    so cached async clients always stay on the loop that created them.
+    """
+    key = (provider, model)
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = factory()
+            _CLIENT_CACHE[key] = client
+        return client
+
+
+def _async_to_sync_generator(
+    async_gen: AsyncGenerator[str],
+) -> Generator[str]:
+    """Convert an async generator to a sync generator.
+
+    Each ``__anext__`` is scheduled on the shared bridge loop and the caller
+    blocks on its future directly, so items are handed over without an
+    intermediate queue or polling timeout.
+    """
+    loop = _get_bridge_loop()
+    iterator = async_gen.__aiter__()
+    finished = False
+    try:
+        while True:
+            future = asyncio.run_coroutine_threadsafe(iterator.__anext__(), loop)
+            try:
+                item = future.result()
+            except StopAsyncIteration:
+                finished = True
+                return
+            yield item
+    finally:
+        if not finished:
+            # Caller stopped early or an error was raised: let the async
+            # generator run its cleanup on the loop that owns it.
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                try:
+                    asyncio.run_coroutine_threadsafe(aclose(), loop).result()
+                except Exception as exc:
+                    logger.debug(f"Failed to close async generator: {exc}")
 
 
 @observe(name="wiki-generation", capture_input=False)
@@ -172,6 +811,8 @@ def generate_wiki_content(
     additional_context: str | None = None,
     file_path: str | None = None,
     prepared_rag: RAG | None = None,
+    skip_token_check: bool = False,
+    validate_response: Callable[[str], bool] | None = None,
 ) -> Generator[str]:
     """Generate wiki content using RAG with streaming support.
 
@@ -194,29 +835,64 @@ def generate_wiki_content(
         additional_context: Optional additional text context to inject into the prompt
         file_path: Optional path to a file in the repository to include in the prompt
         prepared_rag: Optional pre-initialized RAG instance for reuse
+        skip_token_check: Skip tokenizing the request to decide whether it is
+            too large for retrieval. For callers that bound prompt size
+            themselves, such as per-page wiki generation.
+        validate_response: Optional check that the complete response can be
+            parsed by the caller. When response caching is enabled, only
+            responses it accepts are cached and cached responses it rejects
+            are not served.
 
     Yields:
         str: Text chunks as they arrive from the model
 
     Raises:
-        ValueError: If RAG preparation fails
+        ValueError: If the request is invalid, the provider is not configured
+            or RAG preparation fails
         Exception: For other errors during processing
     """
     # Initialize Langfuse client for inner spans if enabled
-    langfuse = get_langfuse_client() if is_langfuse_enabled() else None
+    langfuse = _get_langfuse()
+
+    # Validate request and normalize the last message once; it drives the
+    # size check below and becomes the query
+    if not messages:
+        raise ValueError("No messages provided")
+
+    last_message = messages[-1]
+    is_dict_message = isinstance(last_message, dict)
+    if is_dict_message and last_message.get("role") != "user":
+        raise ValueError("Last message must be from the user")
+
+    # Get the query from the last message
+    query = last_message.get("content", "") if is_dict_message else str(last_message)
+
+    # Resolve the model configuration up front so an unknown provider fails
+    # before any retrieval work
+    model_config = _cached_model_kwargs(provider, model)
 
     # Check if request contains very large input
     input_too_large = False
-    if messages and len(messages) > 0:
-        last_message = messages[-1]
-        if isinstance(last_message, dict) and last_message.get("content"):
+    if is_dict_message and query and not skip_token_check:
+        content_bytes = len(query.encode())
+        # Every token covers at least one byte, so short inputs cannot
+        # exceed the limit and skip the tokenizer entirely.
+        if content_bytes <= MAX_REQUEST_TOKENS:
+            logger.info(f"Request size: {content_bytes} bytes")
+        elif len(query) > MAX_REQUEST_TOKENS * MAX_CHARS_PER_TOKEN:
+            # Far too long to fit regardless of how it tokenizes
+            logger.warning(
+                f"Request exceeds recommended token limit ({len(query)} characters)",
+            )
+            input_too_large = True
+        else:
             # Map provider to embedder_type for token counting
             embedder_type = "lmstudio" if provider == "lmstudio" else None
-            tokens = count_tokens(last_message["content"], embedder_type=embedder_type)
+            tokens = _count_tokens_cached(query, embedder_type=embedder_type)
             logger.info(f"Request size: {tokens} tokens")
-            if tokens > 8000:
+            if tokens > MAX_REQUEST_TOKENS:
                 logger.warning(
-                    f"Request exceeds recommended token limit ({tokens} > 8000)",
+                    f"Request exceeds recommended token limit ({tokens} > {MAX_REQUEST_TOKENS})",
                 )
                 input_too_large = True
 
@@ -237,6 +913,7 @@ def generate_wiki_content(
                 included_dirs,
                 included_files,
             )
+            clear_retrieval_cache(repo_url)
             logger.info(f"Retriever prepared for {repo_url}")
         except ValueError as e:
             if "No valid documents with embeddings found" in str(e):
@@ -257,26 +934,54 @@ def generate_wiki_content(
             else:
                 raise ValueError(f"Error preparing retriever: {e!s}")
 
-    # Validate request
-    if not messages or len(messages) == 0:
-        raise ValueError("No messages provided")
-
-    last_message = messages[-1]
-    if isinstance(last_message, dict) and last_message.get("role") != "user":
-        raise ValueError("Last message must be from the user")
-
-    # Get the query from the last message
-    query = (
-        last_message.get("content", "")
-        if isinstance(last_message, dict)
-        else str(last_message)
+    # Near-duplicate free-form queries can be answered from the semantic
+    # response cache before any retrieval or provider call.
+    semantic_cache: ProximityCache | None = None
+    query_embedding: Any = None
+    if _semantic_cache_applies(query, structured_schema):
+        try:
+            query_embedding = request_rag.embed_query(query)
+        except Exception as e:
+            logger.debug(f"Skipping semantic response cache: {e!s}")
+        if query_embedding is not None:
+            semantic_cache = _semantic_response_cache(
+                (
+                    provider,
+                    model,
+                    structured_schema.__name__ if structured_schema else "",
+                    repo_url,
+                    file_path or "",
+                    additional_context or "",
+                ),
+            )
+            cached_response = semantic_cache.get(query_embedding)
+            if cached_response is not None and (
+                validate_response is None or validate_response(cached_response)
+            ):
+                logger.info("Serving response from semantic cache")
+                yield cached_response
+                return
+
+    # Fetch file content on the bridge loop's thread pool so it overlaps with
+    # RAG retrieval below instead of adding to the time before the LLM call.
+    file_content_future = (
+        asyncio.run_coroutine_threadsafe(
+            asyncio.to_thread(
+                _get_file_content_cached,
+                repo_url,
+                file_path,
+                repo_type,
+                token,
+            ),
+            _get_bridge_loop(),
+        )
+        if file_path
+        else None
     )
 
     # Only retrieve documents if input is not too large
     context_text = ""
     context_json_payload: str | None = None
-    retrieved_documents = None
-
     if not input_too_large:
         try:
             # If file_path exists, modify the query for RAG to focus on the file
@@ -312,20 +1017,44 @@ def generate_wiki_content(
                     rag_span = None
 
                 try:
-                    # This will use the actual RAG implementation
-                    retrieved_documents = request_rag(rag_query)
+                    # Pages touching the same file repeat the exact same query;
+                    # reuse recent results before running the RAG pipeline.
+                    retrieval_scope = _retrieval_scope(
+                        request_rag,
+                        provider,
+                        excluded_dirs=excluded_dirs,
+                        excluded_files=excluded_files,
+                        included_dirs=included_dirs,
+                        included_files=included_files,
+                    )
+                    retrieval = _get_cached_retrieval(
+                        repo_url,
+                        retrieval_scope,
+                        rag_query,
+                    )
+                    if retrieval is not None:
+                        logger.info("Reusing cached retrieval for query")
+                    else:
+                        # This will use the actual RAG implementation
+                        retrieved_documents = request_rag(rag_query)
+                        if retrieved_documents and retrieved_documents[0].documents:
+                            retrieval = _RetrievedContext.from_rag_output(
+                                retrieved_documents[0],
+                            )
+                            _store_retrieval(
+                                repo_url,
+                                retrieval_scope,
+                                rag_query,
+                                retrieval,
+                            )
 
                     rag_duration = time.time() - rag_start_time
 
-                    if retrieved_documents and retrieved_documents[0].documents:
+                    if retrieval is not None:
                         # Format context for the prompt in a more structured way
-                        documents = retrieved_documents[0].documents
+                        documents = retrieval.documents
                         logger.info(f"Retrieved {len(documents)} documents")
-                        context_json_payload = getattr(
-                            retrieved_documents[0],
-                            "context_json",
-                            None,
-                        )
+                        context_json_payload = retrieval.context_json
 
                         # Update RAG span with results (v3 API)
                         if rag_span:
@@ -344,27 +1073,10 @@ def generate_wiki_content(
                             except Exception as e:
                                 logger.debug(f"Failed to update RAG span: {e!s}")
 
-                        # Group documents by file path
-                        docs_by_file: dict[str, list[Any]] = {}
-                        for doc in documents:
-                            doc_file_path = doc.meta_data.get("file_path", "unknown")
-                            if doc_file_path not in docs_by_file:
-                                docs_by_file[doc_file_path] = []
-                            docs_by_file[doc_file_path].append(doc)
-
-                        # Format context text with file path grouping
-                        context_parts = []
-                        for doc_file_path, docs in docs_by_file.items():
-                            # Add file header with metadata
-                            header = f"## File Path: {doc_file_path}\n\n"
-                            # Add document content
-                            content = "\n\n".join([doc.text for doc in docs])
-
-                            context_parts.append(f"{header}{content}")
-
-                        # Join all parts with clear separation
-                        separator = "\n\n" + "-" * 10 + "\n\n"
-                        context_text = separator.join(context_parts)
+                        # The markdown rendering is only a fallback for
+                        # retrievals without a JSON context
+                        if not context_json_payload:
+                            context_text = _render_context_markdown(documents)
                     else:
                         logger.warning("No documents retrieved from RAG")
                         if rag_span:
@@ -393,50 +1105,76 @@ def generate_wiki_content(
     repo_name = repo_url.split("/")[-1] if "/" in repo_url else repo_url
 
     # Create system prompt for wiki generation
-    system_prompt = SIMPLE_CHAT_SYSTEM_PROMPT.format(
-        repo_type=repo_type,
-        repo_url=repo_url,
-        repo_name=repo_name,
-    )
+    system_prompt = _format_system_prompt(repo_type, repo_url, repo_name)
 
     # Fetch file content if provided
     file_content = ""
-    if file_path:
+    if file_content_future is not None:
         try:
-            file_content = get_file_content(repo_url, file_path, repo_type, token)
+            file_content = file_content_future.result()
             logger.info(f"Successfully retrieved content for file: {file_path}")
         except Exception as e:
             logger.exception(f"Error retrieving file content: {e!s}")
             # Continue without file content if there's an error
 
-    # Create the prompt with context
-    prompt = f"/no_think {system_prompt}\n\n"
-
-    # Check if file_path is provided and fetch file content if it exists
-    if file_content:
-        # Add file content to the prompt
-        prompt += f'<currentFileContent path="{file_path}">\n{file_content}\n</currentFileContent>\n\n'
+    # Create the prompt with context; parts are joined once at the end. The
+    # file content is kept as its own part so it is copied only by that join.
+    file_content_parts = (
+        (
+            f'<currentFileContent path="{file_path}">\n',
+            file_content,
+            "\n</currentFileContent>\n\n",
+        )
+        if file_content
+        else ()
+    )
+    prompt_parts = ["/no_think ", system_prompt, "\n\n"]
+    # The system prompt only depends on the repository, so it is the prefix
+    # every request shares; providers cache it and its token count is reused.
+    # File content is stable across queries about the same file, so it ends
+    # a second cacheable prefix.
+    prompt_prefix_length = sum(map(len, prompt_parts))
+    prompt_parts += file_content_parts
+    cache_breakpoints = (prompt_prefix_length, sum(map(len, prompt_parts)))
 
     if context_json_payload:
-        prompt += "RAG_CONTEXT_JSON:\n"
-        prompt += f"{context_json_payload}\n\n"
+        prompt_parts += ["RAG_CONTEXT_JSON:\n", context_json_payload, "\n\n"]
     elif context_text.strip():
-        prompt += "RAG_CONTEXT_MARKDOWN:\n"
-        prompt += f"{context_text}\n\n"
+        prompt_parts += ["RAG_CONTEXT_MARKDOWN:\n", context_text, "\n\n"]
     else:
         logger.info("No context available from RAG")
-        prompt += "RAG_CONTEXT_JSON: []\n\n"
+        prompt_parts.append("RAG_CONTEXT_JSON: []\n\n")
 
-    prompt += f"<query>\n{query}\n</query>\n\n"
+    prompt_parts += ["<query>\n", query, "\n</query>\n\n"]
 
     if additional_context:
-        prompt += (
-            f"<additional_context>\n{additional_context}\n</additional_context>\n\n"
-        )
-
-    prompt += "Assistant: "
-
-    model_config = get_model_config(provider, model)["model_kwargs"]
+        prompt_parts += [
+            "<additional_context>\n",
+            additional_context,
+            "\n</additional_context>\n\n",
+        ]
+
+    prompt_parts.append("Assistant: ")
+    prompt = "".join(prompt_parts)
+
+    # Identical prompts (same provider, model and schema) get the same answer
+    # from the response cache without calling the provider.
+    response_cache_key = (
+        _response_cache_key(provider, model, structured_schema, prompt)
+        if RESPONSE_CACHE_ENABLED
+        else None
+    )
+    if response_cache_key is not None:
+        cached_response = _get_cached_response(response_cache_key)
+        if cached_response is not None and (
+            validate_response is None or validate_response(cached_response)
+        ):
+            logger.info("Serving response from cache")
+            yield cached_response
+            return
+        if cached_response is not None:
+            logger.warning("Discarding cached response that failed validation")
+            _discard_response(response_cache_key)
 
     # Start generation span for Langfuse (v3 API)
     generation_start_time = time.time()
@@ -469,8 +1207,14 @@ def generate_wiki_content(
         except Exception as e:
             logger.debug(f"Failed to create generation span: {e!s}")
 
+    # Set when the stream yields an error message instead of model output,
+    # so such responses are never cached
+    stream_failed = False
+
     # Create async generator function for streaming/structured responses
     async def _async_stream() -> AsyncGenerator[str]:
+        nonlocal stream_failed
+
         async def _maybe_structured_completion(
             model_client: Any,
             model_kwargs: dict[str, Any],
@@ -496,18 +1240,35 @@ def generate_wiki_content(
                 )
                 return None
 
+        # Resolve generation parameters once for every provider branch
+        configured_model = model_config.get("model")
+        temperature = model_config.get("temperature")
+        top_p = model_config.get("top_p")
+        top_k = model_config.get("top_k")
+
+        # Wait for request/token budget before calling the provider instead of
+        # sending a burst of concurrent page requests into 429/503 responses
+        rate_limiter = get_rate_limiter(provider, model)
+        if rate_limiter is not None:
+            await rate_limiter.acquire(
+                _count_tokens_cached(prompt[:prompt_prefix_length])
+                + _count_tokens_cached(prompt[prompt_prefix_length:])
+                if rate_limiter.limits_tokens
+                else 0,
+            )
+
         try:
             if provider == "openrouter":
                 try:
                     logger.info(f"Using OpenRouter with model: {model}")
-                    model_client = OpenRouterClient()
+                    model_client = _get_model_client("openrouter", OpenRouterClient)
                     model_kwargs = {
                         "model": model,
                         "stream": True,
-                        "temperature": model_config["temperature"],
+                        "temperature": temperature,
                     }
-                    if "top_p" in model_config:
-                        model_kwargs["top_p"] = model_config["top_p"]
+                    if top_p is not None:
+                        model_kwargs["top_p"] = top_p
                     structured_payload = await _maybe_structured_completion(
                         model_client,
                         {**model_kwargs, "stream": False},
@@ -516,7 +1277,11 @@ def generate_wiki_content(
                         yield structured_payload
                         return
                     api_kwargs = model_client.convert_inputs_to_api_kwargs(
-                        input=prompt,
+                        input=OpenRouterClient.cacheable_prompt_messages(
+                            prompt,
+                            cache_breakpoints,
+                            model,
+                        ),
                         model_kwargs=model_kwargs,
                         model_type=ModelType.LLM,
                     )
@@ -529,19 +1294,20 @@ def generate_wiki_content(
                         yield chunk
                 except Exception as e_openrouter:
                     logger.exception(f"Error with OpenRouter API: {e_openrouter!s}")
+                    stream_failed = True
                     yield f"\nError with OpenRouter API: {e_openrouter!s}\n\nPlease check that you have set the OPENROUTER_API_KEY environment variable with a valid API key."
             elif provider == "openai":
                 try:
                     logger.info(f"Using Openai protocol with model: {model}")
-                    model_client = OpenAIClient()
+                    model_client = _get_model_client("openai", OpenAIClient)
                     stream_requested = OPENAI_STREAMING_ENABLED
                     model_kwargs = {
                         "model": model,
                         "stream": stream_requested,
-                        "temperature": model_config["temperature"],
+                        "temperature": temperature,
                     }
-                    if "top_p" in model_config:
-                        model_kwargs["top_p"] = model_config["top_p"]
+                    if top_p is not None:
+                        model_kwargs["top_p"] = top_p
                     structured_payload = await _maybe_structured_completion(
                         model_client,
                         {**model_kwargs, "stream": False},
@@ -561,13 +1327,14 @@ def generate_wiki_content(
                     )
                     if model_kwargs.get("stream", True):
                         async for chunk in response:
-                            choices = getattr(chunk, "choices", [])
-                            if len(choices) > 0:
-                                delta = getattr(choices[0], "delta", None)
-                                if delta is not None:
-                                    text = getattr(delta, "content", None)
-                                    if text is not None:
-                                        yield text
+                            # Fast path for the usual ChatCompletionChunk shape;
+                            # keep-alive and usage-only chunks fall through.
+                            try:
+                                text = chunk.choices[0].delta.content
+                            except (AttributeError, IndexError, TypeError):
+                                continue
+                            if text is not None:
+                                yield text
                     else:
                         completion_text = _extract_completion_text(response)
                         if completion_text:
@@ -625,17 +1392,23 @@ def generate_wiki_content(
                             logger.exception(
                                 f"Error with Openai API non-stream fallback: {fallback_error!s}",
                             )
+                            stream_failed = True
                             yield (
                                 f"\nError with Openai API fallback: {fallback_error!s}\n\n"
                                 "Please check that you have set the OPENAI_API_KEY environment variable with a valid API key."
                             )
                             return
                     logger.exception(f"Error with Openai API: {error_text}")
+                    stream_failed = True
                     yield f"\nError with Openai API: {error_text}\n\nPlease check that you have set the OPENAI_API_KEY environment variable with a valid API key."
             elif provider == "cursor":
                 try:
                     logger.info(f"Using Cursor Agent with model: {model}")
-                    model_client = CursorAgentClient(model=model)
+                    model_client = _get_model_client(
+                        "cursor",
+                        lambda: CursorAgentClient(model=model),
+                        model=model,
+                    )
                     model_kwargs = {
                         "model": model,
                     }
@@ -669,6 +1442,7 @@ def generate_wiki_content(
 
                 except Exception as e_cursor:
                     logger.exception(f"Error with Cursor Agent: {e_cursor!s}")
+                    stream_failed = True
                     yield f"\nError with Cursor Agent: {e_cursor!s}"
             else:
                 # Google Generative AI with retry for overloads
@@ -676,18 +1450,14 @@ def generate_wiki_content(
                 while attempt < GOOGLE_STREAM_MAX_RETRIES:
                     attempt += 1
                     try:
-                        google_model = genai.GenerativeModel(
-                            model_name=model_config["model"],
-                            generation_config={  # type: ignore[arg-type]
-                                "temperature": model_config["temperature"],
-                                "top_p": model_config["top_p"],
-                                "top_k": model_config["top_k"],
-                            },
+                        google_model = _get_google_model(
+                            configured_model,
+                            temperature,
+                            top_p,
+                            top_k,
                         )
-                        response = google_model.generate_content(prompt, stream=True)
-                        for chunk in response:
-                            if hasattr(chunk, "text"):
-                                yield chunk.text
+                        async for text in _stream_google_text(google_model, prompt):
+                            yield text
                         break
                     except google_exceptions.ServiceUnavailable as svc_error:
                         logger.warning(
@@ -696,12 +1466,21 @@ def generate_wiki_content(
                             GOOGLE_STREAM_MAX_RETRIES,
                             svc_error,
                         )
+                        if rate_limiter is not None:
+                            rate_limiter.penalize()
                         if attempt >= GOOGLE_STREAM_MAX_RETRIES:
                             raise
-                        await asyncio.sleep(GOOGLE_STREAM_RETRY_DELAY * attempt)
+                        backoff = asyncio.sleep(GOOGLE_STREAM_RETRY_DELAY * attempt)
+                        if rate_limiter is not None:
+                            # Wait for rate limit capacity during the backoff
+                            # instead of after it
+                            await asyncio.gather(backoff, rate_limiter.acquire())
+                        else:
+                            await backoff
 
         except Exception as e_outer:
             logger.exception(f"Error in streaming response: {e_outer!s}")
+            stream_failed = True
             error_message = str(e_outer)
 
             # Check for token limit errors
@@ -714,32 +1493,33 @@ def generate_wiki_content(
                 logger.warning("Token limit exceeded, retrying without context")
                 try:
                     # Create a simplified prompt without context
-                    simplified_prompt = f"/no_think {system_prompt}\n\n"
-
-                    # Include file content in the fallback prompt if it was retrieved
-                    if file_path and file_content:
-                        simplified_prompt += f'<currentFileContent path="{file_path}">\n{file_content}\n</currentFileContent>\n\n'
-
-                    simplified_prompt += "<note>Answering without retrieval augmentation due to input size constraints.</note>\n\n"
-                    simplified_prompt += f"<query>\n{query}\n</query>\n\nAssistant: "
+                    # (file content is kept in the fallback prompt if retrieved)
+                    simplified_prompt = "".join(
+                        [
+                            "/no_think ",
+                            system_prompt,
+                            "\n\n",
+                            *file_content_parts,
+                            "<note>Answering without retrieval augmentation due to input size constraints.</note>\n\n",
+                            "<query>\n",
+                            query,
+                            "\n</query>\n\nAssistant: ",
+                        ],
+                    )
 
                     # Handle fallback for each provider (simplified version)
                     if provider == "google":
-                        fallback_model = genai.GenerativeModel(
-                            model_name=model_config["model"],
-                            generation_config={  # type: ignore[arg-type]
-                                "temperature": model_config.get("temperature", 0.7),
-                                "top_p": model_config.get("top_p", 0.8),
-                                "top_k": model_config.get("top_k", 40),
-                            },
+                        fallback_model = _get_google_model(
+                            configured_model,
+                            0.7 if temperature is None else temperature,
+                            0.8 if top_p is None else top_p,
+                            40 if top_k is None else top_k,
                         )
-                        fallback_response = fallback_model.generate_content(
+                        async for text in _stream_google_text(
+                            fallback_model,
                             simplified_prompt,
-                            stream=True,
-                        )
-                        for chunk in fallback_response:
-                            if hasattr(chunk, "text"):
-                                yield chunk.text
+                        ):
+                            yield text
                     else:
                         yield "\nI apologize, but your request is too large for me to process. Please try a shorter query or break it into smaller parts."
                 except Exception as e2:
@@ -752,20 +1532,40 @@ def generate_wiki_content(
     # Convert async generator to sync generator
     # @observe will automatically capture the output from the generator
 
-    input_tokens = count_tokens(prompt, embedder_type=None)
-    output_tokens = 0
     collected_output = []
+    # Output tokens for the trace are counted per batch while streaming, so
+    # no tokenization pass over the whole response is left for the end
+    output_tokens = 0
+    usage_embedder_type = get_embedder_type() if generation_span else None
 
     try:
-        for chunk in _async_to_sync_generator(_async_stream()):
+        for chunk in _async_to_sync_generator(_batch_async_stream(_async_stream())):
             collected_output.append(chunk)
+            if usage_embedder_type is not None:
+                output_tokens += count_tokens(chunk, embedder_type=usage_embedder_type)
             yield chunk
 
+        caching = response_cache_key is not None or semantic_cache is not None
+        if caching and not stream_failed and collected_output:
+            full_response = "".join(collected_output)
+            # Callers retry unparseable answers with the same prompt, so only
+            # responses they can parse are cached
+            if validate_response is None or validate_response(full_response):
+                if response_cache_key is not None:
+                    _store_response(response_cache_key, full_response)
+                if semantic_cache is not None:
+                    semantic_cache.put(query_embedding, full_response)
+
         # Update generation span with usage details if possible
+        # Token usage is only needed for the trace, so the prompt is not
+        # tokenized at all when tracing is off
         if generation_span:
             try:
-                full_output = "".join(collected_output)
-                output_tokens = count_tokens(full_output, embedder_type=None)
+                # The prefix is shared by every query about the same
+                # repository, so it is counted and cached on its own
+                input_tokens = _count_tokens_cached(
+                    prompt[:prompt_prefix_length],
+                ) + _count_tokens_cached(prompt[prompt_prefix_length:])
 
                 generation_span.update(
                     usage_details={
@@ -1,5 +1,6 @@
 """Delete wiki command."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
@@ -7,9 +8,11 @@ import click
 from deepwiki_cli.cli.utils import (
     confirm_action,
     get_cache_path,
+    get_cached_wikis,
     select_multiple_from_list,
 )
-from deepwiki_cli.infrastructure.storage.cache import parse_cache_filename
+
+MAX_DELETE_WORKERS = 8
 
 
 def _get_cached_wikis() -> list[dict]:
@@ -18,49 +21,37 @@ def _get_cached_wikis() -> list[dict]:
     Returns:
         List of wiki dictionaries with metadata
     """
-    cache_dir = get_cache_path()
-
-    if not cache_dir.exists():
-        return []
-
-    # Find all cache files
-    cache_files = list(cache_dir.glob("deepwiki_cache_*.json"))
-    if not cache_files:
-        return []
-
-    # Parse cache files to display options
-    wikis = []
-    for i, cache_file in enumerate(cache_files, 1):
-        try:
-            meta = parse_cache_filename(cache_file)
-            if not meta:
-                continue
-
-            owner = meta["owner"]
-            repo = meta["repo"]
-            name = repo if owner == "local" else f"{owner}/{repo}"
-            display_name = f"{name} (v{meta['version']})"
-
-            wikis.append(
-                {
-                    "index": i,
-                    "name": name,
-                    "display_name": display_name,
-                    "owner": owner,
-                    "repo": repo,
-                    "repo_type": meta["repo_type"],
-                    "language": meta["language"],
-                    "version": meta["version"],
-                    "path": cache_file,
-                },
-            )
-        except (OSError, ValueError, KeyError):
-            continue
+    return get_cached_wikis(get_cache_path())
+
+
+def _try_unlink(cache_file: Path) -> OSError | None:
+    """Delete a cache file.
+
+    Args:
+        cache_file: Cache file to delete
+
+    Returns:
+        None on success, otherwise the error raised by the filesystem
+    """
+    try:
+        cache_file.unlink()
+    except OSError as exc:
+        return exc
+    return None
 
-    # Sort by name (repo), then by version (descending)
-    wikis.sort(key=lambda x: (x["name"], -int(str(x["version"]))))
 
-    return wikis
+def _display_label(wiki: dict) -> str:
+    """Build the menu label for a wiki.
+
+    Args:
+        wiki: Wiki dictionary from :func:`_get_cached_wikis`
+
+    Returns:
+        Display name followed by the repository type, if known
+    """
+    name = wiki.get("display_name") or wiki.get("name", "Unknown")
+    repo_type = wiki.get("repo_type", "")
+    return f"{name} ({repo_type})" if repo_type else f"{name}"
 
 
 def _confirm_deletion(selected_wikis: list[dict], *, yes: bool) -> bool:
@@ -106,15 +97,12 @@ def delete(yes: bool) -> None:
         click.echo("No cached wikis found.")
         return
 
-    # Format wiki display strings for multi-select
-    display_choices = []
-    for wiki in wikis:
-        name = wiki.get("display_name") or wiki.get("name", "Unknown")
-        repo_type = wiki.get("repo_type", "")
-        display_str = f"{name}"
-        if repo_type:
-            display_str += f" ({repo_type})"
-        display_choices.append(display_str)
+    # Format wiki display strings for multi-select; the first wiki with a
+    # given label wins, so selections map back to wikis in a single lookup
+    display_choices = [_display_label(wiki) for wiki in wikis]
+    label_to_wiki: dict[str, dict] = {}
+    for label, wiki in zip(display_choices, wikis, strict=True):
+        label_to_wiki.setdefault(label, wiki)
 
     # Select wikis using multi-select menu
     selected_labels = select_multiple_from_list(
@@ -127,18 +115,9 @@ def delete(yes: bool) -> None:
         return
 
     # Map selected labels back to wiki dictionaries
-    selected_wikis = []
-    for label in selected_labels:
-        # Find the wiki that matches this label
-        for wiki in wikis:
-            name = wiki.get("display_name") or wiki.get("name", "Unknown")
-            repo_type = wiki.get("repo_type", "")
-            display_str = f"{name}"
-            if repo_type:
-                display_str += f" ({repo_type})"
-            if display_str == label:
-                selected_wikis.append(wiki)
-                break
+    selected_wikis = [
+        label_to_wiki[label] for label in selected_labels if label in label_to_wiki
+    ]
 
     if not selected_wikis:
         click.echo("No valid wikis found. Deletion cancelled.")
@@ -149,26 +128,29 @@ def delete(yes: bool) -> None:
         click.echo("Deletion cancelled.")
         return
 
-    cache_path = get_cache_path()
     deleted_count = 0
     failed_count = 0
 
-    for wiki in selected_wikis:
-        cache_file = cache_path / wiki["path"].name
-        if not cache_file.exists():
-            click.echo(f"\n✗ Wiki cache not found: {wiki['display_name']}", err=True)
-            failed_count += 1
-            continue
+    # Unlink in parallel; errors are reported afterwards in selection order
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_DELETE_WORKERS, len(selected_wikis)),
+    ) as executor:
+        errors = list(
+            executor.map(_try_unlink, [wiki["path"] for wiki in selected_wikis]),
+        )
 
-        try:
-            Path(cache_file).unlink()
+    for wiki, error in zip(selected_wikis, errors, strict=True):
+        if error is None:
             deleted_count += 1
-        except OSError as exc:  # pragma: no cover - filesystem edge case
+            continue
+        if isinstance(error, FileNotFoundError):
+            click.echo(f"\n✗ Wiki cache not found: {wiki['display_name']}", err=True)
+        else:  # pragma: no cover - filesystem edge case
             click.echo(
-                f"\n✗ Failed to delete cache '{wiki['display_name']}': {exc}",
+                f"\n✗ Failed to delete cache '{wiki['display_name']}': {error}",
                 err=True,
             )
-            failed_count += 1
+        failed_count += 1
 
     if deleted_count > 0:
         click.echo(f"\n✓ Successfully deleted {deleted_count} wiki(s)")
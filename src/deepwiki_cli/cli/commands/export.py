@@ -9,19 +9,20 @@ from typing import Any, Literal
 
 import click
 
-from deepwiki_cli.application.export.export import generate_json_export
+from deepwiki_cli.application.export.export import write_json_export
 from deepwiki_cli.cli.completion import complete_wiki_names
 from deepwiki_cli.cli.config import load_config
 from deepwiki_cli.cli.utils import (
     confirm_action,
     get_cache_path,
+    get_cached_wikis,
     select_from_list,
     select_multiple_from_list,
     select_wiki_from_list,
     watch_manifest_cli,
 )
 from deepwiki_cli.domain.models import WikiPage, WikiStructureModel
-from deepwiki_cli.infrastructure.storage.cache import parse_cache_filename
+from deepwiki_cli.infrastructure.formats.json_compact import read_json_file
 from deepwiki_cli.infrastructure.storage.workspace import (
     ExportManifest,
     export_markdown_workspace,
@@ -186,32 +187,7 @@ def export(
 
 
 def _discover_cached_wikis(cache_dir: Path) -> list[dict]:
-    cache_files = list(cache_dir.glob("deepwiki_cache_*.json"))
-    wikis = []
-    for index, cache_file in enumerate(cache_files, start=1):
-        try:
-            meta = parse_cache_filename(cache_file)
-            if not meta:
-                continue
-            owner = meta.get("owner")
-            repo = meta["repo"]
-            name = repo if owner == "local" else f"{owner}/{repo}"
-            wikis.append(
-                {
-                    "index": index,
-                    "name": name,
-                    "display_name": f"{name} (v{meta['version']})",
-                    "owner": owner,
-                    "repo": repo,
-                    "repo_type": meta["repo_type"],
-                    "language": meta["language"],
-                    "version": meta["version"],
-                    "path": cache_file,
-                },
-            )
-        except (OSError, ValueError, KeyError):
-            continue
-    return wikis
+    return get_cached_wikis(cache_dir)
 
 
 def _select_wiki(wikis: list[dict], identifier: str | None) -> dict:
@@ -229,9 +205,7 @@ def _load_cache(cache_file: Path) -> dict[Any, Any]:
     from typing import cast
 
     try:
-        return cast(
-            "dict[Any, Any]", json.loads(cache_file.read_text(encoding="utf-8"))
-        )
+        return cast("dict[Any, Any]", read_json_file(cache_file))
     except (OSError, json.JSONDecodeError) as exc:
         raise click.ClickException(f"Failed to load cache {cache_file}: {exc}") from exc
 
@@ -258,23 +232,24 @@ def _filter_pages(
         return available
 
     if pages_arg:
-        tokens = {token.strip() for token in pages_arg.split(",") if token.strip()}
-        if not tokens or "all" in {token.lower() for token in tokens}:
+        # dict.fromkeys drops repeated tokens but keeps the order they were given
+        tokens = [
+            token
+            for token in dict.fromkeys(part.strip() for part in pages_arg.split(","))
+            if token
+        ]
+        if not tokens or any(token.lower() == "all" for token in tokens):
             return available
 
         id_lookup = {page.id: page for page in available}
-        title_lookup = {page.title.lower(): page for page in available}
-        selected: list[WikiPage] = []
+        title_lookup = {page.title.casefold(): page for page in available}
+        selected: dict[str, WikiPage] = {}
         for token in tokens:
-            if token in id_lookup:
-                selected.append(id_lookup[token])
-                continue
-            lowered = token.lower()
-            if lowered in title_lookup:
-                selected.append(title_lookup[lowered])
-                continue
-            raise click.BadParameter(f"Unknown page identifier '{token}'")
-        return selected
+            page = id_lookup.get(token) or title_lookup.get(token.casefold())
+            if page is None:
+                raise click.BadParameter(f"Unknown page identifier '{token}'")
+            selected.setdefault(page.id, page)
+        return list(selected.values())
 
     choices = [f"{page.title} [{page.id}]" for page in available]
     selection = select_multiple_from_list(
@@ -308,7 +283,6 @@ def _export_json(cache_data: dict, wiki_meta: dict, output: str | None) -> None:
         cache_data["generated_pages"],
     )
     repo_url = _resolve_repo_url(cache_data) or wiki_meta["name"]
-    payload = generate_json_export(repo_url, pages)
 
     if not output:
         timestamp = datetime.now(tz=UTC).strftime("%Y%m%d_%H%M%S")
@@ -318,9 +292,9 @@ def _export_json(cache_data: dict, wiki_meta: dict, output: str | None) -> None:
         output = f"{repo_slug}_wiki_{timestamp}.json"
 
     output_path = Path(output)
-    output_path.write_text(payload, encoding="utf-8")
+    with output_path.open("wb") as handle:
+        file_size = write_json_export(repo_url, pages, handle)
 
-    file_size = output_path.stat().st_size
     size_kb = file_size / KB_SIZE
     size_str = (
         f"{size_kb / KB_SIZE:.2f} MB" if size_kb > KB_SIZE else f"{size_kb:.2f} KB"
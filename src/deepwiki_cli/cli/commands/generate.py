@@ -1,13 +1,17 @@
 """Wiki generation command."""
 
+import functools
 import json
 import logging
 import os
+import random
 import sys
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from types import MappingProxyType
 from typing import Any, cast
 
 import click
@@ -71,6 +75,22 @@ try:
 except ValueError:
     WIKI_STRUCTURE_RETRY_DELAY = 2.0
 
+# Upper bound for the exponential backoff after provider errors
+WIKI_STRUCTURE_MAX_RETRY_DELAY = 30.0
+
+# Pages are generated one at a time unless DEEPWIKI_PAGE_CONCURRENCY asks
+# for more worker threads
+try:
+    PAGE_GENERATION_CONCURRENCY = max(
+        int(os.environ.get("DEEPWIKI_PAGE_CONCURRENCY", "1")),
+        1,
+    )
+except ValueError:
+    PAGE_GENERATION_CONCURRENCY = 1
+
+# Minimum seconds between streaming progress redraws for a single page
+PAGE_PROGRESS_INTERVAL = 0.1
+
 
 class WikiStructureParseError(ValueError):
     """Raised when the structured wiki response cannot be parsed."""
@@ -321,21 +341,23 @@ def _select_cache_entry(entries: list[CacheFileInfo]) -> CacheFileInfo:
     if len(entries) == 1:
         return entries[0]
 
-    options = [_format_cache_choice(entry) for entry in entries]
+    option_to_entry: dict[str, CacheFileInfo] = {}
+    for entry in entries:
+        option_to_entry.setdefault(_format_cache_choice(entry), entry)
+    options = list(option_to_entry)
     selection = select_from_list(
         "Select existing wiki version",
         options,
         default=options[0],
     )
-    selected_index = options.index(selection)
-    return entries[selected_index]
+    return option_to_entry[selection]
 
 
 def _display_change_summary(
     repo_name: str,
     cache_entry: CacheFileInfo,
     summary: dict[str, list[str]] | None,
-    wiki_structure: WikiStructureModel | None,
+    page_lookup: dict[str, WikiPage],
     affected_page_ids: list[str],
 ) -> None:
     click.echo(
@@ -357,21 +379,20 @@ def _display_change_summary(
     click.echo(f"  • {deleted_files} files deleted")
     click.echo(f"  • {unchanged} files unchanged")
 
-    if not affected_page_ids or not wiki_structure:
+    if not affected_page_ids or not page_lookup:
         click.echo(
             "Affected pages: none (you can still choose 'Update only affected pages' to pick pages manually)",
         )
         return
 
     changed_set = set(summary.get("changed_files", []))
-    page_lookup = {page.id: page for page in wiki_structure.pages}
 
     click.echo("Affected pages:")
     for page_id in affected_page_ids:
         page = page_lookup.get(page_id)
         if not page:
             continue
-        page_changes = len(set(page.filePaths) & changed_set)
+        page_changes = len(changed_set.intersection(page.filePaths))
         click.echo(f"  • {page.title} ({page_changes} files changed)")
 
 
@@ -414,11 +435,9 @@ def _prompt_generation_action(
 
 
 def _prompt_pages_to_regenerate(
-    wiki_structure: WikiStructureModel,
+    page_lookup: dict[str, WikiPage],
     affected_page_ids: list[str],
 ) -> list[str]:
-    page_lookup = {page.id: page for page in wiki_structure.pages}
-
     options = []
     mapping = {}
     for page_id in affected_page_ids:
@@ -445,7 +464,7 @@ def _prompt_pages_to_regenerate(
 
 def _collect_page_feedback(
     page_ids: list[str],
-    wiki_structure: WikiStructureModel,
+    page_lookup: dict[str, WikiPage],
 ) -> dict[str, str]:
     if not page_ids:
         return {}
@@ -457,7 +476,6 @@ def _collect_page_feedback(
         return {}
 
     feedback: dict[str, str] = {}
-    page_lookup = {page.id: page for page in wiki_structure.pages}
     for page_id in page_ids:
         page = page_lookup.get(page_id)
         if not page:
@@ -489,9 +507,10 @@ def generate_page_content_sync(
     page_title = page.title
 
     try:
-        # Add progress bar for this page
-        page_bar = progress_manager.add_page_progress(page_id, page_title)
-        page_bar.update(10)  # Starting
+        # Add progress bar for this page; updates go through the manager
+        # because pages may be generated on several threads at once
+        progress_manager.add_page_progress(page_id, page_title)
+        progress_manager.update_page_progress(page_id, 10)  # Starting
 
         # Import required modules
 
@@ -509,30 +528,42 @@ def generate_page_content_sync(
         if extra_feedback:
             prompt += "\nUser feedback and guidance:\n" + extra_feedback.strip() + "\n"
 
-        page_bar.update(30)  # Prompt ready
+        progress_manager.update_page_progress(page_id, 30)  # Prompt ready
 
         # Prepare request
         messages = [{"role": "user", "content": prompt}]
 
-        page_bar.update(50)  # Request sent
+        progress_manager.update_page_progress(page_id, 50)  # Request sent
 
-        # Collect streamed content with incremental progress updates
-        raw_response = ""
+        # Collect streamed content with incremental progress updates; chunks
+        # are joined once after the stream ends
+        response_chunks: list[str] = []
         chunk_count = 0
-        start_time = time.time()
-        last_update_time = start_time
+        start_time = time.monotonic()
+        last_update = start_time
         last_progress = 50
 
         try:
+            # Page prompts are a fixed template plus the page's file list,
+            # so the tokenizer-based size check is not needed.
             stream = generation_context.stream_completion(
                 messages=messages,
                 structured_schema=WikiPageSchema,
+                skip_token_check=True,
+                validate_response=_is_parseable_page,
             )
             for chunk in stream:
                 if chunk:
-                    raw_response += chunk if isinstance(chunk, str) else str(chunk)
+                    response_chunks.append(
+                        chunk if isinstance(chunk, str) else str(chunk),
+                    )
                 chunk_count += 1
-                current_time = time.time()
+                current_time = time.monotonic()
+                # Providers may emit a chunk per token; redraw at most
+                # every PAGE_PROGRESS_INTERVAL seconds
+                if current_time - last_update < PAGE_PROGRESS_INTERVAL:
+                    continue
+                last_update = current_time
                 elapsed = current_time - start_time
 
                 # Update progress smoothly based on time and content received
@@ -554,19 +585,14 @@ def generate_page_content_sync(
                     )
                     target_progress = min(target_progress, 90)
 
-                    # Update every 0.2 seconds or when we've made significant progress
-                    if (current_time - last_update_time >= 0.2) or (
-                        target_progress - last_progress >= 1
-                    ):
-                        progress_delta = int(target_progress - last_progress)
-                        if progress_delta > 0:
-                            page_bar.update(progress_delta)
-                            last_progress = page_bar.count
-                            last_update_time = current_time
+                    # Update whenever at least one more percent is reached
+                    if int(target_progress) > last_progress:
+                        last_progress = int(target_progress)
+                        progress_manager.update_page_progress(page_id, last_progress)
 
             # Ensure we're at 90% when content is fully received
-            if page_bar.count < 90:
-                page_bar.update(90 - page_bar.count)
+            progress_manager.update_page_progress(page_id, 90)
+            raw_response = "".join(response_chunks)
 
             try:
                 schema_response = _parse_wiki_page_json(raw_response)
@@ -593,10 +619,10 @@ def generate_page_content_sync(
             if schema_response.metadata.referenced_files:
                 page.filePaths = schema_response.metadata.referenced_files
 
-            page_bar.update(100)  # Complete
             progress_manager.complete_page(page_id)
         except Exception as e:
             logger.exception(f"Error generating page {page_title}: {e}")
+            progress_manager.complete_page(page_id)
             return None
 
         if not page.content:
@@ -611,20 +637,74 @@ def generate_page_content_sync(
         return None
 
 
+def generate_pages_sync(
+    pages: list[WikiPage],
+    generation_context: WikiGenerationContext,
+    repo_url: str,
+    progress_manager: ProgressManager,
+    page_feedback: dict[str, str] | None = None,
+) -> list[WikiPage]:
+    """Generate content for several pages, overlapping their model calls.
+
+    Up to ``PAGE_GENERATION_CONCURRENCY`` pages (one by default) are
+    generated at once on worker threads that share the prepared retriever.
+
+    Returns:
+        The successfully generated pages, in the order of ``pages``
+    """
+    feedback = page_feedback or {}
+
+    def _generate(page: WikiPage) -> WikiPage | None:
+        return generate_page_content_sync(
+            page,
+            generation_context,
+            repo_url,
+            progress_manager,
+            extra_feedback=feedback.get(page.id),
+        )
+
+    workers = min(PAGE_GENERATION_CONCURRENCY, len(pages))
+    if workers <= 1:
+        results = [_generate(page) for page in pages]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="deepwiki-page",
+        ) as executor:
+            results = list(executor.map(_generate, pages))
+    return [page for page in results if page is not None]
+
+
+# Single writer so debug dumps neither block generation threads nor
+# interleave when several pages fail at once
+_DEBUG_DUMP_POOL = ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix="deepwiki-debug-dump",
+)
+
+
+def _write_debug_dump(debug_file: str, raw_content: str, label: str) -> None:
+    try:
+        with open(debug_file, "w", encoding="utf-8") as handle:
+            handle.write(raw_content)
+        logger.error("Full %s saved to: %s", label, debug_file)
+    except Exception as exc:  # pragma: no cover - defensive logging
+        logger.exception("Failed to save %s debug file: %s", label, exc)
+
+
 def _dump_failed_structure_response(raw_content: str) -> None:
-    """Persist raw structured output to a temp file for debugging."""
+    """Persist raw structured output to a temp file for debugging.
+
+    The file is written on a background thread; pending writes finish
+    before the interpreter exits.
+    """
     import tempfile
 
     debug_file = os.path.join(
         tempfile.gettempdir(),
         f"deepwiki_debug_response_{os.getpid()}.txt",
     )
-    try:
-        with open(debug_file, "w", encoding="utf-8") as handle:
-            handle.write(raw_content)
-        logger.error("Full response saved to: %s", debug_file)
-    except Exception as exc:  # pragma: no cover - defensive logging
-        logger.exception("Failed to save debug file: %s", exc)
+    _DEBUG_DUMP_POOL.submit(_write_debug_dump, debug_file, raw_content, "response")
 
 
 def _strip_code_fence(raw_content: str) -> str:
@@ -640,6 +720,20 @@ def _strip_code_fence(raw_content: str) -> str:
     return stripped
 
 
+def _find_json_block(raw_content: str) -> str | None:
+    """Return the outermost ``{...}`` block of model output, if any.
+
+    ``str.find``/``str.rfind`` run in C and a slice covering the whole string
+    is not copied, so pure JSON responses are passed through as is.
+    """
+    stripped = _strip_code_fence(raw_content)
+    start = stripped.find("{")
+    end = stripped.rfind("}")
+    if start == -1 or start >= end:
+        return None
+    return stripped[start : end + 1]
+
+
 def _schema_to_model(structure_schema: WikiStructureSchema) -> WikiStructureModel:
     """Convert schema response to the runtime wiki structure model."""
     pages = [
@@ -668,12 +762,9 @@ def _schema_to_model(structure_schema: WikiStructureSchema) -> WikiStructureMode
 
 def _parse_wiki_structure_json(raw_content: str) -> WikiStructureSchema:
     """Parse JSON returned by the LLM into a WikiStructureSchema."""
-    stripped = _strip_code_fence(raw_content)
-    start = stripped.find("{")
-    end = stripped.rfind("}")
-    if start == -1 or end == -1 or start >= end:
+    json_payload = _find_json_block(raw_content)
+    if json_payload is None:
         raise WikiStructureParseError("Structured JSON block not found in response")
-    json_payload = stripped[start : end + 1]
     logger.debug("Structured JSON candidate: %s", json_payload[:500])
     try:
         return WikiStructureSchema.model_validate_json(json_payload)
@@ -681,6 +772,15 @@ def _parse_wiki_structure_json(raw_content: str) -> WikiStructureSchema:
         raise WikiStructureParseError(f"JSON parsing failed: {exc}") from exc
 
 
+def _is_parseable_structure(raw_content: str) -> bool:
+    """Return whether a streamed structure response parses, for caching."""
+    try:
+        _parse_wiki_structure_json(raw_content)
+    except WikiStructureParseError:
+        return False
+    return True
+
+
 def _dump_failed_page_response(raw_content: str) -> None:
     """Persist raw wiki page output to disk for debugging."""
     import tempfile
@@ -689,25 +789,26 @@ def _dump_failed_page_response(raw_content: str) -> None:
         tempfile.gettempdir(),
         f"deepwiki_page_debug_{os.getpid()}.txt",
     )
-    try:
-        with open(debug_file, "w", encoding="utf-8") as handle:
-            handle.write(raw_content)
-        logger.error("Full page response saved to: %s", debug_file)
-    except Exception as exc:  # pragma: no cover - defensive logging
-        logger.exception("Failed to save page debug file: %s", exc)
+    _DEBUG_DUMP_POOL.submit(
+        _write_debug_dump,
+        debug_file,
+        raw_content,
+        "page response",
+    )
 
 
 def _parse_wiki_page_json(raw_content: str) -> WikiPageSchema:
     """Parse JSON returned by the LLM into a WikiPageSchema."""
-    stripped = _strip_code_fence(raw_content)
-    start = stripped.find("{")
-    end = stripped.rfind("}")
-    if start == -1 or end == -1 or start >= end:
+    json_payload = _find_json_block(raw_content)
+    if json_payload is None:
         raise WikiPageParseError("Structured JSON block not found in response")
-    json_payload = stripped[start : end + 1]
     try:
         return WikiPageSchema.model_validate_json(json_payload)
     except ValidationError as exc:
+        # Only malformed JSON can be repaired; schema errors on valid JSON
+        # would fail the same way on a second validation.
+        if not any(error["type"] == "json_invalid" for error in exc.errors()):
+            raise WikiPageParseError(f"Page JSON parsing failed: {exc}") from exc
         sanitized = _sanitize_page_json(json_payload)
         if sanitized is None:
             raise WikiPageParseError(f"Page JSON parsing failed: {exc}") from exc
@@ -723,16 +824,20 @@ def _parse_wiki_page_json(raw_content: str) -> WikiPageSchema:
             ) from sanitized_exc
 
 
-def _sanitize_page_json(json_payload: str) -> str | None:
-    """Escape embedded quotes inside the content field when providers omit escaping."""
+def _is_parseable_page(raw_content: str) -> bool:
+    """Return whether a streamed page response parses, for caching."""
     try:
-        import json
+        _parse_wiki_page_json(raw_content)
+    except WikiPageParseError:
+        return False
+    return True
+
 
-        json.loads(json_payload)
-        return json_payload
-    except Exception:  # pragma: no cover - only triggered on invalid JSON
-        pass
+def _sanitize_page_json(json_payload: str) -> str | None:
+    """Escape embedded quotes inside the content field when providers omit escaping.
 
+    Callers only pass payloads that already failed to parse as JSON.
+    """
     marker = '"content": "'
     if marker not in json_payload:
         return None
@@ -741,15 +846,29 @@ def _sanitize_page_json(json_payload: str) -> str | None:
         content_raw, suffix = remainder.rsplit('"\n}', 1)
     except ValueError:
         return None
-    import json as _json
 
-    escaped = _json.dumps(content_raw)
+    escaped = json.dumps(content_raw)
     return prefix + '"content": ' + escaped + "\n}" + suffix
 
 
-def _structured_client_for(provider: str, model: str):
-    """Instantiate a provider client when structured calls are supported."""
-    model_config = get_model_config(provider, model)
+@functools.lru_cache(maxsize=16)
+def _structured_client_for(
+    provider: str,
+    model: str,
+) -> tuple[Any | None, Mapping[str, Any]]:
+    """Instantiate a provider client when structured calls are supported.
+
+    Clients are shared per ``(provider, model)`` so retries reuse the SDK
+    client and its connection pool instead of setting up a new one. The
+    returned configuration is read-only because it is shared between calls.
+    """
+    config = get_model_config(provider, model)
+    model_config = MappingProxyType(
+        {
+            **config,
+            "model_kwargs": MappingProxyType(dict(config.get("model_kwargs") or {})),
+        },
+    )
     client_name = model_config.get("model_client")
     client_classes = get_client_classes()
     client_cls = client_classes.get(client_name)
@@ -761,21 +880,60 @@ def _structured_client_for(provider: str, model: str):
     return client, model_config
 
 
+def _structure_uses_retriever(provider: str, model: str) -> bool:
+    """Return whether the structure is streamed through the RAG retriever.
+
+    Providers without native structured output fall back to
+    :func:`_stream_structure_response`, which needs the prepared retriever.
+    A client that fails to load is reported by the structure attempts.
+    """
+    try:
+        client, _ = _structured_client_for(provider, model)
+    except Exception:
+        return False
+    return client is None
+
+
 def _call_structured_wiki_schema(
     provider: str,
     model: str,
     messages: list[dict[str, Any]],
 ) -> WikiStructureSchema | None:
     """Call provider-specific structured output if supported."""
+    from deepwiki_cli.application.wiki.generate_content import (
+        cache_completion,
+        discard_cached_completion,
+        get_cached_completion,
+    )
+
     client, model_config = _structured_client_for(provider, model)
     if client is None:
         return None
+
+    prompt = "\n".join(str(message.get("content", "")) for message in messages)
+    cached = get_cached_completion(provider, model, WikiStructureSchema, prompt)
+    if cached is not None:
+        try:
+            return WikiStructureSchema.model_validate_json(cached)
+        except ValidationError as exc:
+            logger.warning("Discarding invalid cached wiki structure: %s", exc)
+            discard_cached_completion(provider, model, WikiStructureSchema, prompt)
+
     call_fn: Callable[..., WikiStructureSchema] = client.call_structured
-    return call_fn(
+    schema_response = call_fn(
         schema=WikiStructureSchema,
         messages=messages,
-        model_kwargs=model_config.get("model_kwargs"),
+        model_kwargs=dict(model_config.get("model_kwargs") or {}),
     )
+    if schema_response is not None:
+        cache_completion(
+            provider,
+            model,
+            WikiStructureSchema,
+            prompt,
+            schema_response.model_dump_json(),
+        )
+    return schema_response
 
 
 def _stream_structure_response(
@@ -790,6 +948,7 @@ def _stream_structure_response(
     if generation_context:
         stream = generation_context.stream_completion(
             messages=[{"role": "user", "content": prompt}],
+            validate_response=_is_parseable_structure,
         )
     else:
         from deepwiki_cli.application.wiki.generate_content import generate_wiki_content
@@ -801,13 +960,12 @@ def _stream_structure_response(
             model=model,
             repo_type=repo_type,
             structured_schema=None,
+            validate_response=_is_parseable_structure,
         )
 
-    aggregated = ""
-    for chunk in stream:
-        if chunk:
-            aggregated += chunk if isinstance(chunk, str) else str(chunk)
-    return aggregated
+    return "".join(
+        chunk if isinstance(chunk, str) else str(chunk) for chunk in stream if chunk
+    )
 
 
 def generate_wiki_structure(
@@ -824,6 +982,11 @@ def generate_wiki_structure(
 
     Returns:
         WikiStructureModel or None on error
+
+    Raises:
+        Exception: Errors from preparing ``generation_context`` when the
+            provider has no structured output and the structure has to be
+            streamed through the retriever.
     """
     # Calculate file count for page estimation
     file_count = len([line for line in file_tree.split("\n") if line.strip()])
@@ -862,8 +1025,12 @@ def generate_wiki_structure(
         prompt_content += f"\n\n<additional_context>\n{generation_context.additional_context}\n</additional_context>"
         
     messages = [{"role": "user", "content": prompt_content}]
+    if generation_context and _structure_uses_retriever(provider, model):
+        # Preparation errors are not provider errors; retrying cannot fix them
+        generation_context.wait_until_ready()
     for attempt in range(1, max_attempts + 1):
         raw_content = ""
+        provider_error = False
         try:
             schema_response = _call_structured_wiki_schema(
                 provider=provider,
@@ -903,9 +1070,10 @@ def generate_wiki_structure(
             )
             if is_last:
                 return None
+            provider_error = True
 
         if attempt < max_attempts:
-            time.sleep(WIKI_STRUCTURE_RETRY_DELAY)
+            time.sleep(_structure_retry_delay(attempt, provider_error=provider_error))
             logger.info(
                 "Retrying wiki structure generation (%s/%s)",
                 attempt + 1,
@@ -913,15 +1081,74 @@ def generate_wiki_structure(
             )
 
 
+def _structure_retry_delay(attempt: int, *, provider_error: bool) -> float:
+    """Return the pause before retrying after the given failed attempt.
+
+    Unparseable responses are retried after the base delay. Provider errors
+    back off exponentially with up to a second of jitter, so concurrent runs
+    hitting a rate limit do not retry in lockstep.
+    """
+    if not provider_error:
+        return WIKI_STRUCTURE_RETRY_DELAY
+    delay = min(
+        WIKI_STRUCTURE_RETRY_DELAY * 2 ** (attempt - 1),
+        WIKI_STRUCTURE_MAX_RETRY_DELAY,
+    )
+    return delay + random.random()  # noqa: S311 - jitter, not cryptography
+
+
+def _wait_for_generation_context(
+    generation_context: WikiGenerationContext,
+    progress: ProgressManager,
+) -> None:
+    """Block until background retriever preparation finishes.
+
+    Raises:
+        click.Abort: If the retriever could not be prepared.
+    """
+    try:
+        generation_context.wait_until_ready()
+    except Exception as e:
+        click.echo(f"✗ Error preparing repository: {e}", err=True)
+        progress.close()
+        raise click.Abort
+    click.echo("✓ Repository prepared")
+
+
+README_NAMES = ("README.md", "readme.md", "README.txt")
+
+
+def _find_local_readmes(repo_path: str) -> list[str]:
+    """Return README paths in the repository root, best match first.
+
+    The root is listed once instead of probing each candidate name. Exact
+    names in ``README_NAMES`` keep their order; other spellings such as
+    ``Readme.md`` follow, Markdown before plain text.
+    """
+    try:
+        with os.scandir(repo_path) as entries:
+            files = {
+                entry.name: entry.path
+                for entry in entries
+                if entry.name.casefold() in ("readme.md", "readme.txt")
+                and entry.is_file()
+            }
+    except OSError as exc:
+        logger.debug(f"Failed to list {repo_path}: {exc}")
+        return []
+
+    exact = [files.pop(name) for name in README_NAMES if name in files]
+    others = sorted(files.items(), key=lambda item: (item[0].casefold(), item[0]))
+    return exact + [path for _, path in others]
+
+
 def _read_local_readme(repo_path: str) -> str:
-    for readme_name in ["README.md", "readme.md", "README.txt"]:
-        readme_path = os.path.join(repo_path, readme_name)
-        if os.path.exists(readme_path):
-            try:
-                with open(readme_path, encoding="utf-8", errors="ignore") as handle:
-                    return handle.read()
-            except Exception as exc:
-                logger.debug(f"Failed to read {readme_path}: {exc}")
+    for readme_path in _find_local_readmes(repo_path):
+        try:
+            with open(readme_path, encoding="utf-8", errors="ignore") as handle:
+                return handle.read()
+        except Exception as exc:
+            logger.debug(f"Failed to read {readme_path}: {exc}")
     return ""
 
 
@@ -930,6 +1157,7 @@ def prepare_repository_state(
     repo_url_or_path: str,
     owner: str | None,
     repo_name: str,
+    previous_snapshot: RepoSnapshot | None = None,
 ) -> RepositoryState:
     if repo_type == "github":
         data = get_github_repo_structure(
@@ -952,7 +1180,11 @@ def prepare_repository_state(
     relative_files = [os.path.relpath(f, repo_url_or_path) for f in files]
     file_tree = "\n".join(relative_files)
     readme = _read_local_readme(repo_url_or_path)
-    snapshot = build_snapshot_from_local(repo_url_or_path, files)
+    snapshot = build_snapshot_from_local(
+        repo_url_or_path,
+        files,
+        previous=previous_snapshot,
+    )
     return RepositoryState(file_tree=file_tree, readme=readme, snapshot=snapshot)
 
 
@@ -962,8 +1194,26 @@ def prepare_repository_state(
     is_flag=True,
     help="Skip prompts when regenerating and overwrite the latest cache automatically.",
 )
-def generate(force: bool) -> None:
+@click.option(
+    "--llm-cache/--no-llm-cache",
+    "llm_cache",
+    default=None,
+    help="Reuse responses for identical prompts (default: DEEPWIKI_RESPONSE_CACHE).",
+)
+@click.option(
+    "--pretty",
+    is_flag=True,
+    help="Indent the saved cache JSON for reading and diffing.",
+)
+def generate(force: bool, llm_cache: bool | None, pretty: bool) -> None:
     """Generate a new wiki or refresh an existing cache."""
+    if llm_cache is not None:
+        from deepwiki_cli.application.wiki.generate_content import (
+            set_response_cache_enabled,
+        )
+
+        set_response_cache_enabled(llm_cache)
+
     click.echo("\n" + "=" * 60)
     click.echo("DeepWiki Generator")
     click.echo("=" * 60)
@@ -1015,6 +1265,9 @@ def generate(force: bool) -> None:
                 repo_url_or_path,
                 owner,
                 repo_name,
+                previous_snapshot=(
+                    existing_cache.repo_snapshot if existing_cache else None
+                ),
             )
             click.echo("✓ Repository inspected")
         except Exception as e:
@@ -1034,6 +1287,7 @@ def generate(force: bool) -> None:
         change_summary = None
         affected_pages: list[str] = []
         update_candidate_page_ids: list[str] = []
+        existing_page_lookup: dict[str, WikiPage] = {}
         action = "overwrite"
 
         if existing_cache and selected_cache_entry:
@@ -1050,16 +1304,17 @@ def generate(force: bool) -> None:
                     existing_cache.wiki_structure,
                 )
                 if existing_cache and existing_cache.wiki_structure:
-                    update_candidate_page_ids = (
-                        affected_pages
-                        if affected_pages
-                        else [page.id for page in existing_cache.wiki_structure.pages]
+                    existing_page_lookup = {
+                        page.id: page for page in existing_cache.wiki_structure.pages
+                    }
+                    update_candidate_page_ids = affected_pages or list(
+                        existing_page_lookup,
                     )
                 _display_change_summary(
                     repo_name,
                     selected_cache_entry,
                     cast("dict[str, list[str]] | None", change_summary),
-                    existing_cache.wiki_structure,
+                    existing_page_lookup,
                     affected_pages,
                 )
                 if not force and not _has_repo_changes(
@@ -1101,7 +1356,7 @@ def generate(force: bool) -> None:
                 action = "overwrite"
             else:
                 selected_page_ids = _prompt_pages_to_regenerate(
-                    existing_cache.wiki_structure,
+                    existing_page_lookup,
                     update_candidate_page_ids,
                 )
                 if not selected_page_ids:
@@ -1110,15 +1365,12 @@ def generate(force: bool) -> None:
                     return
                 click.echo("\nPages selected for regeneration:")
                 for pid in selected_page_ids:
-                    page = next(
-                        (p for p in existing_cache.wiki_structure.pages if p.id == pid),
-                        None,
-                    )
+                    page = existing_page_lookup.get(pid)
                     title = page.title if page else pid
                     click.echo(f"  • {title}")
                 page_feedback = _collect_page_feedback(
                     selected_page_ids,
-                    existing_cache.wiki_structure,
+                    existing_page_lookup,
                 )
 
         target_version = 1
@@ -1150,7 +1402,6 @@ def generate(force: bool) -> None:
                 additional_context=additional_context,
                 force_rebuild_embeddings=force_embedding_rebuild,
             )
-            click.echo("✓ Repository prepared")
         except Exception as e:
             click.echo(f"✗ Error preparing repository: {e}", err=True)
             progress.close()
@@ -1166,26 +1417,32 @@ def generate(force: bool) -> None:
             if wiki_structure is None:
                 raise ValueError("Existing cache has no wiki_structure")  # noqa: TRY301
             generated_pages = dict(existing_cache.generated_pages)
+            selected_ids = set(selected_page_ids)
             pages_to_generate = [
-                page for page in wiki_structure.pages if page.id in selected_page_ids
+                page for page in wiki_structure.pages if page.id in selected_ids
             ]
+            _wait_for_generation_context(generation_context, progress)
             progress.set_status("Regenerating selected pages")
             progress.init_overall_progress(len(pages_to_generate), "Updating Pages")
 
-            for page in pages_to_generate:
-                updated_page = generate_page_content_sync(
-                    page,
-                    generation_context,
-                    repo_url_or_path,
-                    progress,
-                    extra_feedback=page_feedback.get(page.id),
-                )
-                if updated_page:
-                    generated_pages[page.id] = updated_page
-                    regenerated_ids.append(page.id)
+            for updated_page in generate_pages_sync(
+                pages_to_generate,
+                generation_context,
+                repo_url_or_path,
+                progress,
+                page_feedback=page_feedback,
+            ):
+                generated_pages[updated_page.id] = updated_page
+                regenerated_ids.append(updated_page.id)
 
             reused_count = len(wiki_structure.pages) - len(regenerated_ids)
         else:
+            # Only native structured output overlaps with retriever
+            # preparation; the streaming fallback needs the retriever
+            structure_uses_retriever = _structure_uses_retriever(provider, model)
+            if structure_uses_retriever:
+                _wait_for_generation_context(generation_context, progress)
+
             progress.set_status("Determining wiki structure")
             click.echo("Determining wiki structure...")
 
@@ -1213,6 +1470,8 @@ def generate(force: bool) -> None:
             if wiki_structure is None:
                 raise ValueError("wiki_structure is None")  # noqa: TRY301
             click.echo(f"✓ Structure created: {len(wiki_structure.pages)} pages")
+            if not structure_uses_retriever:
+                _wait_for_generation_context(generation_context, progress)
 
             progress.set_status("Generating pages")
             progress.init_overall_progress(
@@ -1221,16 +1480,14 @@ def generate(force: bool) -> None:
             )
             click.echo(f"\nGenerating {len(wiki_structure.pages)} pages...\n")
 
-            for page in wiki_structure.pages:
-                updated_page = generate_page_content_sync(
-                    page,
-                    generation_context,
-                    repo_url_or_path,
-                    progress,
-                )
-                if updated_page:
-                    generated_pages[page.id] = updated_page
-                    regenerated_ids.append(page.id)
+            for updated_page in generate_pages_sync(
+                wiki_structure.pages,
+                generation_context,
+                repo_url_or_path,
+                progress,
+            ):
+                generated_pages[updated_page.id] = updated_page
+                regenerated_ids.append(updated_page.id)
 
             reused_count = len(wiki_structure.pages) - len(regenerated_ids)
 
@@ -1289,8 +1546,15 @@ def generate(force: bool) -> None:
             comprehensive=is_comprehensive,
         )
 
-        with open(cache_file, "w") as f:
-            json.dump(cache_payload.model_dump(), f, indent=2)
+        # Serialize straight from the models and swap the file in atomically
+        # so an interrupted save never leaves a truncated cache behind
+        tmp_cache_file = cache_file.with_suffix(".json.tmp")
+        tmp_cache_file.write_bytes(
+            cache_payload.model_dump_json(indent=2 if pretty else None).encode(
+                "utf-8",
+            ),
+        )
+        tmp_cache_file.replace(cache_file)
 
         progress.close()
 
@@ -1,16 +1,59 @@
 """List cached wikis command."""
 
-import json
 import logging
 from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
 
 import click
 
 from deepwiki_cli.cli.utils import format_file_size, get_cache_path
-from deepwiki_cli.infrastructure.storage.cache import parse_cache_filename
+from deepwiki_cli.infrastructure.formats.json_compact import (
+    read_json_file,
+    to_json_bytes,
+)
+from deepwiki_cli.infrastructure.storage.cache import iter_cache_files
 
 logger = logging.getLogger(__name__)
 
+# Page counts and wiki types of cache files, keyed by file name and
+# invalidated by mtime and size, so unchanged caches are not parsed again
+LIST_INDEX_FILENAME = ".list_index.json"
+
+
+def _summarize_cache(data: dict[str, Any]) -> tuple[str, int]:
+    """Return the wiki type label and page count of a parsed cache."""
+    page_count = 0
+    if "wiki_structure" in data and "pages" in data["wiki_structure"]:
+        page_count = len(data["wiki_structure"]["pages"])
+    comprehensive_flag = data.get("comprehensive")
+    if comprehensive_flag is True:
+        return "comprehensive", page_count
+    if comprehensive_flag is False:
+        return "concise", page_count
+    detected = data.get("wiki_type")
+    if isinstance(detected, str) and detected.strip():
+        return detected.strip(), page_count
+    return "-", page_count
+
+
+def _load_list_index(cache_dir: Path) -> dict[str, Any]:
+    try:
+        index = read_json_file(cache_dir / LIST_INDEX_FILENAME)
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _save_list_index(cache_dir: Path, index: dict[str, Any]) -> None:
+    index_file = cache_dir / LIST_INDEX_FILENAME
+    tmp_file = index_file.with_suffix(".tmp")
+    try:
+        tmp_file.write_bytes(to_json_bytes(index))
+        tmp_file.replace(index_file)
+    except OSError as e:
+        logger.debug("Failed to save cache list index in %s: %s", cache_dir, e)
+
 
 @click.command(name="list")
 def list_wikis() -> None:
@@ -22,7 +65,7 @@ def list_wikis() -> None:
         return
 
     # Find all cache files
-    cache_files = list(cache_dir.glob("deepwiki_cache_*.json"))
+    cache_files = list(iter_cache_files(cache_dir))
 
     if not cache_files:
         click.echo("No cached wikis found.")
@@ -33,42 +76,42 @@ def list_wikis() -> None:
     click.echo("=" * 80 + "\n")
 
     # Parse and display each cache file
+    index = _load_list_index(cache_dir)
+    fresh_index: dict[str, Any] = {}
     wikis = []
-    for cache_file in cache_files:
+    for cache_file, meta in cache_files:
         try:
-            meta = parse_cache_filename(cache_file)
-            if not meta:
-                continue
-
-            repo_type = meta["repo_type"]
-            owner = meta["owner"]
-            repo = meta["repo"]
-            version = meta["version"]
+            repo_type, owner, repo, _, version = meta
 
             # Get file stats
             stats = cache_file.stat()
             size = format_file_size(stats.st_size)
             modified = datetime.fromtimestamp(stats.st_mtime, tz=UTC)
 
-            # Try to load the cache to get more info
+            # Reuse the indexed summary while the file is unchanged, otherwise
+            # load the cache to get more info
             wiki_type = "-"
             page_count = 0
-            try:
-                with open(cache_file) as f:
-                    data = json.load(f)
-                    if "wiki_structure" in data and "pages" in data["wiki_structure"]:
-                        page_count = len(data["wiki_structure"]["pages"])
-                    comprehensive_flag = data.get("comprehensive")
-                    if comprehensive_flag is True:
-                        wiki_type = "comprehensive"
-                    elif comprehensive_flag is False:
-                        wiki_type = "concise"
-                    else:
-                        detected = data.get("wiki_type")
-                    if isinstance(detected, str) and detected.strip():
-                        wiki_type = detected.strip()
-            except Exception as e:
-                logger.debug("Failed to load cache metadata from %s: %s", cache_file, e)
+            stamp = [stats.st_mtime_ns, stats.st_size]
+            entry = index.get(cache_file.name)
+            if isinstance(entry, dict) and entry.get("stamp") == stamp:
+                wiki_type = entry["wiki_type"]
+                page_count = entry["page_count"]
+                fresh_index[cache_file.name] = entry
+            else:
+                try:
+                    wiki_type, page_count = _summarize_cache(read_json_file(cache_file))
+                    fresh_index[cache_file.name] = {
+                        "stamp": stamp,
+                        "wiki_type": wiki_type,
+                        "page_count": page_count,
+                    }
+                except Exception as e:
+                    logger.debug(
+                        "Failed to load cache metadata from %s: %s",
+                        cache_file,
+                        e,
+                    )
 
             wikis.append(
                 {
@@ -87,8 +130,11 @@ def list_wikis() -> None:
         except Exception as e:
             click.echo(f"Warning: Could not parse {cache_file.name}: {e}", err=True)
 
+    if fresh_index != index:
+        _save_list_index(cache_dir, fresh_index)
+
     # Sort by name (repo), then by version (descending)
-    wikis.sort(key=lambda x: (x["name"], -int(str(x["version"]))))
+    wikis.sort(key=lambda x: (x["name"], -x["version"]))
 
     # Display wikis
     for i, wiki in enumerate(wikis, 1):
@@ -27,17 +27,22 @@ from deepwiki_cli.infrastructure.storage.workspace import (
     default=False,
     help="Continue watching the workspace after syncing.",
 )
-def sync(workspace: Path | None, watch_enabled: bool) -> None:
+@click.option(
+    "--pretty",
+    is_flag=True,
+    help="Indent the saved cache JSON for reading and diffing.",
+)
+def sync(workspace: Path | None, watch_enabled: bool, pretty: bool) -> None:
     """Sync markdown edits from docs/wiki back to the cache."""
     config = load_config()
     workspace_base = Path(config.get("wiki_workspace", "docs/wiki"))
     manifest = _resolve_manifest(workspace_base, workspace)
-    summary = sync_manifest(manifest)
+    summary = sync_manifest(manifest, pretty=pretty)
     click.echo(
         f"\n✓ Synced {summary.get('updated', 0)} page(s) at {summary.get('timestamp')}\n",
     )
     if watch_enabled:
-        watch_manifest_cli(manifest)
+        watch_manifest_cli(manifest, pretty=pretty)
 
 
 def _resolve_manifest(base_dir: Path, provided: Path | None) -> ExportManifest:
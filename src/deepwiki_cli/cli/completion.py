@@ -16,7 +16,7 @@ else:
 
 from deepwiki_cli.cli.config import get_provider_models
 from deepwiki_cli.cli.utils import get_cache_path
-from deepwiki_cli.infrastructure.storage.cache import parse_cache_filename
+from deepwiki_cli.infrastructure.storage.cache import iter_cache_files
 
 logger = logging.getLogger(__name__)
 
@@ -81,21 +81,12 @@ def complete_wiki_names(
         if not cache_dir.exists():
             return []
 
-        cache_files = list(cache_dir.glob("deepwiki_cache_*.json"))
         wiki_names = []
 
-        for cache_file in cache_files:
-            try:
-                meta = parse_cache_filename(cache_file)
-                if not meta:
-                    continue
-                owner = meta["owner"]
-                repo = meta["repo"]
-                name = f"{owner}/{repo}" if owner and owner != "local" else repo
-                wiki_names.append(name)
-            except Exception as e:
-                logger.debug("Failed to parse cache filename %s: %s", cache_file, e)
-                continue
+        for _, meta in iter_cache_files(cache_dir):
+            owner, repo = meta.owner, meta.repo
+            name = f"{owner}/{repo}" if owner and owner != "local" else repo
+            wiki_names.append(name)
 
         return [
             CompletionItem(name) for name in wiki_names if name.startswith(incomplete)
@@ -1,6 +1,5 @@
 """Configuration management for DeepWiki CLI."""
 
-import copy
 import json
 import logging
 from pathlib import Path
@@ -31,11 +30,28 @@ DEFAULT_CONFIG = {
 }
 
 
+# Last parsed configuration, keyed by file path, mtime and size
+_config_cache: tuple[tuple[Any, ...], dict[str, Any]] | None = None
+
+
 def ensure_config_dir() -> None:
     """Ensure the configuration directory exists."""
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _clone_config(value: Any) -> Any:
+    """Copy JSON-shaped configuration data.
+
+    Configuration only holds dicts, lists and scalars, so a direct recursive
+    copy replaces ``copy.deepcopy`` and its memo bookkeeping.
+    """
+    if isinstance(value, dict):
+        return {key: _clone_config(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone_config(item) for item in value]
+    return value
+
+
 def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
     """Deep merge two dictionaries recursively.
 
@@ -46,7 +62,7 @@ def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any
     Returns:
         New dictionary with merged values. Nested dicts are merged recursively.
     """
-    result = copy.deepcopy(base)
+    result = _clone_config(base)
 
     for key, value in override.items():
         if key in result and isinstance(result[key], dict) and isinstance(value, dict):
@@ -65,17 +81,28 @@ def load_config() -> dict[str, Any]:
     Returns:
         Dictionary with configuration values, or defaults if file doesn't exist.
     """
+    global _config_cache  # noqa: PLW0603
+
     if not CONFIG_FILE.exists():
-        return DEFAULT_CONFIG.copy()
+        return _clone_config(DEFAULT_CONFIG)
 
     try:
-        with open(CONFIG_FILE) as f:
+        # Reuse the parsed file while it is unchanged; callers get their own
+        # copy because set_config_value mutates the returned dict
+        stats = CONFIG_FILE.stat()
+        cache_key = (CONFIG_FILE, stats.st_mtime_ns, stats.st_size)
+        if _config_cache is not None and _config_cache[0] == cache_key:
+            return _clone_config(_config_cache[1])
+
+        with open(CONFIG_FILE, encoding="utf-8") as f:
             config = json.load(f)
             # Deep merge with defaults to ensure all keys exist
-            return _deep_merge(DEFAULT_CONFIG, config)
+            merged = _deep_merge(DEFAULT_CONFIG, config)
+        _config_cache = (cache_key, merged)
+        return _clone_config(merged)
     except Exception as e:
         logger.warning(f"Error loading config file: {e}. Using defaults.")
-        return DEFAULT_CONFIG.copy()
+        return _clone_config(DEFAULT_CONFIG)
 
 
 def save_config(config: dict[str, Any]) -> None:
@@ -84,10 +111,14 @@ def save_config(config: dict[str, Any]) -> None:
     Args:
         config: Configuration dictionary to save.
     """
+    global _config_cache  # noqa: PLW0603
+
     ensure_config_dir()
+    # Filesystems with coarse mtimes could otherwise serve the old contents
+    _config_cache = None
 
     try:
-        with open(CONFIG_FILE, "w") as f:
+        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
             json.dump(config, f, indent=2)
         logger.info(f"Configuration saved to {CONFIG_FILE}")
     except Exception as e:
@@ -1,9 +1,10 @@
 """Main CLI entry point for DeepWiki."""
 
+import importlib
 import logging
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, cast
 
 import click
 from dotenv import load_dotenv
@@ -11,8 +12,6 @@ from dotenv import load_dotenv
 if TYPE_CHECKING:
     from click import Context
 else:
-    from typing import Any
-
     Context = Any  # type: ignore[assignment,misc]
 
 # Add the project root to the path
@@ -41,7 +40,47 @@ from deepwiki_cli import __version__
 from deepwiki_cli.infrastructure.observability import flush_langfuse
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are used.
+
+    ``generate`` pulls in the model clients and the RAG stack, so loading every
+    command up front made ``deepwiki list`` pay for imports it never uses.
+
+    Args:
+        lazy_subcommands: Mapping of command name to ``"module.attribute"``.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: "Context") -> list[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: "Context", cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            module_name, attribute = self.lazy_subcommands[cmd_name].rsplit(".", 1)
+            module = importlib.import_module(module_name)
+            return cast("click.Command", getattr(module, attribute))
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "config": "deepwiki_cli.cli.commands.config_cmd.config",
+        "delete": "deepwiki_cli.cli.commands.delete.delete",
+        "export": "deepwiki_cli.cli.commands.export.export",
+        "generate": "deepwiki_cli.cli.commands.generate.generate",
+        "list": "deepwiki_cli.cli.commands.list_wikis.list_wikis",
+        "sync": "deepwiki_cli.cli.commands.sync.sync",
+    },
+)
 @click.version_option(version=__version__, prog_name="deepwiki")
 @click.option(
     "--verbose",
@@ -63,41 +102,17 @@ def cli(ctx: "Context", verbose: bool) -> None:
     # Adjust logging level based on verbose flag
     log_level = logging.INFO if verbose else logging.WARNING
 
-    # Update root logger and all handlers
+    # Update root logger and all handlers; loggers without an explicit level
+    # inherit it, and the handler levels filter anything more verbose from
+    # loggers that set their own
     logging.root.setLevel(log_level)
     for handler in logging.root.handlers:
         handler.setLevel(log_level)
 
-    # Update all existing loggers
-    for logger_name in logging.Logger.manager.loggerDict:
-        logger_obj = logging.getLogger(logger_name)
-        logger_obj.setLevel(log_level)
-        # Also update handlers for each logger
-        for handler in logger_obj.handlers:
-            handler.setLevel(log_level)
-
     if verbose:
         logger.info("Verbose mode enabled")
 
 
-# Import commands after the CLI group is defined
-from deepwiki_cli.cli.commands import (
-    config_cmd,
-    delete,
-    export,
-    generate,
-    list_wikis,
-    sync,
-)
-
-cli.add_command(generate.generate)
-cli.add_command(list_wikis.list_wikis)
-cli.add_command(export.export)
-cli.add_command(config_cmd.config)
-cli.add_command(delete.delete)
-cli.add_command(sync.sync)
-
-
 def main() -> None:
     """Main entry point with custom error handling."""
     # Check if first non-option argument is a valid command
@@ -112,21 +127,20 @@ def main() -> None:
             break
 
     # If we found a potential command, check if it's valid
-    if command_name and command_name not in cli.commands:
+    ctx = click.Context(cli, info_name="deepwiki")
+    if command_name and command_name not in cli.list_commands(ctx):
         # Invalid command - show error and help
         click.echo(f"Error: No such command '{command_name}'.", err=True)
         click.echo()
         # Show help
         try:
-            ctx = click.Context(cli, info_name="deepwiki")
             click.echo(ctx.get_help())
         except Exception:
-            # Fallback if context creation fails - show commands manually
+            # Fallback if rendering the help fails - show command names only
             click.echo("Usage: deepwiki [OPTIONS] COMMAND [ARGS]...")
             click.echo("\nCommands:")
-            for cmd_name, cmd in cli.commands.items():
-                help_str = cmd.get_short_help_str() or cmd.help or ""
-                click.echo(f"  {cmd_name:10}  {help_str}")
+            for cmd_name in cli.list_commands(ctx):
+                click.echo(f"  {cmd_name}")
         sys.exit(2)
 
     # Use Click's normal invocation
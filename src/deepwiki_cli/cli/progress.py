@@ -1,6 +1,7 @@
 """Progress display system using Enlighten library."""
 
 import logging
+import threading
 
 import enlighten  # type: ignore[import-untyped]
 
@@ -8,9 +9,14 @@ logger = logging.getLogger(__name__)
 
 
 class ProgressManager:
-    """Manages multiple progress bars for wiki generation."""
+    """Manages multiple progress bars for wiki generation.
+
+    Page bars may be added, updated and completed from worker threads when
+    pages are generated concurrently; those operations are serialized.
+    """
 
     def __init__(self) -> None:
+        self._lock = threading.RLock()
         self.manager = enlighten.get_manager()
         self.status_bar = None
         self.overall_bar = None
@@ -54,41 +60,49 @@ class ProgressManager:
         Returns:
             Progress counter for the page
         """
-        if page_id in self.page_bars:
-            return self.page_bars[page_id]
-
-        # Truncate title if too long
-        display_title = page_title[:40] + "..." if len(page_title) > 40 else page_title
-
-        counter = self.manager.counter(
-            total=100,
-            desc=f"  {display_title}",
-            unit="%",
-            color="cyan",
-            leave=False,
-            autorefresh=True,
-            min_delta=0.1,
-        )
-        self.page_bars[page_id] = counter
-        return counter
+        with self._lock:
+            if page_id in self.page_bars:
+                return self.page_bars[page_id]
+
+            # Truncate title if too long
+            display_title = (
+                page_title[:40] + "..." if len(page_title) > 40 else page_title
+            )
+
+            counter = self.manager.counter(
+                total=100,
+                desc=f"  {display_title}",
+                unit="%",
+                color="cyan",
+                leave=False,
+                autorefresh=True,
+                min_delta=0.1,
+            )
+            self.page_bars[page_id] = counter
+            return counter
 
     def update_page_progress(self, page_id: str, progress: int) -> None:
         """Update progress for a specific page."""
-        if page_id in self.page_bars:
-            # Clamp progress to valid range
-            progress = max(0, min(100, progress))
-            self.page_bars[page_id].update(progress - self.page_bars[page_id].count)
+        with self._lock:
+            counter = self.page_bars.get(page_id)
+            if counter is None:
+                return
+            # Clamp progress to valid range; unchanged values need no update
+            delta = max(0, min(100, progress)) - counter.count
+            if delta:
+                counter.update(delta)
 
     def complete_page(self, page_id: str) -> None:
         """Mark a page as completed."""
-        if page_id in self.page_bars:
-            self.page_bars[page_id].update(100 - self.page_bars[page_id].count)
-            self.page_bars[page_id].close()
-            del self.page_bars[page_id]
-
-        self.completed += 1
-        if self.overall_bar:
-            self.overall_bar.update(1)  # type: ignore[unreachable]
+        with self._lock:
+            if page_id in self.page_bars:
+                self.page_bars[page_id].update(100 - self.page_bars[page_id].count)
+                self.page_bars[page_id].close()
+                del self.page_bars[page_id]
+
+            self.completed += 1
+            if self.overall_bar:
+                self.overall_bar.update(1)  # type: ignore[unreachable]
 
     def close(self) -> None:
         """Close all progress bars and the manager."""
@@ -161,6 +161,41 @@ def get_cache_path() -> Path:
     return Path(get_adalflow_default_root_path()) / "wikicache"
 
 
+def get_cached_wikis(cache_dir: Path | None = None) -> list[dict]:
+    """Get cached wikis with the metadata parsed from their filenames.
+
+    Args:
+        cache_dir: Directory to scan (defaults to :func:`get_cache_path`)
+
+    Returns:
+        Wiki dictionaries sorted by name, then by version (descending)
+    """
+    from deepwiki_cli.infrastructure.storage.cache import iter_cache_files
+
+    wikis = []
+    for index, (cache_file, meta) in enumerate(
+        iter_cache_files(cache_dir or get_cache_path()),
+        start=1,
+    ):
+        name = meta.repo if meta.owner == "local" else f"{meta.owner}/{meta.repo}"
+        wikis.append(
+            {
+                "index": index,
+                "name": name,
+                "display_name": f"{name} (v{meta.version})",
+                "owner": meta.owner,
+                "repo": meta.repo,
+                "repo_type": meta.repo_type,
+                "language": meta.language,
+                "version": meta.version,
+                "path": cache_file,
+            },
+        )
+
+    wikis.sort(key=lambda x: (x["name"], -x["version"]))
+    return wikis
+
+
 def ensure_cache_dir() -> None:
     """Ensure the cache directory exists."""
     cache_dir = get_cache_path()
@@ -581,7 +616,7 @@ def select_wiki_from_list(
         sys.exit(1)
 
 
-def watch_manifest_cli(manifest: "ExportManifest") -> None:
+def watch_manifest_cli(manifest: "ExportManifest", *, pretty: bool = False) -> None:
     """Watch an editable workspace for Markdown changes."""
     import click
 
@@ -589,7 +624,7 @@ def watch_manifest_cli(manifest: "ExportManifest") -> None:
 
     click.echo("\nWatching for edits (press Ctrl+C to stop)...\n")
     try:
-        for summary in watch_workspace(manifest):
+        for summary in watch_workspace(manifest, pretty=pretty):
             updated = summary.get("updated", 0)
             timestamp = summary.get("timestamp") or datetime.now(tz=UTC).isoformat()
             click.echo(f"  ✓ Synced {updated} page(s) at {timestamp}")
@@ -142,6 +142,46 @@ class OpenRouterClient(ModelClient):
 
         raise ValueError(f"Unsupported model type: {model_type}")
 
+    @staticmethod
+    def cacheable_prompt_messages(
+        prompt: str,
+        breakpoints: Sequence[int],
+        model: str | None,
+    ) -> list[dict[str, Any]]:
+        """Build chat messages that let the provider cache prompt prefixes.
+
+        OpenAI and Gemini models on OpenRouter cache repeated prefixes
+        automatically, so only a single text message is needed. Anthropic models
+        require explicit ``cache_control`` breakpoints, which are placed after
+        each offset in ``breakpoints``.
+
+        Args:
+            prompt: Full prompt text.
+            breakpoints: Lengths of the prefixes of ``prompt`` that are shared
+                between requests, e.g. the system prompt and then the system
+                prompt plus file content.
+            model: OpenRouter model identifier, e.g. ``anthropic/claude-sonnet-4``.
+
+        Returns:
+            A single-message ``messages`` list for the chat completions API.
+        """
+        offsets = sorted({offset for offset in breakpoints if 0 < offset < len(prompt)})
+        if not model or not model.startswith("anthropic/") or not offsets:
+            return [{"role": "user", "content": prompt}]
+        blocks: list[dict[str, Any]] = []
+        start = 0
+        for offset in offsets:
+            blocks.append(
+                {
+                    "type": "text",
+                    "text": prompt[start:offset],
+                    "cache_control": {"type": "ephemeral"},
+                },
+            )
+            start = offset
+        blocks.append({"type": "text", "text": prompt[start:]})
+        return [{"role": "user", "content": blocks}]
+
     def call(
         self,
         api_kwargs: dict | None = None,
@@ -738,6 +778,9 @@ class OpenRouterClient(ModelClient):
         """Process a streaming response from OpenRouter."""
         try:
             log.info("Starting to process streaming response from OpenRouter")
+            # Checked once per stream; per-line debug logging is skipped
+            # entirely unless DEBUG is enabled.
+            debug_enabled = log.isEnabledFor(logging.DEBUG)
             buffer = ""
 
             for chunk in response.iter_content(chunk_size=1024, decode_unicode=True):
@@ -753,11 +796,13 @@ class OpenRouterClient(ModelClient):
                         if not line:
                             continue
 
-                        log.debug(f"Processing line: {line}")
+                        if debug_enabled:
+                            log.debug("Processing line: %s", line)
 
                         # Skip SSE comments (lines starting with :)
                         if line.startswith(":"):
-                            log.debug(f"Skipping SSE comment: {line}")
+                            if debug_enabled:
+                                log.debug("Skipping SSE comment: %s", line)
                             continue
 
                         if line.startswith("data: "):
@@ -770,7 +815,8 @@ class OpenRouterClient(ModelClient):
 
                             try:
                                 data_obj = json.loads(data)
-                                log.debug(f"Parsed JSON data: {data_obj}")
+                                if debug_enabled:
+                                    log.debug("Parsed JSON data: %s", data_obj)
 
                                 # Extract content from delta
                                 if (
@@ -785,19 +831,24 @@ class OpenRouterClient(ModelClient):
                                         and choice["delta"]["content"]
                                     ):
                                         content = choice["delta"]["content"]
-                                        log.debug(f"Yielding delta content: {content}")
+                                        if debug_enabled:
+                                            log.debug(
+                                                "Yielding delta content: %s", content
+                                            )
                                         yield content
                                     elif "text" in choice:
-                                        log.debug(
-                                            f"Yielding text content: {choice['text']}",
-                                        )
+                                        if debug_enabled:
+                                            log.debug(
+                                                "Yielding text content: %s",
+                                                choice["text"],
+                                            )
                                         yield choice["text"]
-                                    else:
+                                    elif debug_enabled:
                                         log.debug(
-                                            f"No content found in choice: {choice}",
+                                            "No content found in choice: %s", choice
                                         )
-                                else:
-                                    log.debug(f"No choices found in data: {data_obj}")
+                                elif debug_enabled:
+                                    log.debug("No choices found in data: %s", data_obj)
 
                             except json.JSONDecodeError:
                                 log.warning(f"Failed to parse SSE data: {data}")
@@ -817,6 +868,7 @@ class OpenRouterClient(ModelClient):
         buffer = ""
         try:
             log.info("Starting to process async streaming response from OpenRouter")
+            debug_enabled = log.isEnabledFor(logging.DEBUG)
             async for chunk in response.content:
                 try:
                     # Convert bytes to string and add to buffer
@@ -835,11 +887,13 @@ class OpenRouterClient(ModelClient):
                         if not line:
                             continue
 
-                        log.debug(f"Processing line: {line}")
+                        if debug_enabled:
+                            log.debug("Processing line: %s", line)
 
                         # Skip SSE comments (lines starting with :)
                         if line.startswith(":"):
-                            log.debug(f"Skipping SSE comment: {line}")
+                            if debug_enabled:
+                                log.debug("Skipping SSE comment: %s", line)
                             continue
 
                         if line.startswith("data: "):
@@ -852,7 +906,8 @@ class OpenRouterClient(ModelClient):
 
                             try:
                                 data_obj = json.loads(data)
-                                log.debug(f"Parsed JSON data: {data_obj}")
+                                if debug_enabled:
+                                    log.debug("Parsed JSON data: %s", data_obj)
 
                                 # Extract content from delta
                                 if (
@@ -867,19 +922,24 @@ class OpenRouterClient(ModelClient):
                                         and choice["delta"]["content"]
                                     ):
                                         content = choice["delta"]["content"]
-                                        log.debug(f"Yielding delta content: {content}")
+                                        if debug_enabled:
+                                            log.debug(
+                                                "Yielding delta content: %s", content
+                                            )
                                         yield content
                                     elif "text" in choice:
-                                        log.debug(
-                                            f"Yielding text content: {choice['text']}",
-                                        )
+                                        if debug_enabled:
+                                            log.debug(
+                                                "Yielding text content: %s",
+                                                choice["text"],
+                                            )
                                         yield choice["text"]
-                                    else:
+                                    elif debug_enabled:
                                         log.debug(
-                                            f"No content found in choice: {choice}",
+                                            "No content found in choice: %s", choice
                                         )
-                                else:
-                                    log.debug(f"No choices found in data: {data_obj}")
+                                elif debug_enabled:
+                                    log.debug("No choices found in data: %s", data_obj)
 
                             except json.JSONDecodeError:
                                 log.warning(f"Failed to parse SSE data: {data}")
@@ -1,5 +1,10 @@
 """Embedding infrastructure."""
 
+from deepwiki_cli.infrastructure.embedding.cached_embedder import (
+    CachedEmbedder,
+    EmbeddingStore,
+    get_embedding_store,
+)
 from deepwiki_cli.infrastructure.embedding.embedder import get_embedder
 from deepwiki_cli.infrastructure.embedding.lmstudio_patch import (
     LMStudioDocumentProcessor,
@@ -8,8 +13,11 @@ from deepwiki_cli.infrastructure.embedding.lmstudio_patch import (
 )
 
 __all__ = [
+    "CachedEmbedder",
+    "EmbeddingStore",
     "LMStudioDocumentProcessor",
     "LMStudioModelNotFoundError",
     "check_lmstudio_model_exists",
     "get_embedder",
+    "get_embedding_store",
 ]
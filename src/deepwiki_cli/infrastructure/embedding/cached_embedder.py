@@ -0,0 +1,240 @@
+"""Memoizing wrapper around query embedders with an optional on-disk store.
+
+Wiki generation re-embeds the same retrieval queries across pages (``"Contexts
+related to <file>"`` repeats verbatim). :class:`CachedEmbedder` keeps recent
+query vectors in an in-memory LRU so repeated queries skip the embedding API.
+Setting ``DEEPWIKI_EMBEDDING_CACHE`` also persists vectors to a bounded SQLite
+database under the adalflow root so they are reused across runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from adalflow.core.types import EmbedderOutput, Embedding
+from adalflow.utils import get_adalflow_default_root_path
+
+from deepwiki_cli.shared.env import is_truthy
+from deepwiki_cli.shared.structlog import structlog
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+logger = structlog.get_logger()
+
+DEFAULT_MEMORY_ENTRIES = 10_000
+DEFAULT_STORED_ENTRIES = 100_000
+
+
+def _persistence_enabled() -> bool:
+    return is_truthy(os.environ.get("DEEPWIKI_EMBEDDING_CACHE"))
+
+
+def _store_path() -> Path:
+    override = os.environ.get("DEEPWIKI_EMBEDDING_CACHE_PATH")
+    if override:
+        return Path(override).expanduser()
+    return (
+        Path(get_adalflow_default_root_path()) / "embeddings" / "query_vectors.sqlite"
+    )
+
+
+class EmbeddingStore:
+    """SQLite-backed ``key -> float32 vector`` store.
+
+    The connection is opened lazily on first use. Vectors are written in one
+    transaction per batch, and the oldest rows beyond ``max_entries`` are
+    dropped on write. Any SQLite or filesystem error disables the store for
+    the rest of the process so embedding never fails because of the cache.
+
+    Args:
+        path: SQLite database file.
+        max_entries: Maximum number of vectors kept on disk.
+    """
+
+    def __init__(self, path: Path, max_entries: int = DEFAULT_STORED_ENTRIES) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self._connection: sqlite3.Connection | None = None
+        self._disabled = False
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._disabled:
+            return None
+        if self._connection is None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(
+                    str(self.path),
+                    check_same_thread=False,
+                )
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings "
+                    "(key BLOB PRIMARY KEY, vec BLOB NOT NULL)",
+                )
+                self._connection = connection
+            except (OSError, sqlite3.Error) as exc:
+                self._disable(exc)
+                return None
+        return self._connection
+
+    def _disable(self, exc: Exception) -> None:
+        logger.warning(
+            f"Embedding cache store unavailable, continuing in memory: {exc}",
+            operation="embedding_cache",
+            status="warning",
+            path=str(self.path),
+        )
+        self._disabled = True
+        self._connection = None
+
+    def get(self, key: bytes) -> list[float] | None:
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return None
+            try:
+                row = connection.execute(
+                    "SELECT vec FROM embeddings WHERE key = ?",
+                    (key,),
+                ).fetchone()
+            except sqlite3.Error as exc:
+                self._disable(exc)
+                return None
+        if row is None:
+            return None
+        return array("f", row[0]).tolist()
+
+    def put_many(self, items: Iterable[tuple[bytes, Sequence[float]]]) -> None:
+        rows = [(key, array("f", vector).tobytes()) for key, vector in items]
+        if not rows:
+            return
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, vec) VALUES (?, ?)",
+                        rows,
+                    )
+                    # Rowids grow with every write, so this keeps the newest
+                    # max_entries vectors
+                    connection.execute(
+                        "DELETE FROM embeddings "
+                        "WHERE rowid <= (SELECT MAX(rowid) FROM embeddings) - ?",
+                        (self.max_entries,),
+                    )
+            except sqlite3.Error as exc:
+                self._disable(exc)
+
+
+_shared_store: EmbeddingStore | None = None
+_shared_store_lock = threading.Lock()
+
+
+def get_embedding_store() -> EmbeddingStore | None:
+    """Return the process-wide embedding store, or None when disabled."""
+    global _shared_store  # noqa: PLW0603
+    if not _persistence_enabled():
+        return None
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = EmbeddingStore(_store_path())
+        return _shared_store
+
+
+class CachedEmbedder:
+    r"""Callable embedder wrapper that memoizes embeddings per text.
+
+    Keys are ``sha256(namespace + "\0" + text)`` where ``namespace`` identifies
+    the embedder type, model and its kwargs, so vectors from different models
+    never collide.
+
+    Args:
+        embedder: Underlying embedder callable returning an ``EmbedderOutput``.
+        namespace: Identifier of the embedding model configuration.
+        store: Optional persistent store shared across runs.
+        max_entries: Maximum number of vectors kept in memory.
+    """
+
+    def __init__(
+        self,
+        embedder: Callable[..., Any],
+        namespace: str,
+        store: EmbeddingStore | None = None,
+        max_entries: int = DEFAULT_MEMORY_ENTRIES,
+    ) -> None:
+        self._embedder = embedder
+        self.namespace = namespace
+        self._store = store
+        self._max_entries = max_entries
+        self._memory: OrderedDict[bytes, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.sha256(f"{self.namespace}\0{text}".encode()).digest()
+
+    def _lookup(self, key: bytes) -> list[float] | None:
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                return vector
+        if self._store is None:
+            return None
+        vector = self._store.get(key)
+        if vector is not None:
+            self._remember(key, vector)
+        return vector
+
+    def _remember(self, key: bytes, vector: list[float]) -> None:
+        with self._lock:
+            self._memory[key] = vector
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._max_entries:
+                self._memory.popitem(last=False)
+
+    def __call__(self, input: str | Sequence[str] | None = None, **kwargs: Any) -> Any:
+        """Embed ``input``, serving cached vectors when every text is known."""
+        if input is None or kwargs:
+            return self._embedder(input, **kwargs)
+
+        texts = [input] if isinstance(input, str) else list(input)
+        keys = [self._key(text) for text in texts]
+        cached = [self._lookup(key) for key in keys]
+        if texts and all(vector is not None for vector in cached):
+            return EmbedderOutput(
+                data=[
+                    Embedding(embedding=vector, index=index)
+                    for index, vector in enumerate(cached)
+                ],
+            )
+
+        result = self._embedder(input)
+        data = getattr(result, "data", None)
+        if getattr(result, "error", None) or not data or len(data) != len(texts):
+            return result
+        fresh: list[tuple[bytes, list[float]]] = []
+        for key, item in zip(keys, data, strict=True):
+            vector = getattr(item, "embedding", None)
+            if vector is None:
+                continue
+            vector_list = vector.tolist() if hasattr(vector, "tolist") else list(vector)
+            self._remember(key, vector_list)
+            fresh.append((key, vector_list))
+        if self._store is not None:
+            self._store.put_many(fresh)
+        return result
+
+
+__all__ = ["CachedEmbedder", "EmbeddingStore", "get_embedding_store"]
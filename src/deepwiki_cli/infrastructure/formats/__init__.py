@@ -7,7 +7,9 @@ from deepwiki_cli.infrastructure.formats.format_converter import (
 )
 from deepwiki_cli.infrastructure.formats.json_compact import (
     from_compact_json,
+    read_json_file,
     to_compact_json,
+    to_json_bytes,
 )
 from deepwiki_cli.infrastructure.formats.toon_adapter import (
     ToonAdapter,
@@ -21,5 +23,7 @@ __all__ = [
     "ToonAdapter",
     "ToonAdapterError",
     "from_compact_json",
+    "read_json_file",
     "to_compact_json",
+    "to_json_bytes",
 ]
@@ -1,18 +1,39 @@
 """Utilities for working with compact JSON payloads.
 
-The functions here intentionally avoid third-party dependencies so they can be
-used from both the domain layer (via ``model_dump_json``) and infrastructure
-components (model clients, adapters, etc.).
+The functions here only need the standard library so they can be used from
+both the domain layer (via ``model_dump_json``) and infrastructure components
+(model clients, adapters, etc.). When ``orjson`` is installed it is used for
+the common case, with the standard library as the fallback.
 """
 
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 def to_compact_json(data: Any, *, sort_keys: bool = False) -> str:
     """Return a minified JSON string using separators without extra whitespace."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_SORT_KEYS if sort_keys else 0,
+            ).decode()
+        except TypeError:
+            # Non-string keys, integers beyond 64 bits and other values orjson
+            # refuses are left to the standard library encoder.
+            pass
     return json.dumps(
         data,
         separators=(",", ":"),
@@ -21,6 +42,37 @@ def to_compact_json(data: Any, *, sort_keys: bool = False) -> str:
     )
 
 
+def to_json_bytes(data: Any, *, indent: bool = False) -> bytes:
+    """Return UTF-8 encoded JSON, optionally indented by two spaces.
+
+    Encoding straight to bytes avoids building a ``str`` that is only encoded
+    again when written to a file.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode()
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
 def from_compact_json(payload: str) -> Any:
     """Deserialize compact JSON content back into Python structures."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def read_json_file(path: Path) -> Any:
+    """Parse a JSON file straight from its bytes.
+
+    Skips decoding the file into an intermediate ``str``, which matters for
+    multi-megabyte wiki caches. Raises ``OSError`` when the file cannot be
+    read and ``json.JSONDecodeError`` for invalid content.
+    """
+    payload = path.read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
     return json.loads(payload)
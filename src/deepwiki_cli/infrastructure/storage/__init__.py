@@ -4,9 +4,12 @@ from deepwiki_cli.infrastructure.storage.cache import (
     CACHE_FILENAME_PREFIX,
     DEFAULT_LANGUAGE,
     CacheFileInfo,
+    CacheMeta,
     get_cache_filename,
+    iter_cache_files,
     list_existing_wikis,
     parse_cache_filename,
+    parse_cache_name,
 )
 from deepwiki_cli.infrastructure.storage.workspace import (
     MANIFEST_FILENAME,
@@ -26,14 +29,17 @@ __all__ = [
     "DEFAULT_LANGUAGE",
     "MANIFEST_FILENAME",
     "CacheFileInfo",
+    "CacheMeta",
     "ExportManifest",
     "ExportedPage",
     "encode_marker",
     "export_markdown_workspace",
     "get_cache_filename",
+    "iter_cache_files",
     "list_existing_wikis",
     "list_manifests",
     "parse_cache_filename",
+    "parse_cache_name",
     "slugify",
     "sync_manifest",
     "watch_workspace",
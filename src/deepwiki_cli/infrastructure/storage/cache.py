@@ -5,10 +5,11 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Iterator
 
 CACHE_FILENAME_PREFIX = "deepwiki_cache_"
 DEFAULT_LANGUAGE = "en"
@@ -65,19 +66,30 @@ def get_cache_filename(
     return f"{filename}.json"
 
 
+class CacheMeta(NamedTuple):
+    """Metadata encoded in a cache filename."""
+
+    repo_type: str
+    owner: str
+    repo: str
+    language: str
+    version: int
+
+
 def _parse_version_token(token: str) -> int | None:
     if token and token.startswith("v") and token[1:].isdigit():
         return int(token[1:])
     return None
 
 
-def parse_cache_filename(path: Path) -> dict[str, str] | None:
-    """Extract metadata from a cache filename."""
-    name = path.stem
-    if not name.startswith(CACHE_FILENAME_PREFIX):
+def parse_cache_name(name: str) -> CacheMeta | None:
+    """Extract metadata from a cache file name such as ``entry.name``."""
+    dot = name.rfind(".")
+    stem = name[:dot] if 0 < dot < len(name) - 1 else name
+    if not stem.startswith(CACHE_FILENAME_PREFIX):
         return None
 
-    payload = name[len(CACHE_FILENAME_PREFIX) :]
+    payload = stem[len(CACHE_FILENAME_PREFIX) :]
     parts = payload.split("_")
     if len(parts) < 4:
         return None
@@ -91,18 +103,41 @@ def parse_cache_filename(path: Path) -> dict[str, str] | None:
     if len(parts) < 4:
         return None
 
-    language = parts[-1]
-    repo_type = parts[0]
-    owner = parts[1]
-    repo = "_".join(parts[2:-1])
+    return CacheMeta(
+        repo_type=parts[0],
+        owner=parts[1],
+        repo="_".join(parts[2:-1]),
+        language=parts[-1],
+        version=version,
+    )
+
 
-    return {
-        "repo_type": repo_type,
-        "owner": owner,
-        "repo": repo,
-        "language": language,
-        "version": str(version),
-    }
+def parse_cache_filename(path: Path) -> dict[str, str] | None:
+    """Extract metadata from a cache filename."""
+    meta = parse_cache_name(path.name)
+    if meta is None:
+        return None
+    return {**meta._asdict(), "version": str(meta.version)}
+
+
+def iter_cache_files(cache_dir: Path) -> Iterator[tuple[Path, CacheMeta]]:
+    """Yield every cache file in ``cache_dir`` with its filename metadata.
+
+    A single ``os.scandir`` pass with a prefix check replaces globbing, so
+    listing stays cheap for directories holding many wikis.
+    """
+    try:
+        entries = os.scandir(cache_dir)
+    except FileNotFoundError:
+        return
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith(CACHE_FILENAME_PREFIX) and name.endswith(".json")):
+                continue
+            meta = parse_cache_name(name)
+            if meta is not None:
+                yield Path(entry.path), meta
 
 
 def list_existing_wikis(
@@ -112,29 +147,25 @@ def list_existing_wikis(
     repo_name: str,
 ) -> list[CacheFileInfo]:
     """Return cache files for a specific repository (all versions)."""
-    if not cache_dir.exists():
-        return []
-
     safe_type = _sanitize_component(repo_type or "github")
     safe_owner = _sanitize_component(owner or "local")
     safe_repo = _sanitize_component(repo_name)
 
-    pattern = f"{CACHE_FILENAME_PREFIX}{safe_type}_{safe_owner}_{safe_repo}_*.json"
+    prefix = f"{CACHE_FILENAME_PREFIX}{safe_type}_{safe_owner}_{safe_repo}_"
 
     entries: list[CacheFileInfo] = []
-    for path in cache_dir.glob(pattern):
-        meta = parse_cache_filename(path)
-        if not meta:
+    for path, meta in iter_cache_files(cache_dir):
+        if not path.name.startswith(prefix):
             continue
         stats = path.stat()
         entries.append(
             CacheFileInfo(
                 path=path,
-                repo_type=meta["repo_type"],
-                owner=meta["owner"],
-                repo=meta["repo"],
-                language=meta["language"],
-                version=int(meta["version"]),
+                repo_type=meta.repo_type,
+                owner=meta.owner,
+                repo=meta.repo,
+                language=meta.language,
+                version=meta.version,
                 modified=datetime.fromtimestamp(stats.st_mtime, tz=UTC),
                 size=stats.st_size,
             ),
@@ -148,9 +179,12 @@ __all__ = [
     "CACHE_FILENAME_PREFIX",
     "DEFAULT_LANGUAGE",
     "CacheFileInfo",
+    "CacheMeta",
     "get_cache_filename",
+    "iter_cache_files",
     "list_existing_wikis",
     "parse_cache_filename",
+    "parse_cache_name",
 ]
 
 
@@ -11,6 +11,10 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
+from deepwiki_cli.infrastructure.formats.json_compact import (
+    read_json_file,
+    to_json_bytes,
+)
 from deepwiki_cli.shared.structlog import structlog
 from watchfiles import watch
 
@@ -456,8 +460,13 @@ def sync_manifest(
     manifest: ExportManifest,
     *,
     changed_paths: set[Path] | None = None,
+    pretty: bool = False,
 ) -> dict[str, object]:
-    """Apply edits from the workspace back to the cache file."""
+    """Apply edits from the workspace back to the cache file.
+
+    The cache is rewritten as compact JSON, or indented when ``pretty`` is
+    set, matching ``deepwiki generate --pretty``.
+    """
     cache_path = Path(manifest.cache_file)
     if not cache_path.exists():
         raise FileNotFoundError(f"Cache file not found: {cache_path}")
@@ -484,7 +493,7 @@ def sync_manifest(
     if not updates:
         return {"updated": 0, "timestamp": manifest.last_synced}
 
-    data = json.loads(cache_path.read_text(encoding="utf-8"))
+    data = read_json_file(cache_path)
     generated = data.get("generated_pages", {})
     structure_pages = data.get("wiki_structure", {}).get("pages", [])
 
@@ -507,7 +516,7 @@ def sync_manifest(
         data["wiki_structure"]["pages"] = structure_pages
     data["updated_at"] = timestamp
 
-    cache_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    cache_path.write_bytes(to_json_bytes(data, indent=pretty))
     manifest.last_synced = timestamp
     manifest.save()
 
@@ -535,7 +544,7 @@ def list_manifests(base_dir: Path) -> list[ExportManifest]:
     return sorted(manifests, key=lambda m: (m.repo_display, m.version), reverse=True)
 
 
-def watch_workspace(manifest: ExportManifest):
+def watch_workspace(manifest: ExportManifest, *, pretty: bool = False):
     """Yield sync summaries whenever markdown files change."""
     targets = [path for path in manifest.watch_targets() if path.exists()]
     if not targets:
@@ -551,6 +560,6 @@ def watch_workspace(manifest: ExportManifest):
         }
         if not changed_files:
             continue
-        yield sync_manifest(manifest, changed_paths=changed_files)
+        yield sync_manifest(manifest, changed_paths=changed_files, pretty=pretty)
 
 
@@ -266,7 +266,9 @@ def count_tokens(
             embedder_type = get_embedder_type()
 
         encoding = _get_encoding(embedder_type)
-        return len(encoding.encode(text))
+        # encode_ordinary skips the scan for special tokens, which encode runs
+        # over the whole text only to reject them
+        return len(encoding.encode_ordinary(text))
     except Exception as e:
         # Fallback to a simple approximation if tiktoken fails
         logger.warning(
@@ -1,6 +1,9 @@
+import copy
+import json
 import math
+import re
 import weakref
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from typing import Any, ClassVar
 from uuid import uuid4
@@ -9,6 +12,10 @@ import adalflow as adal
 from deepwiki_cli.shared.structlog import structlog
 
 from deepwiki_cli.domain.schemas import RAGContextSchema, RAGDocumentSchema
+from deepwiki_cli.infrastructure.embedding.cached_embedder import (
+    CachedEmbedder,
+    get_embedding_store,
+)
 from deepwiki_cli.infrastructure.embedding.embedder import get_embedder
 from deepwiki_cli.infrastructure.prompts.builders import (
     RAG_SYSTEM_PROMPT,
@@ -52,6 +59,7 @@ from adalflow.components.retriever.faiss_retriever import FAISSRetriever
 
 from deepwiki_cli.infrastructure.config import configs, get_embedder_config
 from deepwiki_cli.services.data_pipeline import DatabaseManager, count_tokens
+from deepwiki_cli.services.rag_cache import ProximityCache
 
 logger = structlog.get_logger()
 
@@ -83,6 +91,33 @@ def _normalize_vector(vector: Sequence[float]) -> list[float]:
     return [component / length for component in vector]
 
 
+_TRAILING_WHITESPACE_RE = re.compile(r"[ \t]+$", re.MULTILINE)
+_BLANK_LINE_RUN_RE = re.compile(r"\n{3,}")
+
+
+def compact_chunk_text(text: str) -> str:
+    """Normalize whitespace in a retrieved chunk before it enters a prompt.
+
+    Removes byte order marks, carriage returns and trailing whitespace, and
+    collapses runs of blank lines into one. Leading indentation is kept
+    because it is significant in source code.
+    """
+    text = text.replace("\ufeff", "").replace("\r\n", "\n")
+    text = _TRAILING_WHITESPACE_RE.sub("", text)
+    return _BLANK_LINE_RUN_RE.sub("\n\n", text)
+
+
+def _first_occurrences(texts: Iterable[str]) -> list[int]:
+    """Return the positions of the first occurrence of each distinct text."""
+    seen: set[str] = set()
+    positions: list[int] = []
+    for position, text in enumerate(texts):
+        if text not in seen:
+            seen.add(text)
+            positions.append(position)
+    return positions
+
+
 class Memory(adal.core.component.DataComponent):
     """Simple conversation management with a list of dialog turns."""
 
@@ -258,6 +293,7 @@ class RAG(adal.Component):
         # Initialize components
         self.memory = Memory()
         self.embedder = get_embedder(embedder_type=self.embedder_type)
+        self.retrieval_cache = ProximityCache()
 
         self_weakref = weakref.ref(self)
 
@@ -283,9 +319,17 @@ class RAG(adal.Component):
                 query = f"Represent this query for searching relevant code: {query}"
             return instance.embedder(input=query)
 
-        # Use single string embedder for LM Studio, regular embedder for others
-        self.query_embedder = (
-            single_string_embedder if self.is_lmstudio_embedder else self.embedder
+        # Use single string embedder for LM Studio, regular embedder for others.
+        # Query embeddings are memoized (in memory and on disk) because wiki
+        # generation repeats the same retrieval queries across pages and runs.
+        embedder_config = get_embedder_config() or {}
+        self.query_embedder = CachedEmbedder(
+            single_string_embedder if self.is_lmstudio_embedder else self.embedder,
+            namespace=(
+                f"{self.embedder_type}:"
+                f"{json.dumps(embedder_config.get('model_kwargs', {}), sort_keys=True)}"
+            ),
+            store=get_embedding_store(),
         )
 
         self.initialize_db_manager()
@@ -359,7 +403,7 @@ IMPORTANT FORMATTING RULES:
                 RAGDocumentSchema(
                     document_id=meta.get("doc_id") or f"doc-{index}",
                     file_path=meta.get("file_path", "unknown"),
-                    content=getattr(doc, "text", ""),
+                    content=compact_chunk_text(getattr(doc, "text", "")),
                     score=getattr(doc, "score", None),
                     metadata=meta or None,
                 ),
@@ -679,6 +723,7 @@ IMPORTANT FORMATTING RULES:
         token_to_use = access_token or GITHUB_TOKEN
 
         self.initialize_db_manager()
+        self.retrieval_cache.clear()
         self.repo_url_or_path = repo_url_or_path
         forced_rebuild = force_rebuild
         doc_kwargs = {
@@ -731,10 +776,8 @@ IMPORTANT FORMATTING RULES:
             f"Using {len(self.transformed_docs)} documents with valid embeddings for retrieval",
         )
 
-        # Use the appropriate embedder for retrieval
-        retrieve_embedder = (
-            self.query_embedder if self.is_lmstudio_embedder else self.embedder
-        )
+        # Use the (cached) query embedder for retrieval
+        retrieve_embedder = self.query_embedder
 
         # Filter out documents with invalid vectors and ensure vectors are Python lists
         # FAISSRetriever expects Python lists, not numpy arrays
@@ -878,6 +921,27 @@ IMPORTANT FORMATTING RULES:
         )
         logger.info("FAISS retriever created successfully")
 
+    def embed_query(self, query: str, *, truncate: bool = True) -> Any:
+        """Embed a query with the (memoized) query embedder.
+
+        Args:
+            query: Query text.
+            truncate: Truncate the query to ``MAX_INPUT_TOKENS`` first. Pass
+                False when the caller already truncated it.
+
+        Returns:
+            The query embedding as returned by the embedder.
+        """
+        if truncate:
+            query = self._truncate_query_by_tokens(query, MAX_INPUT_TOKENS)
+        query_embedding_result = self.query_embedder(query)
+        # Handle both single string embedder and regular embedder responses
+        if hasattr(query_embedding_result, "data") and query_embedding_result.data:
+            return query_embedding_result.data[0].embedding
+        if isinstance(query_embedding_result, list) and len(query_embedding_result) > 0:
+            return query_embedding_result[0]
+        return query_embedding_result
+
     def call(self, query: str) -> list:
         """Process a query using RAG.
 
@@ -917,23 +981,11 @@ IMPORTANT FORMATTING RULES:
 
             # Validate embedding dimension before querying
             # This prevents FAISS assertion errors when dimensions don't match
+            query_embedding = None
             if hasattr(self, "retriever") and self.retriever is not None:
                 # Get query embedding to check dimension
                 try:
-                    query_embedding_result = self.query_embedder(query)
-                    # Handle both single string embedder and regular embedder responses
-                    if (
-                        hasattr(query_embedding_result, "data")
-                        and query_embedding_result.data
-                    ):
-                        query_embedding = query_embedding_result.data[0].embedding
-                    elif (
-                        isinstance(query_embedding_result, list)
-                        and len(query_embedding_result) > 0
-                    ):
-                        query_embedding = query_embedding_result[0]
-                    else:
-                        query_embedding = query_embedding_result
+                    query_embedding = self.embed_query(query, truncate=False)
 
                     # Get embedding dimension
                     if isinstance(query_embedding, list):
@@ -1002,13 +1054,47 @@ IMPORTANT FORMATTING RULES:
                     )
                     # Continue anyway - FAISS will raise its own error if dimensions don't match
 
-            retrieved_documents = self.retriever(query)
-
-            # Fill in the documents
-            retrieved_documents[0].documents = [
-                self.transformed_docs[doc_index]
-                for doc_index in retrieved_documents[0].doc_indices
-            ]
+            cached_output = (
+                self.retrieval_cache.get(query_embedding)
+                if query_embedding is not None
+                else None
+            )
+            if cached_output is not None:
+                logger.info(
+                    "RAG retrieval served from semantic cache",
+                    operation="rag_call",
+                    status="cache_hit",
+                    cache_size=len(self.retrieval_cache),
+                )
+                retrieved_documents = [copy.copy(cached_output)]
+            else:
+                retrieved_documents = self.retriever(query)
+                output = retrieved_documents[0]
+
+                # Fill in the documents, dropping chunks whose text repeats an
+                # earlier hit (shared headers, vendored copies) so the prompt
+                # does not carry the same content twice
+                documents = [
+                    self.transformed_docs[doc_index] for doc_index in output.doc_indices
+                ]
+                keep = _first_occurrences(doc.text for doc in documents)
+                if len(keep) < len(documents):
+                    logger.debug(
+                        "Dropped duplicate retrieved documents",
+                        operation="rag_call",
+                        retrieved=len(documents),
+                        kept=len(keep),
+                    )
+                    output.doc_indices = [output.doc_indices[i] for i in keep]
+                    if output.doc_scores is not None:
+                        output.doc_scores = [output.doc_scores[i] for i in keep]
+                    documents = [documents[i] for i in keep]
+                output.documents = documents
+                if query_embedding is not None:
+                    self.retrieval_cache.put(
+                        query_embedding,
+                        copy.copy(retrieved_documents[0]),
+                    )
 
             context_schema = self._build_context_schema(
                 query,
@@ -0,0 +1,176 @@
+"""Approximate (semantic) cache for RAG retrieval results.
+
+Wiki generation issues many near-identical retrieval queries (for example
+``"Contexts related to <file>"`` for every page touching the same file). The
+:class:`ProximityCache` keys retrieval results on the query embedding and
+returns a cached result when a previously seen query lies within a cosine
+distance threshold, skipping the ANN search entirely.
+
+The retrieval cache is opt-in: set ``DEEPWIKI_RAG_CACHE_SIZE`` to a positive
+capacity to enable it. Page prompts share a large fixed template, so whole
+prompts from different pages can embed within the threshold of each other.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from deepwiki_cli.shared.structlog import structlog
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+logger = structlog.get_logger()
+
+DEFAULT_CACHE_CAPACITY = 0
+DEFAULT_DISTANCE_THRESHOLD = 0.05
+
+
+def _read_env_number(var_name: str, default: float) -> float:
+    value = os.environ.get(var_name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(
+            f"Invalid numeric value for {var_name}: {value}. Using default {default}.",
+            operation="rag_cache_config",
+            status="warning",
+        )
+        return default
+
+
+RAG_CACHE_CAPACITY = int(
+    _read_env_number("DEEPWIKI_RAG_CACHE_SIZE", DEFAULT_CACHE_CAPACITY),
+)
+RAG_CACHE_THRESHOLD = _read_env_number(
+    "DEEPWIKI_RAG_CACHE_THRESHOLD",
+    DEFAULT_DISTANCE_THRESHOLD,
+)
+
+
+def _as_unit_vector(embedding: Sequence[float] | np.ndarray) -> np.ndarray | None:
+    """Return a float32 unit vector, or None when the embedding is unusable."""
+    try:
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+    except (TypeError, ValueError):
+        return None
+    norm = float(np.linalg.norm(vector))
+    if vector.size == 0 or norm == 0.0:
+        return None
+    return vector / norm
+
+
+class ProximityCache:
+    """LRU key-value cache matched by cosine distance between embeddings.
+
+    Keys are stored as unit vectors in a contiguous ``(N, d)`` matrix so a
+    lookup is a single matrix-vector product followed by ``argmax``.
+
+    Example:
+        >>> cache = ProximityCache(capacity=2, threshold=0.05)
+        >>> cache.put([1.0, 0.0], "docs")
+        >>> cache.get([0.999, 0.01])
+        'docs'
+    """
+
+    def __init__(
+        self,
+        capacity: int = RAG_CACHE_CAPACITY,
+        threshold: float = RAG_CACHE_THRESHOLD,
+    ) -> None:
+        self.capacity = max(0, capacity)
+        self.threshold = threshold
+        self._keys: np.ndarray | None = None
+        self._values: list[Any] = []
+        self._last_used: list[int] = []
+        self._clock = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._values)
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def get(self, embedding: Sequence[float] | np.ndarray) -> Any | None:
+        """Return the cached value closest to ``embedding`` within the threshold.
+
+        Args:
+            embedding: Query embedding.
+
+        Returns:
+            The cached value on a hit, otherwise None.
+        """
+        query = _as_unit_vector(embedding)
+        with self._lock:
+            if (
+                query is None
+                or self._keys is None
+                or self._keys.shape[1] != query.shape[0]
+            ):
+                self.misses += 1
+                return None
+            similarities = self._keys @ query
+            best = int(np.argmax(similarities))
+            if 1.0 - float(similarities[best]) > self.threshold:
+                self.misses += 1
+                return None
+            self._last_used[best] = self._tick()
+            self.hits += 1
+            return self._values[best]
+
+    def put(self, embedding: Sequence[float] | np.ndarray, value: Any) -> None:
+        """Store ``value`` under ``embedding``, evicting the LRU entry when full.
+
+        Args:
+            embedding: Query embedding used as the key.
+            value: Retrieval result to cache.
+        """
+        if self.capacity == 0:
+            return
+        key = _as_unit_vector(embedding)
+        if key is None:
+            return
+        with self._lock:
+            if self._keys is None or self._keys.shape[1] != key.shape[0]:
+                # Embedding dimension changed (e.g. new embedder); start over.
+                self._keys = key[np.newaxis, :]
+                self._values = [value]
+                self._last_used = [self._tick()]
+                return
+            if len(self._values) >= self.capacity:
+                victim = min(
+                    range(len(self._last_used)),
+                    key=self._last_used.__getitem__,
+                )
+                self._keys[victim] = key
+                self._values[victim] = value
+                self._last_used[victim] = self._tick()
+                return
+            self._keys = np.vstack([self._keys, key])
+            self._values.append(value)
+            self._last_used.append(self._tick())
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._keys = None
+            self._values = []
+            self._last_used = []
+
+
+__all__ = [
+    "RAG_CACHE_CAPACITY",
+    "RAG_CACHE_THRESHOLD",
+    "ProximityCache",
+]
@@ -0,0 +1,162 @@
+"""Proactive request and token rate limiting for model calls.
+
+Pages are generated concurrently, so bursts of requests can exceed a
+provider's requests-per-minute (RPM) or tokens-per-minute (TPM) quota and
+come back as 429/503 errors that are then retried. :class:`RateLimiter` keeps
+a token bucket for requests and one for prompt tokens and makes callers wait
+for capacity before a call is sent instead.
+
+Limits are opt-in through ``DEEPWIKI_RATE_LIMIT_RPM`` and
+``DEEPWIKI_RATE_LIMIT_TPM``; unset or ``0`` disables the respective bucket.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from deepwiki_cli.shared.structlog import structlog
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = structlog.get_logger()
+
+PENALTY_FACTOR = 0.8
+PENALTY_SECONDS = 60.0
+
+
+def _read_limit(var_name: str) -> float:
+    value = os.environ.get(var_name)
+    if not value:
+        return 0.0
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        logger.warning(
+            f"Invalid numeric value for {var_name}: {value}. Rate limit disabled.",
+            operation="rate_limit_config",
+            status="warning",
+        )
+        return 0.0
+
+
+class RateLimiter:
+    """Token buckets for requests and prompt tokens per minute.
+
+    Each bucket starts full and refills continuously at its per-minute rate.
+    After :meth:`penalize` the refill rate drops to ``PENALTY_FACTOR`` of the
+    configured rate for ``PENALTY_SECONDS``.
+
+    Args:
+        requests_per_minute: Request budget per minute, ``0`` for no limit.
+        tokens_per_minute: Prompt token budget per minute, ``0`` for no limit.
+        clock: Monotonic time source in seconds.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 0.0,
+        tokens_per_minute: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._clock = clock
+        self._requests = requests_per_minute
+        self._tokens = tokens_per_minute
+        self._updated_at = clock()
+        self._penalty_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def limits_tokens(self) -> bool:
+        """Whether callers need to pass prompt token counts to :meth:`acquire`."""
+        return self.tokens_per_minute > 0
+
+    def _refill(self, now: float) -> float:
+        """Refill both buckets up to ``now`` and return the current rate scale."""
+        scale = PENALTY_FACTOR if now < self._penalty_until else 1.0
+        elapsed_minutes = max(now - self._updated_at, 0.0) / 60.0
+        self._updated_at = now
+        if self.requests_per_minute > 0:
+            self._requests = min(
+                self._requests + elapsed_minutes * self.requests_per_minute * scale,
+                self.requests_per_minute,
+            )
+        if self.tokens_per_minute > 0:
+            self._tokens = min(
+                self._tokens + elapsed_minutes * self.tokens_per_minute * scale,
+                self.tokens_per_minute,
+            )
+        return scale
+
+    def try_acquire(self, tokens: int = 0) -> float:
+        """Take capacity for one request if available.
+
+        Args:
+            tokens: Prompt tokens the request will use. Requests larger than
+                the whole TPM budget only wait for a full bucket.
+
+        Returns:
+            ``0.0`` when capacity was taken, otherwise the seconds to wait
+            before trying again.
+        """
+        with self._lock:
+            scale = self._refill(self._clock())
+            needed_tokens = min(float(tokens), self.tokens_per_minute)
+            wait = 0.0
+            if self.requests_per_minute > 0 and self._requests < 1.0:
+                wait = (
+                    (1.0 - self._requests) * 60.0 / (self.requests_per_minute * scale)
+                )
+            if self.tokens_per_minute > 0 and self._tokens < needed_tokens:
+                wait = max(
+                    wait,
+                    (needed_tokens - self._tokens)
+                    * 60.0
+                    / (self.tokens_per_minute * scale),
+                )
+            if wait > 0:
+                return wait
+            if self.requests_per_minute > 0:
+                self._requests -= 1.0
+            if self.tokens_per_minute > 0:
+                self._tokens -= needed_tokens
+            return 0.0
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until one request using ``tokens`` prompt tokens may be sent."""
+        while (wait := self.try_acquire(tokens)) > 0:
+            await asyncio.sleep(wait)
+
+    def penalize(self) -> None:
+        """Slow the refill rate after the provider reported overload."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._penalty_until = now + PENALTY_SECONDS
+
+
+_limiters: dict[tuple[str, str | None], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, model: str | None) -> RateLimiter | None:
+    """Return the shared limiter for ``(provider, model)``, or None if disabled."""
+    requests_per_minute = _read_limit("DEEPWIKI_RATE_LIMIT_RPM")
+    tokens_per_minute = _read_limit("DEEPWIKI_RATE_LIMIT_TPM")
+    if requests_per_minute <= 0 and tokens_per_minute <= 0:
+        return None
+    with _limiters_lock:
+        limiter = _limiters.get((provider, model))
+        if limiter is None:
+            limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+            _limiters[(provider, model)] = limiter
+        return limiter
+
+
+__all__ = ["RateLimiter", "get_rate_limiter"]
@@ -0,0 +1,19 @@
+"""Helpers for reading feature flags from environment variables."""
+
+from __future__ import annotations
+
+TRUTHY_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
+def is_truthy(value: str | None) -> bool:
+    """Return whether an environment variable value enables a flag.
+
+    Args:
+        value: Raw variable value, or None when the variable is unset.
+
+    Returns:
+        True for ``1``, ``true``, ``yes`` or ``on`` in any case.
+    """
+    if value is None:
+        return False
+    return value.lower() in TRUTHY_VALUES
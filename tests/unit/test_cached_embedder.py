@@ -0,0 +1,90 @@
+"""Tests for the memoizing query embedder wrapper."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from adalflow.core.types import EmbedderOutput, Embedding
+
+from deepwiki_cli.infrastructure.embedding.cached_embedder import (
+    CachedEmbedder,
+    EmbeddingStore,
+    get_embedding_store,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class CountingEmbedder:
+    """Embedder stub returning deterministic vectors and counting calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, input: str | list[str]) -> EmbedderOutput:
+        self.calls += 1
+        texts = [input] if isinstance(input, str) else input
+        return EmbedderOutput(
+            data=[
+                Embedding(embedding=[float(len(text)), 1.0], index=i)
+                for i, text in enumerate(texts)
+            ],
+        )
+
+
+@pytest.mark.unit
+def test_repeated_query_is_served_from_memory() -> None:
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(inner, namespace="openai:test")
+
+    first = embedder("Contexts related to src/app.py")
+    second = embedder("Contexts related to src/app.py")
+
+    assert inner.calls == 1
+    assert second.data[0].embedding == first.data[0].embedding
+
+
+@pytest.mark.unit
+def test_vectors_persist_across_instances(tmp_path: Path) -> None:
+    store = EmbeddingStore(tmp_path / "embeddings.sqlite")
+    CachedEmbedder(CountingEmbedder(), namespace="openai:test", store=store)(
+        ["alpha"],
+    )
+
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(inner, namespace="openai:test", store=store)
+    result = embedder(["alpha"])
+
+    assert inner.calls == 0
+    assert result.data[0].embedding == pytest.approx([5.0, 1.0])
+
+
+@pytest.mark.unit
+def test_namespace_isolates_models(tmp_path: Path) -> None:
+    inner = CountingEmbedder()
+    store = EmbeddingStore(tmp_path / "embeddings.sqlite")
+    CachedEmbedder(inner, namespace="openai:small", store=store)("query")
+    CachedEmbedder(inner, namespace="openai:large", store=store)("query")
+
+    assert inner.calls == 2
+
+
+@pytest.mark.unit
+def test_store_keeps_only_the_newest_vectors(tmp_path: Path) -> None:
+    store = EmbeddingStore(tmp_path / "embeddings.sqlite", max_entries=2)
+
+    store.put_many([(b"a", [1.0]), (b"b", [2.0])])
+    store.put_many([(b"c", [3.0])])
+
+    assert store.get(b"a") is None
+    assert store.get(b"b") == [2.0]
+    assert store.get(b"c") == [3.0]
+
+
+@pytest.mark.unit
+def test_persistence_is_opt_in(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("DEEPWIKI_EMBEDDING_CACHE", raising=False)
+
+    assert get_embedding_store() is None
@@ -0,0 +1,71 @@
+"""Tests for repository snapshots used to detect changes between wiki builds."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from deepwiki_cli.application.repository import change_detection
+from deepwiki_cli.application.repository.change_detection import (
+    build_snapshot_from_local,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.unit
+def test_snapshot_reuses_hashes_of_unchanged_files(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    stable = tmp_path / "stable.py"
+    edited = tmp_path / "edited.py"
+    stable.write_text("print('stable')")
+    edited.write_text("print('before')")
+    for path in (stable, edited):
+        os.utime(path, (1_000_000.0, 1_000_000.0))
+    files = [str(stable), str(edited)]
+    previous = build_snapshot_from_local(str(tmp_path), files)
+
+    edited.write_text("print('after!')")
+    os.utime(edited, (1_000_000.0, 1_000_000.0))
+    hashed = []
+    real_hash_file = change_detection._hash_file
+
+    def tracking_hash_file(path: Path) -> str | None:
+        hashed.append(path.name)
+        return real_hash_file(path)
+
+    monkeypatch.setattr(change_detection, "_hash_file", tracking_hash_file)
+    current = build_snapshot_from_local(str(tmp_path), files, previous=previous)
+
+    # Same size and mtime: the edit is only caught once the mtime changes
+    assert hashed == []
+    assert current.files["edited.py"].hash == previous.files["edited.py"].hash
+
+    os.utime(edited, (1_000_050.0, 1_000_050.0))
+    current = build_snapshot_from_local(str(tmp_path), files, previous=previous)
+
+    assert hashed == ["edited.py"]
+    assert current.files["edited.py"].hash != previous.files["edited.py"].hash
+    assert current.files["stable.py"].hash == previous.files["stable.py"].hash
+
+
+@pytest.mark.unit
+def test_snapshot_rehashes_files_modified_near_previous_capture(
+    tmp_path: Path,
+) -> None:
+    source = tmp_path / "recent.py"
+    source.write_text("x = 1")
+    files = [str(source)]
+    previous = build_snapshot_from_local(str(tmp_path), files)
+
+    source.write_text("x = 2")
+    mtime = previous.files["recent.py"].modified_at
+    os.utime(source, (mtime, mtime))
+    current = build_snapshot_from_local(str(tmp_path), files, previous=previous)
+
+    assert current.files["recent.py"].hash != previous.files["recent.py"].hash
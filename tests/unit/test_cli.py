@@ -8,6 +8,7 @@ from unittest.mock import patch
 # Import click and ensure it's fully loaded before any deepwiki_cli imports
 # This prevents import conflicts when running tests in parallel with pytest-xdist
 import click
+import pytest
 
 with contextlib.suppress(ImportError):
     import click._textwrap  # Some click versions may not have this module
@@ -101,6 +102,40 @@ class TestListWikisCommand:
                 assert "Cached Wikis" in result.output
                 assert "owner/repo" in result.output or "repo" in result.output
 
+    def test_list_wikis_reuses_index_for_unchanged_caches(self) -> None:
+        """Test that a second listing reads page counts from the list index."""
+        from deepwiki_cli.infrastructure.formats.json_compact import read_json_file
+
+        runner = CliRunner()
+        with runner.isolated_filesystem() as temp_dir:
+            cache_dir = Path(temp_dir) / ".deepwiki" / "cache"
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file = cache_dir / "deepwiki_cache_github_owner_repo_en_1.json"
+            cache_file.write_text(
+                json.dumps(
+                    {
+                        "wiki_structure": {"pages": [{"id": "p1"}, {"id": "p2"}]},
+                        "comprehensive": False,
+                    },
+                ),
+            )
+
+            with patch(
+                "deepwiki_cli.cli.commands.list_wikis.get_cache_path",
+                return_value=cache_dir,
+            ):
+                first = runner.invoke(get_cli(), ["list"])
+                with patch(
+                    "deepwiki_cli.cli.commands.list_wikis.read_json_file",
+                    wraps=read_json_file,
+                ) as mock_read:
+                    second = runner.invoke(get_cli(), ["list"])
+
+            assert first.exit_code == second.exit_code == 0
+            assert "Pages: 2" in second.output
+            assert "Wiki Type: concise" in second.output
+            mock_read.assert_called_once_with(cache_dir / ".list_index.json")
+
 
 class TestConfigCommand:
     """Test config command group."""
@@ -259,6 +294,30 @@ class TestExportCommand:
                         # May require input, so check exit code is reasonable
                         assert result.exit_code in (0, 1, 2)
 
+    def test_export_pages_keep_requested_order(self) -> None:
+        """Test --pages selection order, de-duplication and title matching."""
+        from deepwiki_cli.cli.commands.export import _filter_pages
+        from deepwiki_cli.domain.models import WikiPage
+
+        pages = [
+            WikiPage(
+                id=page_id,
+                title=title,
+                content="",
+                filePaths=[],
+                importance="high",
+                relatedPages=[],
+            )
+            for page_id, title in (("intro", "Introduction"), ("api", "API"))
+        ]
+
+        selected = _filter_pages(pages, "api, introduction, intro")
+
+        assert [page.id for page in selected] == ["api", "intro"]
+        assert _filter_pages(pages, "intro,ALL") == pages
+        with pytest.raises(click.BadParameter):
+            _filter_pages(pages, "missing")
+
 
 class TestDeleteCommand:
     """Test delete command."""
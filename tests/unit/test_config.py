@@ -146,6 +146,22 @@ class TestLoadConfig:
         result = config.load_config()
         assert result == config.DEFAULT_CONFIG.copy()
 
+    def test_load_config_reuses_unchanged_file(self, tmp_path: Path) -> None:
+        """Test that an unchanged file is parsed once and copies are returned."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"wiki_workspace": "custom/wiki"}')
+
+        with (
+            patch.object(config, "CONFIG_FILE", config_file),
+            patch.object(config.json, "load", wraps=json.load) as mock_load,
+        ):
+            first = config.load_config()
+            first["wiki_workspace"] = "changed"
+            second = config.load_config()
+
+        assert second["wiki_workspace"] == "custom/wiki"
+        mock_load.assert_called_once()
+
 
 @pytest.mark.unit
 class TestSaveConfig:
@@ -167,7 +183,7 @@ class TestSaveConfig:
         # Verify ensure_config_dir was called
         mock_ensure_dir.assert_called_once()
         # Verify file was opened for writing
-        mock_file.assert_called_once_with(mock_config_file, "w")
+        mock_file.assert_called_once_with(mock_config_file, "w", encoding="utf-8")
         # Verify data was written
         handle = mock_file()
         assert handle.write.called
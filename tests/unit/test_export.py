@@ -4,6 +4,7 @@
 Tests export functions for generating markdown and JSON exports.
 """
 
+import io
 import json
 import sys
 from datetime import datetime
@@ -18,6 +19,7 @@ sys.path.insert(0, str(project_root))
 from deepwiki_cli.application.export.export import (
     generate_json_export,
     generate_markdown_export,
+    write_json_export,
 )
 from deepwiki_cli.domain.models import WikiPage
 
@@ -312,3 +314,24 @@ class TestGenerateJsonExport:
         assert page_data["filePaths"] == ["file1.py", "file2.py"]
         assert page_data["importance"] == "high"
         assert page_data["relatedPages"] == ["page2", "page3"]
+
+    def test_write_json_export_streams_utf8_bytes(self) -> None:
+        """Test writing JSON export to a binary stream."""
+        pages = [
+            WikiPage(
+                id="page1",
+                title="Überblick",
+                content="Content 1",
+                filePaths=["file1.py"],
+                importance="high",
+                relatedPages=[],
+            ),
+        ]
+        output = io.BytesIO()
+
+        written = write_json_export("https://github.com/owner/repo", pages, output)
+
+        assert written == len(output.getvalue())
+        data = json.loads(output.getvalue().decode("utf-8"))
+        assert data["metadata"]["page_count"] == 1
+        assert data["pages"][0]["title"] == "Überblick"
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from deepwiki_cli.domain.schemas import WikiStructurePageSchema, WikiStructureSchema
 from deepwiki_cli.infrastructure.formats import (
     FormatConverter,
     FormatPreference,
     ToonAdapter,
+    read_json_file,
     to_compact_json,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 def test_to_compact_json_minifies_payload() -> None:
     """Whitespace should be removed from compact JSON."""
@@ -18,6 +24,22 @@ def test_to_compact_json_minifies_payload() -> None:
     assert compact == '{"a":1,"nested":{"b":2}}'
 
 
+def test_to_compact_json_handles_keys_orjson_rejects() -> None:
+    """Sorted output and non-string keys match the standard library encoder."""
+    assert to_compact_json({"b": "é", "a": [1]}, sort_keys=True) == (
+        '{"a":[1],"b":"é"}'
+    )
+    assert to_compact_json({1: "one"}) == '{"1":"one"}'
+
+
+def test_read_json_file_parses_utf8_bytes(tmp_path: Path) -> None:
+    """Files are parsed from raw bytes, including non-ASCII content."""
+    cache_file = tmp_path / "cache.json"
+    cache_file.write_text('{"title": "Überblick", "pages": [1, 2]}', encoding="utf-8")
+
+    assert read_json_file(cache_file) == {"title": "Überblick", "pages": [1, 2]}
+
+
 def test_format_converter_serialize_deserialize_roundtrip() -> None:
     """FormatConverter should round-trip structured payloads."""
     converter = FormatConverter(toon_adapter=None)
@@ -0,0 +1,503 @@
+"""Tests for streaming helpers in the wiki content generator."""
+
+from __future__ import annotations
+
+import asyncio
+import typing
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from deepwiki_cli.application.wiki import generate_content
+from deepwiki_cli.application.wiki.generate_content import (
+    _async_to_sync_generator,
+    _batch_async_stream,
+    _RetrievedContext,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from pathlib import Path
+
+
+@pytest.mark.unit
+class TestAsyncToSyncGenerator:
+    """Behaviour of the sync bridge over async generators."""
+
+    def test_yields_items_in_order(self) -> None:
+        async def stream() -> AsyncGenerator[str]:
+            for chunk in ("a", "b", "c"):
+                await asyncio.sleep(0)
+                yield chunk
+
+        assert list(_async_to_sync_generator(stream())) == ["a", "b", "c"]
+
+    def test_propagates_errors(self) -> None:
+        async def stream() -> AsyncGenerator[str]:
+            yield "partial"
+            raise RuntimeError("stream failed")
+
+        gen = _async_to_sync_generator(stream())
+        assert next(gen) == "partial"
+        with pytest.raises(RuntimeError, match="stream failed"):
+            next(gen)
+
+    def test_early_close_runs_async_cleanup(self) -> None:
+        closed = []
+
+        async def stream() -> AsyncGenerator[str]:
+            try:
+                while True:
+                    yield "chunk"
+            finally:
+                closed.append(True)
+
+        gen = _async_to_sync_generator(stream())
+        assert next(gen) == "chunk"
+        gen.close()
+
+        assert closed == [True]
+
+
+@pytest.mark.unit
+class TestBatchAsyncStream:
+    """Coalescing of streamed chunks."""
+
+    @staticmethod
+    def _collect(gen: AsyncGenerator[str]) -> list[str]:
+        async def run() -> list[str]:
+            return [chunk async for chunk in gen]
+
+        return asyncio.run(run())
+
+    def test_joins_chunks_up_to_batch_size(self) -> None:
+        async def stream() -> AsyncGenerator[str]:
+            for chunk in "abcde":
+                yield chunk
+
+        batches = self._collect(_batch_async_stream(stream(), max_batch=2))
+
+        assert batches == ["ab", "cd", "e"]
+
+    def test_flushes_when_stream_stalls(self) -> None:
+        async def stream() -> AsyncGenerator[str]:
+            yield "a"
+            await asyncio.sleep(0.2)
+            yield "b"
+
+        batches = self._collect(
+            _batch_async_stream(stream(), max_batch=50, flush_ms=10),
+        )
+
+        assert batches == ["a", "b"]
+
+    def test_flushes_when_size_cap_is_reached(self) -> None:
+        async def stream() -> AsyncGenerator[str]:
+            for chunk in ("aaa", "bbb", "c"):
+                yield chunk
+
+        batches = self._collect(
+            _batch_async_stream(stream(), max_batch=50, max_chars=4),
+        )
+
+        assert batches == ["aaabbb", "c"]
+
+    def test_steady_trickle_is_flushed_by_deadline(self) -> None:
+        async def stream() -> AsyncGenerator[str]:
+            for _ in range(10):
+                await asyncio.sleep(0.01)
+                yield "x"
+
+        batches = self._collect(
+            _batch_async_stream(stream(), max_batch=50, flush_ms=25),
+        )
+
+        assert "".join(batches) == "x" * 10
+        assert len(batches) > 1
+
+    def test_think_tags_are_stripped(self) -> None:
+        async def stream() -> AsyncGenerator[str]:
+            for chunk in ("<think>", "</think>", "Answer <b>", "text"):
+                yield chunk
+
+        assert self._collect(_batch_async_stream(stream(), max_batch=50)) == [
+            "Answer <b>text",
+        ]
+
+    def test_batch_size_of_one_passes_through(self) -> None:
+        async def stream() -> AsyncGenerator[str]:
+            for chunk in "abc":
+                yield chunk
+
+        assert self._collect(_batch_async_stream(stream(), max_batch=1)) == [
+            "a",
+            "b",
+            "c",
+        ]
+
+
+@pytest.mark.unit
+def test_model_kwargs_are_memoized_and_read_only(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = []
+
+    def fake_get_model_config(provider: str, model: str | None) -> dict:
+        calls.append((provider, model))
+        return {"model_client": object, "model_kwargs": {"model": model}}
+
+    monkeypatch.setattr(
+        generate_content,
+        "get_model_config",
+        fake_get_model_config,
+    )
+    generate_content._cached_model_kwargs.cache_clear()
+
+    first = generate_content._cached_model_kwargs("google", "gemini-test")
+    second = generate_content._cached_model_kwargs("google", "gemini-test")
+
+    assert calls == [("google", "gemini-test")]
+    assert second["model"] == "gemini-test"
+    with pytest.raises(TypeError):
+        first["model"] = "other"  # type: ignore[index]
+    generate_content._cached_model_kwargs.cache_clear()
+
+
+@pytest.mark.unit
+def test_google_models_are_shared_per_configuration(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(generate_content.genai, "GenerativeModel", SimpleNamespace)
+    generate_content._get_google_model.cache_clear()
+
+    first = generate_content._get_google_model("gemini", 0.7, 0.8, 40)
+
+    assert generate_content._get_google_model("gemini", 0.7, 0.8, 40) is first
+    assert generate_content._get_google_model("gemini", 0.2, 0.8, 40) is not first
+    generate_content._get_google_model.cache_clear()
+
+
+@pytest.mark.unit
+class TestRetrievalCache:
+    """Exact-match reuse of retrieval results across pages."""
+
+    SCOPE = ("openai", "openai:{}", (), (), (), ())
+
+    def setup_method(self) -> None:
+        generate_content.clear_retrieval_cache()
+
+    def test_hit_within_ttl(self) -> None:
+        retrieval = _RetrievedContext(documents=(("a.py", "print('a')"),))
+        generate_content._store_retrieval(
+            "repo",
+            self.SCOPE,
+            "Contexts related to a.py",
+            retrieval,
+        )
+
+        assert (
+            generate_content._get_cached_retrieval(
+                "repo",
+                self.SCOPE,
+                "Contexts related to a.py",
+            )
+            is retrieval
+        )
+
+    def test_expired_entries_are_dropped(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        generate_content._store_retrieval(
+            "repo",
+            self.SCOPE,
+            "query",
+            _RetrievedContext(()),
+        )
+        monkeypatch.setattr(generate_content, "RETRIEVAL_CACHE_TTL", -1.0)
+
+        assert (
+            generate_content._get_cached_retrieval("repo", self.SCOPE, "query") is None
+        )
+
+    def test_clear_is_scoped_to_repository(self) -> None:
+        retrieval_b = _RetrievedContext(documents=(("b.py", "b"),))
+        generate_content._store_retrieval(
+            "repo-a",
+            self.SCOPE,
+            "query",
+            _RetrievedContext(()),
+        )
+        generate_content._store_retrieval("repo-b", self.SCOPE, "query", retrieval_b)
+
+        generate_content.clear_retrieval_cache("repo-a")
+
+        assert (
+            generate_content._get_cached_retrieval("repo-a", self.SCOPE, "query")
+            is None
+        )
+        assert (
+            generate_content._get_cached_retrieval("repo-b", self.SCOPE, "query")
+            is retrieval_b
+        )
+
+    def test_filters_and_embedder_are_part_of_the_key(self) -> None:
+        rag = SimpleNamespace(query_embedder=SimpleNamespace(namespace="openai:{}"))
+        scope = generate_content._retrieval_scope(
+            rag,
+            "openai",
+            excluded_dirs=["tests", "docs"],
+            excluded_files=None,
+            included_dirs=None,
+            included_files=None,
+        )
+        generate_content._store_retrieval(
+            "repo",
+            scope,
+            "query",
+            _RetrievedContext(documents=(("a.py", "a"),)),
+        )
+
+        reordered = generate_content._retrieval_scope(
+            rag,
+            "openai",
+            excluded_dirs=["docs", "tests"],
+            excluded_files=None,
+            included_dirs=None,
+            included_files=None,
+        )
+        other_filters = generate_content._retrieval_scope(
+            rag,
+            "openai",
+            excluded_dirs=None,
+            excluded_files=None,
+            included_dirs=["tests", "docs"],
+            included_files=None,
+        )
+        other_embedder = generate_content._retrieval_scope(
+            SimpleNamespace(query_embedder=SimpleNamespace(namespace="lmstudio:{}")),
+            "openai",
+            excluded_dirs=["tests", "docs"],
+            excluded_files=None,
+            included_dirs=None,
+            included_files=None,
+        )
+
+        assert generate_content._get_cached_retrieval("repo", reordered, "query")
+        assert (
+            generate_content._get_cached_retrieval("repo", other_filters, "query")
+            is None
+        )
+        assert (
+            generate_content._get_cached_retrieval("repo", other_embedder, "query")
+            is None
+        )
+
+
+@pytest.mark.unit
+def test_file_content_is_fetched_once_per_token(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = []
+
+    def fake_get_file_content(*args: object) -> str:
+        calls.append(args)
+        return "content"
+
+    monkeypatch.setattr(generate_content, "get_file_content", fake_get_file_content)
+    monkeypatch.setattr(generate_content, "_file_content_cache", OrderedDict())
+    monkeypatch.setattr(generate_content, "FILE_CONTENT_CACHE_TTL", 300.0)
+
+    for _ in range(2):
+        assert (
+            generate_content._get_file_content_cached("repo", "a.py", None, "secret")
+            == "content"
+        )
+    generate_content._get_file_content_cached("repo", "a.py", None, "other")
+
+    assert len(calls) == 2
+    assert all("secret" not in key for key in generate_content._file_content_cache)
+
+
+@pytest.mark.unit
+def test_file_content_cache_is_off_by_default(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = []
+
+    def fake_get_file_content(*args: object) -> str:
+        calls.append(args)
+        return f"content {len(calls)}"
+
+    monkeypatch.setattr(generate_content, "get_file_content", fake_get_file_content)
+    monkeypatch.setattr(generate_content, "_file_content_cache", OrderedDict())
+    monkeypatch.setattr(generate_content, "FILE_CONTENT_CACHE_TTL", 0.0)
+
+    first = generate_content._get_file_content_cached("repo", "a.py", None, None)
+    second = generate_content._get_file_content_cached("repo", "a.py", None, None)
+
+    assert (first, second) == ("content 1", "content 2")
+    assert not generate_content._file_content_cache
+
+
+@pytest.mark.unit
+def test_retrieved_context_annotations_resolve() -> None:
+    hints = typing.get_type_hints(_RetrievedContext.from_rag_output)
+
+    assert hints["return"] is _RetrievedContext
+
+
+@pytest.mark.unit
+def test_retrieved_context_keeps_only_path_and_text() -> None:
+    class Doc:
+        def __init__(self, path: str, text: str) -> None:
+            self.meta_data = {"file_path": path}
+            self.text = text
+            self.vector = [0.1] * 256
+
+    output = SimpleNamespace(
+        documents=[Doc("a.py", "alpha"), Doc("b.py", "beta")],
+        context_json='{"query": "q"}',
+    )
+
+    retrieval = _RetrievedContext.from_rag_output(output)
+
+    assert retrieval.documents == (("a.py", "alpha"), ("b.py", "beta"))
+    assert retrieval.context_json == '{"query": "q"}'
+
+
+@pytest.mark.unit
+def test_retrieved_context_normalizes_chunk_whitespace() -> None:
+    doc = SimpleNamespace(
+        meta_data={"file_path": "a.py"},
+        text="\ufeffdef f():  \r\n    return 1\n\n  \n\t\nx",
+    )
+
+    retrieval = _RetrievedContext.from_rag_output(SimpleNamespace(documents=[doc]))
+
+    assert retrieval.documents == (("a.py", "def f():\n    return 1\n\nx"),)
+
+
+@pytest.mark.unit
+def test_context_markdown_groups_files_in_path_order() -> None:
+    documents = (("b.py", "b1"), ("a.py", "a1"), ("b.py", "b2"))
+
+    rendered = generate_content._render_context_markdown(documents)
+
+    assert rendered == (
+        "## File Path: a.py\n\na1\n\n----------\n\n## File Path: b.py\n\nb1\n\nb2"
+    )
+    assert generate_content._render_context_markdown(documents) is rendered
+
+
+@pytest.mark.unit
+def test_response_cache_key_distinguishes_schema_and_model() -> None:
+    key = generate_content._response_cache_key("google", "gemini", None, "prompt")
+
+    assert key == generate_content._response_cache_key(
+        "google",
+        "gemini",
+        None,
+        "prompt",
+    )
+    assert key != generate_content._response_cache_key(
+        "google",
+        "gemini-pro",
+        None,
+        "prompt",
+    )
+    assert key != generate_content._response_cache_key(
+        "google",
+        "gemini",
+        _RetrievedContext,  # type: ignore[arg-type]
+        "prompt",
+    )
+
+
+@pytest.mark.unit
+def test_response_cache_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(generate_content, "_RESPONSE_CACHE_SIZE", 2)
+    monkeypatch.setattr(generate_content, "_response_cache", OrderedDict())
+    monkeypatch.setattr(generate_content, "RESPONSE_CACHE_TTL", 0.0)
+
+    generate_content._store_response("a", "A")
+    generate_content._store_response("b", "B")
+    assert generate_content._get_cached_response("a") == "A"
+    generate_content._store_response("c", "C")
+
+    assert generate_content._get_cached_response("b") is None
+    assert generate_content._get_cached_response("a") == "A"
+
+
+@pytest.mark.unit
+def test_response_cache_persists_across_runs(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setattr(
+        generate_content,
+        "get_adalflow_default_root_path",
+        lambda: str(tmp_path),
+    )
+    monkeypatch.setattr(generate_content, "_response_cache", OrderedDict())
+    generate_content._store_response("key", "answer")
+    monkeypatch.setattr(generate_content, "_response_cache", OrderedDict())
+
+    assert generate_content._get_cached_response("key") == "answer"
+    assert (tmp_path / "llm_responses" / "ke" / "key.json").exists()
+
+    monkeypatch.setattr(generate_content, "_response_cache", OrderedDict())
+    monkeypatch.setattr(generate_content, "RESPONSE_CACHE_TTL", -1.0)
+    assert generate_content._get_cached_response("key") is None
+
+
+@pytest.mark.unit
+def test_discarded_response_is_removed_from_disk(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setattr(
+        generate_content,
+        "get_adalflow_default_root_path",
+        lambda: str(tmp_path),
+    )
+    monkeypatch.setattr(generate_content, "_response_cache", OrderedDict())
+    generate_content._store_response("key", "not json")
+
+    generate_content._discard_response("key")
+
+    assert generate_content._get_cached_response("key") is None
+    assert not (tmp_path / "llm_responses" / "ke" / "key.json").exists()
+
+
+@pytest.mark.unit
+def test_semantic_response_cache_skips_structured_prompts(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(generate_content, "SEMANTIC_RESPONSE_CACHE_ENABLED", True)
+
+    assert generate_content._semantic_cache_applies("What does a.py do?", None)
+    assert not generate_content._semantic_cache_applies(
+        "Generate the page as JSON...",
+        _RetrievedContext,  # type: ignore[arg-type]
+    )
+    assert not generate_content._semantic_cache_applies("", None)
+
+
+@pytest.mark.unit
+def test_semantic_response_cache_is_scoped(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(generate_content, "_semantic_response_caches", {})
+    page_scope = ("google", "gemini", "", "repo", "a.py", "")
+
+    generate_content._semantic_response_cache(page_scope).put([1.0, 0.0], "answer")
+
+    assert (
+        generate_content._semantic_response_cache(page_scope).get([0.99, 0.01])
+        == "answer"
+    )
+    other_file = ("google", "gemini", "", "repo", "b.py", "")
+    assert generate_content._semantic_response_cache(other_file).get([1.0, 0.0]) is None
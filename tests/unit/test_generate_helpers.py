@@ -1,6 +1,24 @@
 """Tests for helper utilities in the generate CLI command."""
 
-from deepwiki_cli.cli.commands.generate import _has_repo_changes
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from deepwiki_cli.cli.commands import generate
+from deepwiki_cli.cli.commands.generate import (
+    _find_json_block,
+    _has_repo_changes,
+    _parse_wiki_page_json,
+    _read_local_readme,
+    generate_pages_sync,
+)
+from deepwiki_cli.domain.models import WikiPage
 
 
 def test_has_repo_changes_true_when_any_lists_populated() -> None:
@@ -26,3 +44,242 @@ def test_has_repo_changes_false_when_all_buckets_empty() -> None:
 def test_has_repo_changes_default_true_for_missing_summary() -> None:
     """Fallback to True when summary info is unavailable."""
     assert _has_repo_changes(None)
+
+
+def test_find_json_block_handles_fences_and_prose() -> None:
+    """The outermost JSON object is extracted; plain JSON is returned as is."""
+    payload = '{"title": "Demo", "pages": [{"id": "a"}]}'
+
+    assert _find_json_block(payload) is payload
+    assert _find_json_block(f"```json\n{payload}\n```") == payload
+    assert _find_json_block(f"Here you go:\n{payload}\nDone.") == payload
+    assert _find_json_block("no json here }{") is None
+
+
+def test_parse_wiki_page_json_repairs_only_malformed_json() -> None:
+    """Unescaped quotes in content are repaired; schema errors fail directly."""
+    payload = (
+        '{\n"metadata": {"summary": "Overview"},\n"page_id": "intro",\n'
+        '"title": "Intro",\n"importance": "high",\n"content": "Say "hi" here"\n}'
+    )
+
+    assert _parse_wiki_page_json(payload).content == 'Say "hi" here'
+    with pytest.raises(generate.WikiPageParseError):
+        _parse_wiki_page_json(payload.replace('"high"', '"urgent"'))
+
+
+def test_generate_pages_sync_overlaps_pages_and_keeps_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Pages run concurrently; failures are dropped and order is preserved."""
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def fake_generate(
+        page: SimpleNamespace,
+        *_args: object,
+        extra_feedback: str | None = None,
+    ) -> SimpleNamespace | None:
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return None if page.id == "b" else page
+
+    monkeypatch.setattr(generate, "generate_page_content_sync", fake_generate)
+    monkeypatch.setattr(generate, "PAGE_GENERATION_CONCURRENCY", 4)
+    pages = [SimpleNamespace(id=page_id) for page_id in "abcd"]
+
+    result = generate_pages_sync(pages, None, "repo", None)
+
+    assert [page.id for page in result] == ["a", "c", "d"]
+    assert max_in_flight > 1
+
+
+class _RecordingProgress:
+    """Thread-safe stand-in for ``ProgressManager`` tracking open page bars."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.open_pages: set[str] = set()
+        self.completed: list[str] = []
+
+    def add_page_progress(self, page_id: str, _page_title: str) -> None:
+        with self._lock:
+            self.open_pages.add(page_id)
+
+    def update_page_progress(self, page_id: str, _progress: int) -> None:
+        pass
+
+    def complete_page(self, page_id: str) -> None:
+        with self._lock:
+            self.open_pages.discard(page_id)
+            self.completed.append(page_id)
+
+
+def test_generate_pages_sync_runs_real_pages_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Pages stream at the same time and every page bar is closed, even on error."""
+    both_streaming = threading.Barrier(2, timeout=5)
+
+    class ConcurrentContext:
+        def stream_completion(
+            self,
+            messages: list[dict[str, str]],
+            **_kwargs: object,
+        ) -> Iterator[str]:
+            # Both pages must be in flight before either can finish
+            both_streaming.wait()
+            if "Broken" in messages[0]["content"]:
+                raise RuntimeError("provider failed")
+            yield json.dumps(
+                {
+                    "metadata": {"summary": "Overview"},
+                    "page_id": "intro",
+                    "title": "Intro",
+                    "importance": "high",
+                    "content": "Generated",
+                },
+            )
+
+    monkeypatch.setattr(generate, "PAGE_GENERATION_CONCURRENCY", 2)
+    pages = [
+        WikiPage(
+            id=page_id,
+            title=title,
+            content="",
+            filePaths=["README.md"],
+            importance="high",
+            relatedPages=[],
+        )
+        for page_id, title in (("intro", "Intro"), ("broken", "Broken"))
+    ]
+    progress = _RecordingProgress()
+
+    result = generate_pages_sync(pages, ConcurrentContext(), "repo", progress)
+
+    assert [page.id for page in result] == ["intro"]
+    assert result[0].content == "Generated"
+    assert sorted(progress.completed) == ["broken", "intro"]
+    assert not progress.open_pages
+
+
+def test_page_generation_is_sequential_by_default() -> None:
+    """Concurrent page generation is opt-in via DEEPWIKI_PAGE_CONCURRENCY."""
+    if "DEEPWIKI_PAGE_CONCURRENCY" in os.environ:
+        pytest.skip("DEEPWIKI_PAGE_CONCURRENCY is set")
+    assert generate.PAGE_GENERATION_CONCURRENCY == 1
+
+
+def test_structured_wiki_schema_is_served_from_response_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Identical structure requests reuse the cached structured response."""
+    from collections import OrderedDict
+
+    from deepwiki_cli.application.wiki import generate_content
+    from deepwiki_cli.domain.schemas import (
+        WikiStructurePageSchema,
+        WikiStructureSchema,
+    )
+
+    schema = WikiStructureSchema(
+        title="Demo",
+        description="Sample wiki",
+        pages=[
+            WikiStructurePageSchema(
+                page_id="p1",
+                title="Intro",
+                summary="Summary",
+                importance="medium",
+                relevant_files=["README.md"],
+                related_page_ids=[],
+                diagram_suggestions=[],
+            ),
+        ],
+    )
+    calls = []
+
+    def call_structured(**kwargs: object) -> WikiStructureSchema:
+        calls.append(kwargs)
+        return schema
+
+    client = SimpleNamespace(call_structured=call_structured)
+    monkeypatch.setattr(
+        generate,
+        "_structured_client_for",
+        lambda *_: (client, {"model_kwargs": {}}),
+    )
+    monkeypatch.setattr(generate_content, "RESPONSE_CACHE_ENABLED", True)
+    monkeypatch.setattr(generate_content, "RESPONSE_CACHE_TTL", 0.0)
+    monkeypatch.setattr(generate_content, "_response_cache", OrderedDict())
+    messages = [{"role": "user", "content": "structure prompt"}]
+
+    first = generate._call_structured_wiki_schema("google", "gemini", messages)
+    second = generate._call_structured_wiki_schema("google", "gemini", messages)
+
+    assert len(calls) == 1
+    assert first == second == schema
+
+
+def test_structured_client_is_shared_per_model(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Retries reuse one structured client and a read-only configuration."""
+
+    class FakeClient:
+        def call_structured(self, **kwargs: object) -> None:
+            return None
+
+    monkeypatch.setattr(
+        generate,
+        "get_model_config",
+        lambda *_: {"model_client": "FakeClient", "model_kwargs": {}},
+    )
+    monkeypatch.setattr(
+        generate,
+        "get_client_classes",
+        lambda: {"FakeClient": FakeClient},
+    )
+    generate._structured_client_for.cache_clear()
+
+    client, model_config = generate._structured_client_for("openai", "gpt")
+
+    assert isinstance(client, FakeClient)
+    assert generate._structured_client_for("openai", "gpt")[0] is client
+    assert generate._structured_client_for("openai", "other")[0] is not client
+    with pytest.raises(TypeError):
+        model_config["model_kwargs"]["model"] = "other"  # type: ignore[index]
+    generate._structured_client_for.cache_clear()
+
+
+def test_read_local_readme_prefers_exact_names(tmp_path: Path) -> None:
+    """Exact README names win over other spellings of the file name."""
+    (tmp_path / "Readme.md").write_text("mixed case")
+    (tmp_path / "README.txt").write_text("plain text")
+    (tmp_path / "docs").mkdir()
+
+    assert _read_local_readme(str(tmp_path)) == "plain text"
+
+    (tmp_path / "README.md").write_text("markdown")
+    assert _read_local_readme(str(tmp_path)) == "markdown"
+
+
+def test_read_local_readme_accepts_other_spellings(tmp_path: Path) -> None:
+    """A README in any letter case is found, Markdown before plain text."""
+    (tmp_path / "readme.TXT").write_text("plain text")
+    assert _read_local_readme(str(tmp_path)) == "plain text"
+
+    (tmp_path / "Readme.md").write_text("mixed case")
+    assert _read_local_readme(str(tmp_path)) == "mixed case"
+
+
+def test_read_local_readme_missing(tmp_path: Path) -> None:
+    """A repository without a README yields an empty string."""
+    assert _read_local_readme(str(tmp_path)) == ""
+    assert _read_local_readme(str(tmp_path / "missing")) == ""
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pytest
 
+from deepwiki_cli.cli.commands import generate
 from deepwiki_cli.cli.commands.generate import generate_wiki_structure
 
 
@@ -13,11 +14,19 @@ class StubContext:
     def __init__(self, payloads: list[list[str]]) -> None:
         self.payloads = payloads
         self.calls = 0
+        self.kwargs: dict = {}
+        self.preparation_error: Exception | None = None
+        self.additional_context: str | None = None
+
+    def wait_until_ready(self) -> None:
+        if self.preparation_error is not None:
+            raise self.preparation_error
 
     def stream_completion(self, *args, **kwargs):  # noqa: ANN003, D401 - test stub
         index = min(self.calls, len(self.payloads) - 1)
         payload = self.payloads[index]
         self.calls += 1
+        self.kwargs = kwargs
 
         def _generator():
             for chunk in payload:
@@ -98,3 +107,47 @@ def test_generate_structure_returns_none_after_exhausting_retries(
     structure = _run_generate_structure(context)
     assert structure is None
     assert context.calls == 3
+
+
+def test_generate_structure_only_lets_parseable_responses_be_cached(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A malformed answer must not be cached and replayed on the retry."""
+    context = StubContext([["no json here"], [VALID_JSON]])
+    monkeypatch.setattr(
+        "deepwiki_cli.cli.commands.generate.time.sleep",
+        lambda *_args, **_kwargs: None,
+    )
+    _run_generate_structure(context)
+
+    validate_response = context.kwargs["validate_response"]
+    assert validate_response(VALID_JSON)
+    assert not validate_response("no json here")
+
+
+def test_generate_structure_surfaces_preparation_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Streaming providers need the retriever; a failed prepare is not retried."""
+    context = StubContext([[VALID_JSON]])
+    context.preparation_error = ValueError("No valid documents with embeddings")
+    monkeypatch.setattr(generate, "_structure_uses_retriever", lambda *_: True)
+
+    with pytest.raises(ValueError, match="No valid documents"):
+        _run_generate_structure(context)
+    assert context.calls == 0
+
+
+def test_structure_retry_delay_backs_off_only_for_provider_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Provider errors back off exponentially up to the cap; parse errors do not."""
+    monkeypatch.setattr(generate, "WIKI_STRUCTURE_RETRY_DELAY", 2.0)
+    monkeypatch.setattr(generate, "WIKI_STRUCTURE_MAX_RETRY_DELAY", 30.0)
+    monkeypatch.setattr(generate.random, "random", lambda: 0.5)
+
+    assert generate._structure_retry_delay(3, provider_error=False) == 2.0
+    assert [
+        generate._structure_retry_delay(attempt, provider_error=True)
+        for attempt in (1, 2, 3, 6)
+    ] == [2.5, 4.5, 8.5, 30.5]
@@ -76,3 +76,52 @@ def test_openrouter_client_sequential_fallback(monkeypatch: pytest.MonkeyPatch)
     assert successful_calls == [["alpha"], ["beta"]]
     assert isinstance(response, dict)
     assert len(response["data"]) == 2
+
+
+def test_cacheable_prompt_messages_marks_anthropic_prefix() -> None:
+    """Anthropic models get a cache breakpoint after the shared prefix."""
+    messages = OpenRouterClient.cacheable_prompt_messages(
+        "PREFIX<query>q</query>",
+        [len("PREFIX")],
+        "anthropic/claude-sonnet-4",
+    )
+
+    blocks = messages[0]["content"]
+    assert blocks[0] == {
+        "type": "text",
+        "text": "PREFIX",
+        "cache_control": {"type": "ephemeral"},
+    }
+    assert blocks[1] == {"type": "text", "text": "<query>q</query>"}
+
+
+def test_cacheable_prompt_messages_plain_for_other_models() -> None:
+    """Other models rely on automatic prefix caching with a plain message."""
+    messages = OpenRouterClient.cacheable_prompt_messages(
+        "PREFIX<query>q</query>",
+        [len("PREFIX")],
+        "openai/gpt-4o",
+    )
+
+    assert messages == [{"role": "user", "content": "PREFIX<query>q</query>"}]
+
+
+def test_cacheable_prompt_messages_marks_each_stable_prefix() -> None:
+    """System prompt and file content each end a cacheable block."""
+    prompt = "SYSTEM|FILE|<query>q</query>"
+    system_end = len("SYSTEM|")
+    file_end = len("SYSTEM|FILE|")
+
+    messages = OpenRouterClient.cacheable_prompt_messages(
+        prompt,
+        [system_end, file_end, file_end],
+        "anthropic/claude-sonnet-4",
+    )
+
+    blocks = messages[0]["content"]
+    assert [block["text"] for block in blocks] == [
+        "SYSTEM|",
+        "FILE|",
+        "<query>q</query>",
+    ]
+    assert [("cache_control" in block) for block in blocks] == [True, True, False]
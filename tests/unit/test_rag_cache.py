@@ -0,0 +1,90 @@
+"""Tests for the semantic RAG retrieval cache."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from deepwiki_cli.services.rag import RAG
+from deepwiki_cli.services.rag_cache import ProximityCache
+
+
+@pytest.mark.unit
+class TestProximityCache:
+    """Behaviour of the cosine-distance keyed LRU cache."""
+
+    def test_near_duplicate_query_hits(self) -> None:
+        cache = ProximityCache(capacity=4, threshold=0.05)
+        cache.put([1.0, 0.0, 0.0], "docs-a")
+
+        assert cache.get([0.99, 0.05, 0.0]) == "docs-a"
+        assert cache.hits == 1
+
+    def test_distant_query_misses(self) -> None:
+        cache = ProximityCache(capacity=4, threshold=0.05)
+        cache.put([1.0, 0.0, 0.0], "docs-a")
+
+        assert cache.get([0.0, 1.0, 0.0]) is None
+        assert cache.misses == 1
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = ProximityCache(capacity=2, threshold=0.01)
+        cache.put([1.0, 0.0, 0.0], "a")
+        cache.put([0.0, 1.0, 0.0], "b")
+        assert cache.get([1.0, 0.0, 0.0]) == "a"
+
+        cache.put([0.0, 0.0, 1.0], "c")
+
+        assert len(cache) == 2
+        assert cache.get([0.0, 1.0, 0.0]) is None
+        assert cache.get([1.0, 0.0, 0.0]) == "a"
+        assert cache.get([0.0, 0.0, 1.0]) == "c"
+
+    def test_dimension_change_resets_cache(self) -> None:
+        cache = ProximityCache(capacity=2, threshold=0.05)
+        cache.put([1.0, 0.0], "2d")
+
+        assert cache.get([1.0, 0.0, 0.0]) is None
+        cache.put([1.0, 0.0, 0.0], "3d")
+        assert len(cache) == 1
+
+    def test_unusable_embeddings_are_ignored(self) -> None:
+        cache = ProximityCache(capacity=2, threshold=0.05)
+        cache.put([0.0, 0.0], "zero")
+        cache.put(object(), "garbage")
+
+        assert len(cache) == 0
+        assert cache.get(object()) is None
+
+
+@pytest.mark.unit
+def test_pages_sharing_a_prompt_template_get_their_own_documents() -> None:
+    documents = [
+        SimpleNamespace(text="auth code", meta_data={"file_path": "auth.py"}),
+        SimpleNamespace(text="billing code", meta_data={"file_path": "billing.py"}),
+    ]
+
+    def retriever(query: str) -> list[SimpleNamespace]:
+        index = 0 if "Authentication" in query else 1
+        return [SimpleNamespace(doc_indices=[index], doc_scores=None)]
+
+    retriever.index = None  # type: ignore[attr-defined]
+    rag = RAG.__new__(RAG)
+    rag.retriever = retriever
+    rag.transformed_docs = documents
+    rag.retrieval_cache = ProximityCache()
+    rag.generator = SimpleNamespace(prompt_kwargs={})
+    # The shared page template dominates, so both prompts embed identically
+    rag.embed_query = lambda *_args, **_kwargs: [1.0, 0.0, 0.0]  # type: ignore[method-assign]
+    rag._truncate_query_by_tokens = lambda query, _limit: query  # type: ignore[method-assign]
+    rag._build_context_schema = lambda *_args: SimpleNamespace(  # type: ignore[method-assign]
+        to_compact_json=lambda: "{}",
+    )
+    template = "Generate the page as JSON matching this schema. " * 50
+
+    auth = rag.call(template + "Page: Authentication")
+    billing = rag.call(template + "Page: Billing")
+
+    assert auth[0].documents == [documents[0]]
+    assert billing[0].documents == [documents[1]]
@@ -0,0 +1,64 @@
+"""Tests for the proactive model call rate limiter."""
+
+from __future__ import annotations
+
+import pytest
+
+from deepwiki_cli.services.rate_limit import RateLimiter, get_rate_limiter
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestRateLimiter:
+    """Token bucket behaviour of the rate limiter."""
+
+    def test_requests_wait_once_bucket_is_empty(self) -> None:
+        clock = FakeClock()
+        limiter = RateLimiter(requests_per_minute=2, clock=clock)
+
+        assert limiter.try_acquire() == 0.0
+        assert limiter.try_acquire() == 0.0
+        assert limiter.try_acquire() == pytest.approx(30.0)
+
+        clock.now = 30.0
+        assert limiter.try_acquire() == 0.0
+
+    def test_token_budget_limits_large_prompts(self) -> None:
+        clock = FakeClock()
+        limiter = RateLimiter(tokens_per_minute=600, clock=clock)
+
+        assert limiter.try_acquire(500) == 0.0
+        assert limiter.try_acquire(400) == pytest.approx(30.0)
+
+    def test_penalty_slows_refill(self) -> None:
+        clock = FakeClock()
+        limiter = RateLimiter(requests_per_minute=60, clock=clock)
+        for _ in range(60):
+            limiter.try_acquire()
+
+        limiter.penalize()
+
+        assert limiter.try_acquire() == pytest.approx(1.0 / 0.8)
+
+
+@pytest.mark.unit
+def test_limiter_is_disabled_without_limits(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("DEEPWIKI_RATE_LIMIT_RPM", raising=False)
+    monkeypatch.delenv("DEEPWIKI_RATE_LIMIT_TPM", raising=False)
+    assert get_rate_limiter("google", "gemini") is None
+
+    monkeypatch.setenv("DEEPWIKI_RATE_LIMIT_RPM", "10")
+    limiter = get_rate_limiter("google", "gemini")
+
+    assert limiter is not None
+    assert get_rate_limiter("google", "gemini") is limiter
+    assert not limiter.limits_tokens
@@ -11,11 +11,12 @@ import sys
 from pathlib import Path
 from unittest.mock import MagicMock
 
-# Mock problematic imports before importing utils
-sys.modules["simple_term_menu"] = MagicMock()
-sys.modules["adalflow"] = MagicMock()
-sys.modules["adalflow.utils"] = MagicMock()
-sys.modules["click"] = MagicMock()
+# Mock problematic imports before importing utils; the originals are put
+# back afterwards because CLI subcommands import click lazily in other tests
+_MOCKED_MODULES = ("simple_term_menu", "adalflow", "adalflow.utils", "click")
+_original_modules = {name: sys.modules.get(name) for name in _MOCKED_MODULES}
+for _name in _MOCKED_MODULES:
+    sys.modules[_name] = MagicMock()
 
 # Add the parent directory to the path
 test_file_path = Path(__file__)
@@ -27,6 +28,12 @@ utils_path = project_root / "src" / "deepwiki_cli" / "cli" / "utils.py"
 spec = importlib.util.spec_from_file_location("deepwiki_cli.cli.utils", utils_path)
 utils_module = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(utils_module)
+
+for _name, _module in _original_modules.items():
+    if _module is None:
+        sys.modules.pop(_name, None)
+    else:
+        sys.modules[_name] = _module
 truncate_string = utils_module.truncate_string
 
 
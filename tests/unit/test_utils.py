@@ -10,17 +10,24 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Mock problematic imports before importing utils
-sys.modules["simple_term_menu"] = MagicMock()
-sys.modules["adalflow"] = MagicMock()
-sys.modules["adalflow.utils"] = MagicMock()
-sys.modules["click"] = MagicMock()
+# Mock problematic imports before importing utils; the originals are put
+# back afterwards because CLI subcommands import click lazily in other tests
+_MOCKED_MODULES = ("simple_term_menu", "adalflow", "adalflow.utils", "click")
+_original_modules = {name: sys.modules.get(name) for name in _MOCKED_MODULES}
+for _name in _MOCKED_MODULES:
+    sys.modules[_name] = MagicMock()
 
 # Add the parent directory to the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from deepwiki_cli.cli import utils
 
+for _name, _module in _original_modules.items():
+    if _module is None:
+        sys.modules.pop(_name, None)
+    else:
+        sys.modules[_name] = _module
+
 
 @pytest.mark.unit
 class TestValidateGithubUrl:
@@ -344,6 +351,40 @@ class TestEnsureCacheDir:
         assert cache_dir.is_dir()
 
 
+@pytest.mark.unit
+class TestGetCachedWikis:
+    """Tests for get_cached_wikis function."""
+
+    def test_lists_cache_files_sorted_by_name_and_version(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that only cache files are listed, newest version first."""
+        for name in (
+            "deepwiki_cache_github_owner_repo_en.json",
+            "deepwiki_cache_github_owner_repo_en_v2.json",
+            "deepwiki_cache_local_local_my_project_en.json",
+            "deepwiki_cache_broken.json",
+            "notes.json",
+        ):
+            (tmp_path / name).write_text("{}")
+
+        wikis = utils.get_cached_wikis(tmp_path)
+
+        assert [w["display_name"] for w in wikis] == [
+            "my_project (v1)",
+            "owner/repo (v2)",
+            "owner/repo (v1)",
+        ]
+        assert wikis[1]["path"] == (
+            tmp_path / "deepwiki_cache_github_owner_repo_en_v2.json"
+        )
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        """Test that a missing cache directory yields no wikis."""
+        assert utils.get_cached_wikis(tmp_path / "missing") == []
+
+
 @pytest.mark.unit
 class TestSelectFromList:
     """Tests for select_from_list function."""
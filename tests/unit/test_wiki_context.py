@@ -0,0 +1,73 @@
+"""Tests for background retriever preparation in WikiGenerationContext."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from deepwiki_cli.application.wiki import context as context_module
+from deepwiki_cli.application.wiki.context import WikiGenerationContext
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class StubRAG:
+    """RAG stand-in whose retriever preparation waits on an event."""
+
+    release = threading.Event()
+
+    def __init__(self, provider: str, model: str) -> None:
+        self.provider = provider
+        self.model = model
+        self.prepared = False
+
+    def prepare_retriever(self, *_args, **_kwargs) -> None:  # noqa: ANN002, ANN003
+        self.release.wait(timeout=5)
+        self.prepared = True
+
+
+class FailingRAG(StubRAG):
+    """RAG stand-in that fails while preparing the retriever."""
+
+    def prepare_retriever(self, *_args, **_kwargs) -> None:  # noqa: ANN002, ANN003
+        raise ValueError("No valid documents with embeddings found.")
+
+
+def _prepare(repo_path: Path) -> WikiGenerationContext:
+    return WikiGenerationContext.prepare(
+        repo_url=str(repo_path),
+        repo_type="local",
+        provider="google",
+        model="gemini-test",
+    )
+
+
+def test_prepare_returns_before_retriever_is_ready(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """prepare() should hand back a context while embeddings still load."""
+    StubRAG.release.clear()
+    monkeypatch.setattr(context_module, "RAG", StubRAG)
+
+    ctx = _prepare(tmp_path)
+    assert not ctx._rag_future.done()
+
+    StubRAG.release.set()
+    ctx.wait_until_ready()
+    assert ctx._rag.prepared is True
+
+
+def test_preparation_errors_surface_on_first_use(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Errors from the background worker are re-raised when the RAG is needed."""
+    monkeypatch.setattr(context_module, "RAG", FailingRAG)
+
+    ctx = _prepare(tmp_path)
+    with pytest.raises(ValueError, match="No valid documents"):
+        ctx.wait_until_ready()
@@ -52,7 +52,7 @@ def _build_structure(pages: list[WikiPage]) -> WikiStructureModel:
     )
 
 
-def test_export_and_sync_multi_layout(tmp_path: Path):
+def _export_workspace(tmp_path: Path) -> tuple[ExportManifest, Path, Path]:
     cache_file = tmp_path / "cache.json"
     pages = _build_pages()
     structure = _build_structure(pages)
@@ -90,6 +90,12 @@ def test_export_and_sync_multi_layout(tmp_path: Path):
     first_page = manifest.pages[0]
     exported_file = Path(manifest.root_dir) / first_page.relative_path
 
+    return manifest, cache_file, exported_file
+
+
+def test_export_and_sync_multi_layout(tmp_path: Path):
+    manifest, cache_file, exported_file = _export_workspace(tmp_path)
+
     original_text = exported_file.read_text(encoding="utf-8")
     assert "<!-- deepwiki-metadata:start -->" in original_text
     updated_text = original_text.replace(
@@ -114,6 +120,20 @@ def test_export_and_sync_multi_layout(tmp_path: Path):
     )
 
 
+def test_sync_writes_compact_or_indented_cache(tmp_path: Path):
+    manifest, cache_file, exported_file = _export_workspace(tmp_path)
+    exported_file.write_text(
+        exported_file.read_text(encoding="utf-8").replace("Original", "Edited"),
+        encoding="utf-8",
+    )
+
+    sync_manifest(manifest, changed_paths={exported_file})
+    assert "\n" not in cache_file.read_text(encoding="utf-8")
+
+    sync_manifest(manifest, changed_paths={exported_file}, pretty=True)
+    assert cache_file.read_text(encoding="utf-8").startswith('{\n  "')
+
+
 def test_slugify_outputs_safe_names():
     assert slugify("Hello World!") == "hello-world"
     assert slugify("***") == "page"